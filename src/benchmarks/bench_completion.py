@@ -0,0 +1,72 @@
+"""
+Benchmark for the autocompletion candidate and ranking path.
+
+Mirrors AutoCompletionService._candidates: the best prefix matches from
+NamePrefixIndex plus capped infix matches from TrigramIndex for texts of three
+or more characters, ranked by CompletionRanker. The previous path, ranking
+every substring match, is timed for comparison at 100k and 1M synthetic names.
+
+Run from the src directory:
+    python -m benchmarks.bench_completion
+"""
+
+import time
+from typing import List, Optional
+
+from benchmarks.bench_name_index import generate_names, time_call
+from utils.completion_ranker import CompletionRanker
+from utils.name_index import NamePrefixIndex
+from utils.trigram_index import TrigramIndex
+
+SIZES = [100_000, 1_000_000]
+TEXTS = ["a", "ka", "ald", "thri", "kelgar"]
+RESULT_LIMIT = 20  # COMPLETION_RESULT_LIMIT in config/system.json
+POOL_SIZE = RESULT_LIMIT * 10  # CANDIDATE_POOL_FACTOR
+MIN_INFIX_LENGTH = 3
+
+
+class EmptyUsageLog:
+    """Usage log without entries, so only match quality and degree rank."""
+
+    def names(self) -> List[str]:
+        return []
+
+    def last_visit(self, name: str) -> Optional[float]:
+        return None
+
+    def edit_count(self, name: str) -> int:
+        return 0
+
+
+def bounded(
+    prefix_index: NamePrefixIndex, trigram_index: TrigramIndex, text: str
+) -> List[str]:
+    candidates = prefix_index.prefix_matches(text, POOL_SIZE)
+    if len(text) >= MIN_INFIX_LENGTH:
+        candidates.extend(trigram_index.substring_matches(text, POOL_SIZE))
+    return candidates
+
+
+def main() -> None:
+    ranker = CompletionRanker(EmptyUsageLog())
+    print(f"{'names':>10} {'text':>8} {'full ms':>10} {'bounded ms':>11}")
+    for size in SIZES:
+        names = generate_names(size)
+        prefix_index = NamePrefixIndex(names)
+        trigram_index = TrigramIndex(names)
+        for text in TEXTS:
+            full_ms = time_call(
+                lambda: ranker.rank(
+                    text, trigram_index.substring_matches(text), RESULT_LIMIT
+                )
+            )
+            bounded_ms = time_call(
+                lambda: ranker.rank(
+                    text, bounded(prefix_index, trigram_index, text), RESULT_LIMIT
+                )
+            )
+            print(f"{size:>10} {text:>8} {full_ms:>10.1f} {bounded_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
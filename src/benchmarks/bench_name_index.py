@@ -0,0 +1,72 @@
+"""
+Benchmark for autocompletion prefix lookups.
+
+Compares the previous linear scan over a copied name set with NamePrefixIndex
+at 10k, 100k and 1M synthetic node names.
+
+Run from the src directory:
+    python -m benchmarks.bench_name_index
+"""
+
+import random
+import string
+import time
+from typing import Callable, List, Set
+
+from utils.name_index import NamePrefixIndex
+
+SIZES = [10_000, 100_000, 1_000_000]
+PREFIXES = ["a", "ar", "ald", "mor", "zq", "kel"]
+LIMIT = 200
+REPEATS = 5
+
+
+def generate_names(count: int, seed: int = 42) -> List[str]:
+    """Generate unique pseudo-fantasy names."""
+    rng = random.Random(seed)
+    syllables = ["al", "ar", "dor", "mor", "kel", "th", "ri", "en", "wyn", "gar"]
+    names: Set[str] = set()
+    while len(names) < count:
+        word = "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+        suffix = "".join(rng.choice(string.ascii_lowercase) for _ in range(3))
+        names.add(f"{word.capitalize()} {suffix}")
+    return list(names)
+
+
+def linear_scan(names: Set[str], prefix: str) -> List[str]:
+    """The previous algorithm: copy the set and slice-compare every name."""
+    cached_names = names.copy()
+    text_length = len(prefix)
+    return [n for n in cached_names if prefix.lower() in n[:text_length].lower()]
+
+
+def time_call(func: Callable[[], object]) -> float:
+    """Return the mean wall time of a call in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - start) * 1000 / REPEATS
+
+
+def main() -> None:
+    print(f"{'names':>10} {'build ms':>10} {'scan ms':>10} {'index ms':>10}")
+    for size in SIZES:
+        names = generate_names(size)
+        name_set = set(names)
+
+        start = time.perf_counter()
+        index = NamePrefixIndex(names)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        scan_ms = sum(
+            time_call(lambda p=p: linear_scan(name_set, p)) for p in PREFIXES
+        ) / len(PREFIXES)
+        index_ms = sum(
+            time_call(lambda p=p: index.prefix_matches(p, LIMIT)) for p in PREFIXES
+        ) / len(PREFIXES)
+
+        print(f"{size:>10} {build_ms:>10.1f} {scan_ms:>10.3f} {index_ms:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark for linking node names in description text.
+
+Compares the previous approach (compile one alternation regex of all names,
+longest first, and run it over the text) with NameMatcher at 1k, 10k and 100k
+names over a 50 KB description.
+
+Run from the src directory:
+    python -m benchmarks.bench_name_matcher
+"""
+
+import random
+import re
+import time
+from typing import List
+
+from benchmarks.bench_name_index import generate_names
+from utils.name_matcher import NameMatcher
+
+SIZES = [1_000, 10_000, 100_000]
+TEXT_BYTES = 50_000
+FILLER = "the of and in to a with on by at from old great north river city".split()
+
+
+def generate_text(names: List[str], seed: int = 7) -> str:
+    """Generate prose with roughly one node name every ten words."""
+    rng = random.Random(seed)
+    words: List[str] = []
+    length = 0
+    while length < TEXT_BYTES:
+        word = rng.choice(names) if rng.random() < 0.1 else rng.choice(FILLER)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def regex_scan(names: List[str], text: str) -> List[str]:
+    """The previous algorithm, including the per-scan regex compilation."""
+    sorted_names = sorted(names, key=len, reverse=True)
+    pattern = r"\b(" + "|".join(re.escape(name) for name in sorted_names) + r")\b"
+    return [match.group(0) for match in re.finditer(pattern, text)]
+
+
+def main() -> None:
+    print(f"{'names':>10} {'regex ms':>10} {'build ms':>10} {'match ms':>10} {'hits':>6}")
+    for size in SIZES:
+        names = generate_names(size)
+        text = generate_text(names)
+
+        start = time.perf_counter()
+        expected = regex_scan(names, text)
+        regex_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        matcher = NameMatcher(names)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        matches = matcher.find_all(text)
+        match_ms = (time.perf_counter() - start) * 1000
+
+        assert [name for _, _, name in matches] == expected
+        print(
+            f"{size:>10} {regex_ms:>10.1f} {build_ms:>10.1f} "
+            f"{match_ms:>10.2f} {len(matches):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark for map pin region queries.
+
+Measures PinSpatialIndex build time and the mean latency of viewport, nearest
+and polygon queries at 5k and 50k pins, against a linear shapely scan.
+
+Run from the src directory:
+    python -m benchmarks.bench_spatial_index
+"""
+
+import random
+import time
+
+import numpy as np
+import shapely
+
+from benchmarks.bench_name_index import time_call
+from utils.spatial_index import PinSpatialIndex
+
+SIZES = [5_000, 50_000]
+MAP_SIZE = 16_000
+QUERIES = 50
+
+
+def main() -> None:
+    rng = random.Random(7)
+    print(
+        f"{'pins':>8} {'build ms':>10} {'box ms':>10} {'nearest ms':>11} "
+        f"{'polygon ms':>11} {'scan ms':>10}"
+    )
+    for size in SIZES:
+        coords = np.array(
+            [(rng.uniform(0, MAP_SIZE), rng.uniform(0, MAP_SIZE)) for _ in range(size)]
+        )
+        names = [f"pin {i}" for i in range(size)]
+        geometries = shapely.points(coords)
+
+        start = time.perf_counter()
+        index = PinSpatialIndex()
+        index.rebuild(names, geometries)
+        index.query_box(0, 0, 1, 1)  # Bulk-loads the tree
+        build_ms = (time.perf_counter() - start) * 1000
+
+        boxes = []
+        for _ in range(QUERIES):
+            x, y = rng.uniform(0, MAP_SIZE - 2000), rng.uniform(0, MAP_SIZE - 1200)
+            boxes.append((x, y, x + 2000, y + 1200))
+        polygons = [
+            shapely.Polygon(
+                [(x0, y0), (x1, y0 + 300), (x1 - 400, y1), (x0 + 200, y1 - 100)]
+            )
+            for x0, y0, x1, y1 in boxes
+        ]
+
+        box_ms = sum(time_call(lambda b=b: index.query_box(*b)) for b in boxes) / QUERIES
+        nearest_ms = sum(
+            time_call(lambda b=b: index.nearest(b[0], b[1], 50)) for b in boxes
+        ) / QUERIES
+        polygon_ms = sum(
+            time_call(lambda p=p: index.within(p)) for p in polygons
+        ) / QUERIES
+        scan_ms = sum(
+            time_call(lambda p=p: np.flatnonzero(shapely.contains(p, geometries)))
+            for p in polygons
+        ) / QUERIES
+
+        print(
+            f"{size:>8} {build_ms:>10.1f} {box_ms:>10.3f} {nearest_ms:>11.3f} "
+            f"{polygon_ms:>11.3f} {scan_ms:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
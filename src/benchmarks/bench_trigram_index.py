@@ -0,0 +1,59 @@
+"""
+Benchmark for substring and fuzzy name lookups.
+
+Measures TrigramIndex build time and mean lookup latency at 10k and 100k
+synthetic node names, against a linear substring scan.
+
+Run from the src directory:
+    python -m benchmarks.bench_trigram_index
+"""
+
+import time
+from typing import List
+
+from benchmarks.bench_name_index import generate_names, time_call
+from utils.trigram_index import TrigramIndex
+
+SIZES = [10_000, 100_000]
+SUBSTRINGS = ["ald", "rwyn", "thri", "enmor", "kelgar"]
+TYPOS = ["dotkel", "kelgatth", "thtiwyn", "mprgar"]
+LIMIT = 20
+
+
+def linear_scan(names: List[str], text: str) -> List[str]:
+    """Case-insensitive substring scan over every name."""
+    query = text.casefold()
+    return [name for name in names if query in name.casefold()][:LIMIT]
+
+
+def main() -> None:
+    print(
+        f"{'names':>10} {'build ms':>10} {'scan ms':>10} "
+        f"{'substr ms':>10} {'fuzzy ms':>10}"
+    )
+    for size in SIZES:
+        names = generate_names(size)
+
+        start = time.perf_counter()
+        index = TrigramIndex(names)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        scan_ms = sum(
+            time_call(lambda t=t: linear_scan(names, t)) for t in SUBSTRINGS
+        ) / len(SUBSTRINGS)
+        substring_ms = sum(
+            time_call(lambda t=t: index.substring_matches(t, LIMIT))
+            for t in SUBSTRINGS
+        ) / len(SUBSTRINGS)
+        fuzzy_ms = sum(
+            time_call(lambda t=t: index.fuzzy_matches(t, 1, LIMIT)) for t in TYPOS
+        ) / len(TYPOS)
+
+        print(
+            f"{size:>10} {build_ms:>10.1f} {scan_ms:>10.3f} "
+            f"{substring_ms:>10.4f} {fuzzy_ms:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
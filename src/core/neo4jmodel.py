@@ -5,18 +5,42 @@ It includes methods for connecting to the database, performing CRUD operations o
 
 import datetime
 from datetime import datetime
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Iterable, Optional, List
 
 from neo4j import GraphDatabase
 from neo4j.exceptions import AuthError
 from structlog import get_logger
 
-from core.neo4jworkers import QueryWorker, WriteWorker, DeleteWorker, SuggestionWorker
+from core.neo4jworkers import (
+    QueryWorker,
+    WriteWorker,
+    DeleteWorker,
+    SuggestionWorker,
+    ExportWorker,
+    BackupWorker,
+    RestoreWorker,
+    ImportWorker,
+    VaultImportWorker,
+    MentionIndexWorker,
+)
+from models.name_cache_model import NameDelta
 from utils.converters import NamingConventionConverter as ncc
+from utils.export_manifest import export_version
+from utils.geometry_handler import GeometryHandler
+from utils.html_text import compact_html, html_to_plain_text
+from utils.markdown_vault import sync_state_path
 
 # Configure the standard logging
 logger = get_logger(__name__)
 
+# System relationship linking a node to the nodes its description mentions.
+# Relationship types starting with "_" are hidden from the relationship views.
+MENTIONS_RELATIONSHIP = "_MENTIONS"
+# Relationship from a map node to the nodes pinned on it
+MAP_PIN_RELATIONSHIP = "SHOWS"
+# Label of map nodes, which open on the map tab instead of Basic Info
+MAP_LABEL = "MAP"
+
 
 class Neo4jModel:
     """
@@ -157,6 +181,13 @@ class Neo4jModel:
         """
         Load a node and its relationships by name using a worker.
 
+        String properties longer than LAZY_FIELD_THRESHOLD_CHARS are left out
+        of all_props and listed in deferred_keys, to be fetched with
+        load_node_fields once they are shown. The description is shown as soon
+        as a node opens on Basic Info, so it is only deferred for map nodes.
+        Oversized system properties such as _description_text are never
+        needed by the UI and are dropped.
+
         Args:
             name (str): Name of the node to load.
             callback (function): Function to call with the result.
@@ -167,16 +198,61 @@ class Neo4jModel:
         query = """
             MATCH (n {name: $name})
             WITH n, labels(n) AS labels,
-                 [(n)-[r]->(m) | {end: m.name, type: type(r), dir: '>', props: properties(r)}] AS out_rels,
-                 [(n)<-[r2]-(o) | {end: o.name, type: type(r2), dir: '<', props: properties(r2)}] AS in_rels,
-                 properties(n) AS all_props
-            RETURN n,
-                   out_rels + in_rels AS relationships,
+                 [(n)-[r]->(m) WHERE NOT type(r) STARTS WITH '_' | {end: m.name, type: type(r), dir: '>', props: properties(r)}] AS out_rels,
+                 [(n)<-[r2]-(o) WHERE NOT type(r2) STARTS WITH '_' | {end: o.name, type: type(r2), dir: '<', props: properties(r2)}] AS in_rels,
+                 [key IN keys(n)
+                     WHERE n[key] IS :: STRING AND size(n[key]) > $threshold
+                       AND (key <> 'description' OR $map_label IN labels(n))] AS large_keys
+            RETURN out_rels + in_rels AS relationships,
                    labels,
-                   all_props
+                   [key IN keys(n) WHERE NOT key IN large_keys | [key, n[key]]] AS core_props,
+                   [key IN large_keys WHERE NOT key STARTS WITH '_'] AS deferred_keys
             LIMIT 1
         """
-        params = {"name": name}
+        params = {
+            "name": name,
+            "threshold": self._config.LAZY_FIELD_THRESHOLD_CHARS,
+            "map_label": MAP_LABEL,
+        }
+        worker = QueryWorker(self._uri, self._auth, query, params)
+
+        worker.query_finished.connect(
+            lambda records: callback(
+                [
+                    {
+                        "relationships": record["relationships"],
+                        "labels": record["labels"],
+                        "all_props": dict(record["core_props"]),
+                        "deferred_keys": record["deferred_keys"],
+                    }
+                    for record in records
+                ]
+            )
+        )
+        return worker
+
+    def load_node_fields(
+        self, name: str, keys: List[str], callback: Callable
+    ) -> QueryWorker:
+        """
+        Load selected properties of a node using a worker.
+
+        Fetches the large fields that load_node deferred.
+
+        Args:
+            name (str): Name of the node.
+            keys (List[str]): The property keys to fetch.
+            callback (function): Function to call with key/value records.
+
+        Returns:
+            QueryWorker: A worker that will execute the query.
+        """
+        query = """
+            MATCH (n {name: $name})
+            UNWIND $keys AS key
+            RETURN key, n[key] AS value
+        """
+        params = {"name": name, "keys": keys}
         worker = QueryWorker(self._uri, self._auth, query, params)
 
         worker.query_finished.connect(callback)
@@ -201,7 +277,7 @@ class Neo4jModel:
         return worker
 
     @staticmethod
-    def _save_node_transaction(tx: Any, node_data: Dict[str, Any]) -> None:
+    def _save_node_transaction(tx: Any, node_data: Dict[str, Any]) -> NameDelta:
         """
         Private transaction handler for save_node.
         Preserves and updates system properties (_created, _modified, _author) while replacing all others.
@@ -209,6 +285,10 @@ class Neo4jModel:
         Args:
             tx: The transaction object.
             node_data (dict): Node data including properties and relationships.
+
+        Returns:
+            NameDelta: The node names created by this save, including stub targets,
+            and the labels, tags and property keys written.
         """
         logger.debug(
             "Starting Save Node Transaction",
@@ -222,7 +302,9 @@ class Neo4jModel:
 
         # Extract data from node_data
         name = node_data["name"]
-        description = node_data["description"]
+        # Store compact HTML plus a plain-text copy for search and export
+        description = compact_html(node_data["description"])
+        description_text = html_to_plain_text(description)
         tags = node_data["tags"]
         additional_properties = node_data["additional_properties"]
         relationships = node_data["relationships"]
@@ -251,18 +333,22 @@ class Neo4jModel:
                 "created"
             ]  # Preserve existing creation time
 
+        name_delta = NameDelta(modified=system_props["_modified"])
+
         # Create a new node if it doesn't exist
         if not record:
             query_create = """
             CREATE (n {name: $name, description: $description, tags: $tags})
             """
             tx.run(query_create, name=name, description=description, tags=tags)
+            name_delta.added.append(name)
 
         # 3. Reset node with core properties and system properties
         base_props = {
             "name": name,
             "description": description,
             "tags": tags,
+            "_description_text": description_text,
             **system_props,  # Include system properties in base set
         }
 
@@ -307,21 +393,40 @@ class Neo4jModel:
                 query_props, name=name, additional_properties=filtered_additional_props
             )
 
+        name_delta.labels = list(labels)
+        name_delta.tags = list(tags or [])
+        name_delta.property_keys = list(filtered_additional_props)
+
         # 6. Handle relationships
-        # Remove existing relationships
-        query_remove_rels = "MATCH (n {name: $name})-[r]-() DELETE r"
+        # Remove existing relationships, keeping system relationships such as mentions
+        query_remove_rels = (
+            "MATCH (n {name: $name})-[r]-() WHERE NOT type(r) STARTS WITH '_' DELETE r"
+        )
         tx.run(query_remove_rels, name=name)
 
         # Create/update relationships
         for rel in relationships:
             rel_type, rel_name, direction, properties = rel
 
-            # Prepare stump node properties
+            # Keep the native pin coordinates in sync with the WKT geometry
+            if (
+                rel_type == MAP_PIN_RELATIONSHIP
+                and GeometryHandler.validate_wkt(properties.get("geometry", ""))
+            ):
+                properties = {
+                    **properties,
+                    **GeometryHandler.create_geometry_properties(
+                        properties["geometry"]
+                    ),
+                }
+
+            # Stump nodes are created by this save and share its timestamp,
+            # which the name delta carries for drift checks
             stump_props = {
                 "name": rel_name,
                 "_author": "System",
-                "_created": datetime.now().isoformat(),
-                "_modified": datetime.now().isoformat(),
+                "_created": system_props["_modified"],
+                "_modified": system_props["_modified"],
             }
 
             # First check if target exists
@@ -337,6 +442,7 @@ class Neo4jModel:
                     SET target = $stump_props
                 """
                 tx.run(create_query, stump_props=stump_props)
+                name_delta.added.append(rel_name)
 
             # Create the relationship
             if direction == ">":
@@ -360,11 +466,27 @@ class Neo4jModel:
 
             tx.run(query_rel, name=name, rel_name=rel_name, properties=properties)
 
+        # 7. Replace the mention index entries of this node
+        if "mentions" in node_data:
+            tx.run(
+                f"MATCH (n {{name: $name}})-[r:`{MENTIONS_RELATIONSHIP}`]->() DELETE r",
+                name=name,
+            )
+            query_mentions = f"""
+                MATCH (n {{name: $name}})
+                UNWIND $mentions AS mention
+                MATCH (target {{name: mention}})
+                WHERE target <> n
+                MERGE (n)-[:`{MENTIONS_RELATIONSHIP}`]->(target)
+            """
+            tx.run(query_mentions, name=name, mentions=node_data["mentions"])
+
         logger.debug(
             "Finished Save Node Transaction",
             module="Neo4jModel",
             function="_save_node_transaction",
         )
+        return name_delta
 
     def delete_node(self, name: str, callback: Callable) -> DeleteWorker:
         """
@@ -384,16 +506,21 @@ class Neo4jModel:
         return worker
 
     @staticmethod
-    def _delete_node_transaction(tx: Any, name: str) -> None:
+    def _delete_node_transaction(tx: Any, name: str) -> NameDelta:
         """
         Private transaction handler for delete_node.
 
         Args:
             tx: The transaction object.
             name (str): Name of the node to delete.
+
+        Returns:
+            NameDelta: The removed node name, if a node was deleted.
         """
-        query = "MATCH (n {name: $name}) DETACH DELETE n"
-        tx.run(query, name=name)
+        query = "MATCH (n {name: $name}) DETACH DELETE n RETURN count(n) AS deleted"
+        record = tx.run(query, name=name).single()
+        deleted = record["deleted"] if record else 0
+        return NameDelta(removed=[name] if deleted else [])
 
     #############################################
     # 3. Node Query Operations
@@ -423,6 +550,7 @@ class Neo4jModel:
             WHERE n.name = $name
               AND ALL(r IN relationships(path) WHERE startNode(r) IS NOT NULL AND endNode(r) IS NOT NULL)
               AND ALL(node IN nodes(path) WHERE node IS NOT NULL)
+              AND NONE(r IN relationships(path) WHERE type(r) STARTS WITH '_')
             WITH path, length(path) AS path_length
             UNWIND range(1, path_length) AS idx
             WITH
@@ -447,6 +575,338 @@ class Neo4jModel:
 
         return worker
 
+    def get_mentioned_by(self, name: str, callback: Callable) -> QueryWorker:
+        """
+        Get the names of nodes whose descriptions mention a node.
+
+        Args:
+            name (str): Name of the mentioned node.
+            callback (function): Function to call with the result.
+
+        Returns:
+            QueryWorker: A worker that will execute the query.
+        """
+        query = f"""
+            MATCH (n {{name: $name}})<-[:`{MENTIONS_RELATIONSHIP}`]-(source)
+            RETURN DISTINCT source.name AS name
+            ORDER BY name
+        """
+        params = {"name": name}
+        worker = QueryWorker(self._uri, self._auth, query, params)
+        worker.query_finished.connect(callback)
+        return worker
+
+    def index_mentions(
+        self, names: Optional[List[str]], callback: Callable[[int], None]
+    ) -> MentionIndexWorker:
+        """
+        Add mention index entries from existing descriptions using a worker.
+
+        Args:
+            names (List[str]): Names to link, such as the nodes a save
+                created, or None to backfill the index for every name.
+            callback (function): Function to call with the number of entries
+                written.
+
+        Returns:
+            MentionIndexWorker: A worker that will index the mentions.
+        """
+        worker = MentionIndexWorker(
+            self._uri,
+            self._auth,
+            self._config.MENTION_INDEX_BATCH_SIZE,
+            self._config.MENTION_INDEX_WORKERS,
+            MENTIONS_RELATIONSHIP,
+            names,
+        )
+        worker.mentions_indexed.connect(callback)
+        return worker
+
+    def get_map_pins(self, name: str, callback: Callable) -> QueryWorker:
+        """
+        Get the pins of a map node using a worker.
+
+        Pins stored with native coordinates return x and y; older pins that
+        only have a WKT geometry return it in the geometry column instead.
+
+        Args:
+            name (str): Name of the map node.
+            callback (function): Function to call with the result.
+
+        Returns:
+            QueryWorker: A worker that will execute the query.
+        """
+        query = f"""
+            MATCH (n {{name: $name}})-[r:`{MAP_PIN_RELATIONSHIP}`]->(target)
+            WHERE r.x IS NOT NULL OR r.geometry IS NOT NULL
+            RETURN target.name AS target,
+                   r.x AS x,
+                   r.y AS y,
+                   r.shape AS geometry_type,
+                   CASE WHEN r.x IS NULL THEN r.geometry END AS geometry
+        """
+        params = {"name": name}
+        worker = QueryWorker(self._uri, self._auth, query, params)
+        worker.query_finished.connect(callback)
+        return worker
+
+    def get_image_paths(self, callback: Callable[[List[str]], None]) -> QueryWorker:
+        """Get the distinct image paths referenced by nodes.
+
+        Args:
+            callback: Function to handle the list of paths
+
+        Returns:
+            QueryWorker instance
+        """
+        query = """
+        MATCH (n)
+        WHERE n.imagepath IS NOT NULL AND n.imagepath <> ''
+        RETURN DISTINCT n.imagepath AS path
+        """
+
+        worker = QueryWorker(self._uri, self._auth, query)
+        worker.query_finished.connect(
+            lambda records: callback([r["path"] for r in records])
+        )
+        return worker
+
+    def export_nodes(
+        self,
+        names: List[str],
+        consume: Callable[[Iterable[Dict[str, Any]]], None],
+        callback: Callable[[int], None],
+    ) -> ExportWorker:
+        """
+        Stream the export data of several nodes using a worker.
+
+        All nodes are fetched by one UNWIND query, so an export is a single
+        round trip however many nodes it covers. Descriptions are exported as
+        plain text and system properties and relationships are left out.
+
+        Args:
+            names (List[str]): Names of the nodes to export.
+            consume (function): Function consuming the iterator of node data
+                dicts in the worker thread.
+            callback (function): Function to call with the number of exported nodes.
+
+        Returns:
+            ExportWorker: A worker that will execute the export.
+        """
+        query = """
+            UNWIND $names AS node_name
+            MATCH (n {name: node_name})
+            RETURN n.name AS name,
+                   coalesce(n._description_text, n.description, '') AS description,
+                   coalesce(n.tags, []) AS tags,
+                   labels(n) AS labels,
+                   [key IN keys(n)
+                       WHERE NOT key STARTS WITH '_'
+                         AND NOT key IN ['name', 'description', 'tags']
+                       | [key, n[key]]] AS properties,
+                   [(n)-[r]-(m) WHERE NOT type(r) STARTS WITH '_'
+                       | [type(r),
+                          m.name,
+                          CASE WHEN startNode(r) = n THEN '>' ELSE '<' END,
+                          properties(r)]] AS relationships
+        """
+        params = {"names": names}
+        worker = ExportWorker(
+            self._uri,
+            self._auth,
+            query,
+            params,
+            len(names),
+            self._export_node_data,
+            consume,
+        )
+        worker.export_finished.connect(callback)
+        return worker
+
+    def get_export_versions(
+        self, names: List[str], callback: Callable[[Dict[str, str]], None]
+    ) -> QueryWorker:
+        """
+        Get the export version of several nodes using a worker.
+
+        A version combines the node's _modified value with its relationships
+        as exported, since saving or deleting a neighbour changes the export
+        of a node without touching its _modified value.
+
+        Args:
+            names (List[str]): Names of the nodes.
+            callback (function): Function to call with the versions by node
+                name; missing nodes are left out.
+
+        Returns:
+            QueryWorker: A worker that will execute the query.
+        """
+        query = """
+            UNWIND $names AS node_name
+            MATCH (n {name: node_name})
+            RETURN n.name AS name,
+                   n._modified AS modified,
+                   [(n)-[r]-(m) WHERE NOT type(r) STARTS WITH '_'
+                       | [type(r),
+                          m.name,
+                          CASE WHEN startNode(r) = n THEN '>' ELSE '<' END,
+                          properties(r)]] AS relationships
+        """
+        params = {"names": names}
+        worker = QueryWorker(self._uri, self._auth, query, params)
+        worker.query_finished.connect(
+            lambda records: callback(
+                {
+                    r["name"]: export_version(r["modified"], r["relationships"])
+                    for r in records
+                }
+            )
+        )
+        return worker
+
+    def backup_world(
+        self, file_name: str, callback: Callable[[Dict[str, int]], None]
+    ) -> BackupWorker:
+        """
+        Write all nodes and relationships to a backup file using a worker.
+
+        Args:
+            file_name (str): Path of the backup file.
+            callback (function): Function to call with the counts of backed up
+                nodes and relationships.
+
+        Returns:
+            BackupWorker: A worker that will write the backup.
+        """
+        worker = BackupWorker(
+            self._uri, self._auth, file_name, self._config.BACKUP_CHUNK_SIZE
+        )
+        worker.backup_finished.connect(callback)
+        return worker
+
+    def restore_world(
+        self, file_name: str, callback: Callable[[Dict[str, int]], None]
+    ) -> RestoreWorker:
+        """
+        Replace all nodes and relationships with a backup using a worker.
+
+        Args:
+            file_name (str): Path of the backup file.
+            callback (function): Function to call with the counts of restored
+                nodes and relationships.
+
+        Returns:
+            RestoreWorker: A worker that will restore the backup.
+        """
+        worker = RestoreWorker(
+            self._uri,
+            self._auth,
+            file_name,
+            self._config.RESTORE_BATCH_SIZE,
+            self._config.RESTORE_WORKERS,
+        )
+        worker.restore_finished.connect(callback)
+        return worker
+
+    def import_nodes(self, path: str, callback: Callable[[Any], None]) -> ImportWorker:
+        """
+        Import nodes from a CSV, JSON Lines or Fast Inject source using a worker.
+
+        Args:
+            path (str): A CSV or JSON Lines file, or a directory of .fi files.
+            callback (function): Function to call with the ImportReport.
+
+        Returns:
+            ImportWorker: A worker that will run the import.
+        """
+        worker = ImportWorker(
+            self._uri,
+            self._auth,
+            path,
+            self._config.IMPORT_BATCH_SIZE,
+            self._config.IMPORT_WORKERS,
+            self._config.MAX_NODE_NAME_LENGTH,
+            self._prepare_import_node,
+        )
+        worker.import_finished.connect(callback)
+        return worker
+
+    def import_vault(self, path: str, callback: Callable[[Any], None]) -> VaultImportWorker:
+        """
+        Import the changed notes of a Markdown vault using a worker.
+
+        Args:
+            path (str): The vault directory.
+            callback (function): Function to call with the ImportReport.
+
+        Returns:
+            VaultImportWorker: A worker that will run the import.
+        """
+        worker = VaultImportWorker(
+            self._uri,
+            self._auth,
+            path,
+            sync_state_path(path, self._uri),
+            self._config.VAULT_LINK_RELATIONSHIP,
+            self._config.IMPORT_BATCH_SIZE,
+            self._config.IMPORT_WORKERS,
+            self._config.VAULT_PARSE_CHUNK_SIZE,
+            self._config.VAULT_PARSE_WORKERS,
+            self._config.MAX_NODE_NAME_LENGTH,
+            self._prepare_import_node,
+        )
+        worker.import_finished.connect(callback)
+        return worker
+
+    @staticmethod
+    def _prepare_import_node(node_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Finish the node data of an imported row like a save does.
+
+        Keeps the native pin coordinates of map pin relationships in sync with
+        their WKT geometry.
+
+        Args:
+            node_data (dict): The normalized node data.
+
+        Returns:
+            Dict[str, Any]: The node data.
+        """
+        relationships = []
+        for rel_type, target, direction, properties in node_data["relationships"]:
+            if rel_type == MAP_PIN_RELATIONSHIP and GeometryHandler.validate_wkt(
+                properties.get("geometry", "")
+            ):
+                properties = {
+                    **properties,
+                    **GeometryHandler.create_geometry_properties(
+                        properties["geometry"]
+                    ),
+                }
+            relationships.append((rel_type, target, direction, properties))
+        node_data["relationships"] = relationships
+        return node_data
+
+    @staticmethod
+    def _export_node_data(record: Any) -> Dict[str, Any]:
+        """
+        Convert an export record into the node data format of the exporters.
+
+        Args:
+            record: A record of the export query.
+
+        Returns:
+            Dict[str, Any]: The node data.
+        """
+        return {
+            "name": record["name"],
+            "description": record["description"],
+            "tags": list(record["tags"]),
+            "labels": list(record["labels"]),
+            "relationships": [tuple(rel) for rel in record["relationships"]],
+            "additional_properties": dict(record["properties"]),
+        }
+
     def get_node_hierarchy(self) -> Dict[str, Any]:
         """
         Get the hierarchy of nodes grouped by their primary label.
@@ -557,6 +1017,78 @@ class Neo4jModel:
         )
         return worker
 
+    def get_name_checksum(self, callback: Callable[[List[Any]], None]) -> QueryWorker:
+        """Get a cheap checksum of the node name set.
+
+        The checksum is the number of distinct node names and the most recent
+        _modified timestamp, used to detect drift in the local name cache.
+
+        Args:
+            callback: Function to handle query results
+
+        Returns:
+            QueryWorker instance
+        """
+        query = """
+        MATCH (n)
+        WHERE n.name IS NOT NULL
+        RETURN count(DISTINCT n.name) AS count, max(n._modified) AS last_modified
+        """
+
+        worker = QueryWorker(self._uri, self._auth, query)
+        worker.query_finished.connect(callback)
+        return worker
+
+    def get_node_degrees(self, callback: Callable[[List[Any]], None]) -> QueryWorker:
+        """Get the relationship count of every named node.
+
+        Args:
+            callback: Function to handle query results
+
+        Returns:
+            QueryWorker instance
+        """
+        query = """
+        MATCH (n)
+        WHERE n.name IS NOT NULL
+        RETURN n.name AS name, COUNT { (n)--() } AS degree
+        """
+
+        worker = QueryWorker(self._uri, self._auth, query)
+        worker.query_finished.connect(callback)
+        return worker
+
+    def get_schema_catalog(self, callback: Callable[[List[Any]], None]) -> QueryWorker:
+        """Get the label, tag and property key catalogs of the database.
+
+        Args:
+            callback: Function to handle query results
+
+        Returns:
+            QueryWorker instance
+        """
+        query = """
+        CALL {
+            CALL db.labels() YIELD label
+            RETURN collect(label) AS labels
+        }
+        CALL {
+            CALL db.propertyKeys() YIELD propertyKey
+            RETURN collect(propertyKey) AS property_keys
+        }
+        CALL {
+            MATCH (n)
+            WHERE n.tags IS NOT NULL
+            UNWIND n.tags AS tag
+            RETURN collect(DISTINCT tag) AS tags
+        }
+        RETURN labels, tags, property_keys
+        """
+
+        worker = QueryWorker(self._uri, self._auth, query)
+        worker.query_finished.connect(callback)
+        return worker
+
     def execute_read_query(
         self, query: str, params: Optional[Dict[str, Any]] = None
     ) -> QueryWorker:
@@ -3,8 +3,13 @@ This module provides worker classes for performing Neo4j database operations in
 It includes classes for querying, writing, deleting, and generating suggestions for nodes.
 """
 
+import os
+import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pandas as pd
 import structlog
@@ -12,7 +17,12 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from neo4j import GraphDatabase
 
 from config.config import Config
-from utils.converters import DataFrameBuilder
+from utils.bulk_import import ImportReport, ImportRow, iter_import_rows, normalize_node
+from utils.converters import DataFrameBuilder, NamingConventionConverter as ncc
+from utils.html_text import compact_html, html_to_plain_text
+from utils.markdown_vault import VaultSyncState, note_key, parse_notes, scan_vault
+from utils.name_matcher import NameMatcher
+from utils.world_backup import BackupReader, BackupWriter
 
 logger = structlog.get_logger()
 
@@ -58,12 +68,18 @@ class BaseNeo4jWorker(QThread):
             self._driver.close()
             self._driver = None
 
-    def cancel(self) -> None:
+    def request_cancel(self) -> None:
         """
-        Cancel current operation.
+        Ask the current operation to stop without waiting for it.
         """
         self._is_cancelled = True
         self.quit()  # Tell thread to quit
+
+    def cancel(self) -> None:
+        """
+        Cancel current operation.
+        """
+        self.request_cancel()
         self.wait()
 
     def run(self) -> None:
@@ -157,7 +173,7 @@ class WriteWorker(BaseNeo4jWorker):
         *args: Arguments for the function.
     """
 
-    write_finished = pyqtSignal(bool)
+    write_finished = pyqtSignal(object)
 
     def __init__(
         self, uri: str, auth: Tuple[str, str], func: Callable[..., Any], *args: Any
@@ -178,11 +194,14 @@ class WriteWorker(BaseNeo4jWorker):
     def execute_operation(self) -> None:
         """
         Execute the write operation.
+
+        Emits the value returned by the transaction function, or True if it
+        returned nothing.
         """
         with self._driver.session() as session:
-            session.execute_write(self.func, *self.args)
+            result = session.execute_write(self.func, *self.args)
             if not self._is_cancelled:
-                self.write_finished.emit(True)
+                self.write_finished.emit(True if result is None else result)
 
     @staticmethod
     def _run_transaction(tx: Any, query: str, params: Dict[str, Any]) -> Any:
@@ -211,7 +230,7 @@ class DeleteWorker(BaseNeo4jWorker):
         *args: Arguments for the function.
     """
 
-    delete_finished = pyqtSignal(bool)
+    delete_finished = pyqtSignal(object)
 
     def __init__(
         self, uri: str, auth: Tuple[str, str], func: Callable[..., Any], *args: Any
@@ -232,11 +251,14 @@ class DeleteWorker(BaseNeo4jWorker):
     def execute_operation(self) -> None:
         """
         Execute the delete operation.
+
+        Emits the value returned by the transaction function, or True if it
+        returned nothing.
         """
         with self._driver.session() as session:
-            session.execute_write(self.func, *self.args)
+            result = session.execute_write(self.func, *self.args)
             if not self._is_cancelled:
-                self.delete_finished.emit(True)
+                self.delete_finished.emit(True if result is None else result)
 
     @staticmethod
     def _run_transaction(tx: Any, query: str, params: Dict[str, Any]) -> Any:
@@ -254,6 +276,1085 @@ class DeleteWorker(BaseNeo4jWorker):
         return tx.run(query, params)
 
 
+class ExportCancelled(Exception):
+    """Raised inside an export's record stream when the export is cancelled."""
+
+
+class ExportWorker(BaseNeo4jWorker):
+    """
+    Worker streaming the records of one read query into a consumer.
+
+    The consumer receives an iterator over the converted records and pulls
+    them as the driver fetches them, so records are never collected in a
+    list. Cancelling makes the iterator raise ExportCancelled, which the
+    consumer lets propagate to abort its output.
+
+    Args:
+        uri (str): The URI of the Neo4j database.
+        auth (tuple): A tuple containing the username and password for authentication.
+        query (str): The Cypher query to execute.
+        params (dict): Parameters for the query.
+        total (int): Expected number of records, for progress reporting.
+        convert (callable): Function converting a record into an exported item.
+        consume (callable): Function consuming the iterator of items.
+    """
+
+    export_progress = pyqtSignal(int, int)  # done, total
+    export_finished = pyqtSignal(int)  # number of exported records
+
+    # Records between progress signals, so large exports don't flood the GUI
+    PROGRESS_INTERVAL = 100
+
+    def __init__(
+        self,
+        uri: str,
+        auth: Tuple[str, str],
+        query: str,
+        params: Dict[str, Any],
+        total: int,
+        convert: Callable[[Any], Any],
+        consume: Callable[[Iterable[Any]], None],
+    ) -> None:
+        """
+        Initialize the worker with the query and the record consumer.
+
+        Args:
+            uri (str): The URI of the Neo4j database.
+            auth (tuple): A tuple containing the username and password for authentication.
+            query (str): The Cypher query to execute.
+            params (dict): Parameters for the query.
+            total (int): Expected number of records, for progress reporting.
+            convert (callable): Function converting a record into an exported item.
+            consume (callable): Function consuming the iterator of items.
+        """
+        super().__init__(uri, auth)
+        self.query = query
+        self.params = params
+        self.total = total
+        self.convert = convert
+        self.consume = consume
+        self._exported = 0
+
+    def execute_operation(self) -> None:
+        """
+        Execute the query and feed its records to the consumer.
+        """
+        try:
+            with self._driver.session() as session:
+                result = session.run(self.query, self.params)
+                self.consume(self._stream(result))
+        except ExportCancelled:
+            logger.info("export_cancelled", exported=self._exported)
+            return
+        if not self._is_cancelled:
+            self.export_finished.emit(self._exported)
+
+    def _stream(self, result: Iterable[Any]) -> Iterator[Any]:
+        """Yield converted records, reporting progress and honoring cancellation."""
+        for record in result:
+            if self._is_cancelled:
+                raise ExportCancelled()
+            yield self.convert(record)
+            self._exported += 1
+            if self._exported % self.PROGRESS_INTERVAL == 0:
+                self.export_progress.emit(self._exported, self.total)
+        if self._is_cancelled:
+            raise ExportCancelled()
+        self.export_progress.emit(self._exported, self.total)
+
+
+class BackupWorker(BaseNeo4jWorker):
+    """
+    Worker streaming all nodes and relationships into a backup file.
+
+    Nodes and relationships are read by one query each and written to the
+    backup as they arrive; only the map from database element ids to backup
+    ids is kept in memory.
+
+    Args:
+        uri (str): The URI of the Neo4j database.
+        auth (tuple): A tuple containing the username and password for authentication.
+        file_name (str): Path of the backup file.
+        chunk_size (int): Rows per backup chunk.
+    """
+
+    backup_progress = pyqtSignal(int, int)  # done, total
+    backup_finished = pyqtSignal(object)  # counts of nodes and relationships
+
+    # Rows between progress signals, so large backups don't flood the GUI
+    PROGRESS_INTERVAL = 1000
+
+    def __init__(
+        self, uri: str, auth: Tuple[str, str], file_name: str, chunk_size: int
+    ) -> None:
+        """
+        Initialize the worker with the backup file.
+
+        Args:
+            uri (str): The URI of the Neo4j database.
+            auth (tuple): A tuple containing the username and password for authentication.
+            file_name (str): Path of the backup file.
+            chunk_size (int): Rows per backup chunk.
+        """
+        super().__init__(uri, auth)
+        self.file_name = file_name
+        self.chunk_size = chunk_size
+
+    def execute_operation(self) -> None:
+        """
+        Write the backup, discarding it if cancelled or failed.
+        """
+        writer = BackupWriter(self.file_name, self.chunk_size)
+        try:
+            skipped = self._write_backup(writer)
+            writer.close()
+        except ExportCancelled:
+            writer.abort()
+            logger.info("backup_cancelled", file=self.file_name)
+            return
+        except BaseException:
+            writer.abort()
+            raise
+
+        counts = {
+            "nodes": writer.node_count,
+            "relationships": writer.relationship_count,
+        }
+        logger.info("backup_written", file=self.file_name, skipped=skipped, **counts)
+        if not self._is_cancelled:
+            self.backup_finished.emit(counts)
+
+    def _write_backup(self, writer: BackupWriter) -> int:
+        """
+        Stream the world into a backup writer.
+
+        Returns:
+            int: Relationships skipped because an end node was created after
+            the nodes were read.
+        """
+        with self._driver.session() as session:
+            total = (
+                session.run("MATCH (n) RETURN count(n) AS count").single()["count"]
+                + session.run("MATCH ()-[r]->() RETURN count(r) AS count").single()[
+                    "count"
+                ]
+            )
+            done = 0
+            ids: Dict[str, int] = {}
+
+            result = session.run(
+                "MATCH (n) RETURN elementId(n) AS id, labels(n) AS labels, "
+                "properties(n) AS properties"
+            )
+            for record in result:
+                node_id = ids[record["id"]] = len(ids)
+                writer.add_node(node_id, record["labels"], record["properties"])
+                done = self._advance(done, total)
+
+            skipped = 0
+            result = session.run(
+                "MATCH (a)-[r]->(b) RETURN elementId(a) AS start, elementId(b) AS end, "
+                "type(r) AS type, properties(r) AS properties"
+            )
+            for record in result:
+                start, end = ids.get(record["start"]), ids.get(record["end"])
+                if start is None or end is None:
+                    skipped += 1
+                else:
+                    writer.add_relationship(
+                        start, end, record["type"], record["properties"]
+                    )
+                done = self._advance(done, total)
+
+        self.backup_progress.emit(done, total)
+        return skipped
+
+    def _advance(self, done: int, total: int) -> int:
+        """Count a written row, reporting progress and honoring cancellation."""
+        if self._is_cancelled:
+            raise ExportCancelled()
+        done += 1
+        if done % self.PROGRESS_INTERVAL == 0:
+            self.backup_progress.emit(done, total)
+        return done
+
+
+def quote_name(name: str) -> str:
+    """Quote a label or relationship type for use in a Cypher query."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+class ParallelWriteWorker(BaseNeo4jWorker):
+    """
+    Base class for workers writing rows with batched UNWIND queries.
+
+    Every batch is one query run over a list of rows in its own write
+    transaction. Batches run concurrently in a thread pool with a session
+    per batch, and only a bounded number of them is held in memory, so rows
+    can be produced lazily from a file. Transient errors such as deadlocks
+    between concurrent batches are retried by the driver.
+
+    Args:
+        uri (str): The URI of the Neo4j database.
+        auth (tuple): A tuple containing the username and password for authentication.
+        batch_size (int): Rows per write transaction.
+        max_workers (int): Batches written concurrently.
+    """
+
+    write_progress = pyqtSignal(int, int)  # rows written, total
+
+    def __init__(
+        self, uri: str, auth: Tuple[str, str], batch_size: int, max_workers: int
+    ) -> None:
+        """
+        Initialize the worker with the batching parameters.
+
+        Args:
+            uri (str): The URI of the Neo4j database.
+            auth (tuple): A tuple containing the username and password for authentication.
+            batch_size (int): Rows per write transaction.
+            max_workers (int): Batches written concurrently.
+        """
+        super().__init__(uri, auth)
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self._written = 0
+        self._total = 0
+
+    def _batched(
+        self, rows: Iterable[Tuple[Any, Dict[str, Any]]]
+    ) -> Iterator[Tuple[Any, List[Dict[str, Any]]]]:
+        """
+        Group keyed rows into batches of rows sharing a key.
+
+        Args:
+            rows: Pairs of a key, such as the label set or relationship type
+                the rows are written with, and a row.
+
+        Yields:
+            Tuple: A key and up to batch_size rows with that key.
+        """
+        pending: Dict[Any, List[Dict[str, Any]]] = {}
+        for key, row in rows:
+            batch = pending.setdefault(key, [])
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield key, pending.pop(key)
+        yield from pending.items()
+
+    def _write_batches(self, batches: Iterable[Tuple[str, List[Dict[str, Any]]]]) -> None:
+        """
+        Write batches concurrently and wait for all of them.
+
+        Stops submitting batches when the worker is cancelled; batches
+        already submitted still complete.
+
+        Args:
+            batches: Pairs of a query taking ``$rows`` and its rows.
+
+        Raises:
+            Exception: The first error of a batch, after the running batches
+                have finished.
+        """
+        in_flight = set()
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            try:
+                for query, rows in batches:
+                    if self._is_cancelled:
+                        break
+                    if len(in_flight) >= 2 * self.max_workers:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        self._collect(done)
+                    in_flight.add(pool.submit(self._write, query, rows))
+                self._collect(in_flight)
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def _collect(self, futures: Iterable[Future]) -> None:
+        """Count the rows of finished batches, raising their errors."""
+        for future in futures:
+            count, records = future.result()
+            self._batch_written(records)
+            self._written += count
+            self.write_progress.emit(self._written, self._total)
+
+    def _batch_written(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Handle the records returned by a written batch.
+
+        Called in the worker thread, one batch at a time. Override to use
+        values returned by the batch queries.
+
+        Args:
+            records: The returned records as dicts.
+        """
+
+    def _write(
+        self, query: str, rows: List[Dict[str, Any]]
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Write one batch in its own transaction, returning its size and records."""
+        with self._driver.session() as session:
+            records = session.execute_write(
+                lambda tx: tx.run(query, rows=rows).data()
+            )
+        return len(rows), records
+
+    def _run_in_batches(
+        self, query: str, cancellable: bool = True, **params: Any
+    ) -> int:
+        """
+        Run a query taking ``$batch_size`` until it returns a count of zero.
+
+        Used for work on an unknown number of nodes, such as deleting them,
+        without one huge transaction.
+
+        Args:
+            query (str): Query processing up to $batch_size nodes and
+                returning their number as ``count``.
+            cancellable (bool): Whether a cancel stops the work. Cleanup that
+                must always finish passes False.
+            **params: Further query parameters.
+
+        Returns:
+            int: The total count.
+        """
+        total = 0
+        with self._driver.session() as session:
+            while not (cancellable and self._is_cancelled):
+                count = session.execute_write(
+                    lambda tx: tx.run(
+                        query, batch_size=self.batch_size, **params
+                    ).single()["count"]
+                )
+                if not count:
+                    break
+                total += count
+        return total
+
+
+class RestoreWorker(ParallelWriteWorker):
+    """
+    Worker replacing the world with the contents of a backup.
+
+    The nodes of the backup are created next to the current world with a
+    temporary label and backup id property, both indexed, so the
+    relationships can find their end nodes by index. A cancel or a failed
+    write deletes the restored nodes again and leaves the current world as
+    it was. Only once everything is written are the current nodes deleted
+    and the temporary label, property and index removed; this final swap
+    is not cancellable.
+
+    Args:
+        uri (str): The URI of the Neo4j database.
+        auth (tuple): A tuple containing the username and password for authentication.
+        file_name (str): Path of the backup file.
+        batch_size (int): Rows per write transaction.
+        max_workers (int): Batches written concurrently.
+    """
+
+    restore_committing = pyqtSignal()  # the current world is being replaced
+    restore_finished = pyqtSignal(object)  # counts of nodes and relationships
+
+    RESTORE_LABEL = "_Restoring"
+    RESTORE_ID = "_restore_id"
+    RESTORE_INDEX = "restore_id_index"
+
+    def __init__(
+        self,
+        uri: str,
+        auth: Tuple[str, str],
+        file_name: str,
+        batch_size: int,
+        max_workers: int,
+    ) -> None:
+        """
+        Initialize the worker with the backup file.
+
+        Args:
+            uri (str): The URI of the Neo4j database.
+            auth (tuple): A tuple containing the username and password for authentication.
+            file_name (str): Path of the backup file.
+            batch_size (int): Rows per write transaction.
+            max_workers (int): Batches written concurrently.
+        """
+        super().__init__(uri, auth, batch_size, max_workers)
+        self.file_name = file_name
+
+    def execute_operation(self) -> None:
+        """
+        Restore the backup.
+        """
+        label = quote_name(self.RESTORE_LABEL)
+        restore_id = quote_name(self.RESTORE_ID)
+        with BackupReader(self.file_name) as reader:
+            # A corrupt backup is rejected before anything is written
+            reader.validate()
+            manifest = reader.manifest
+            self._total = manifest["nodes"] + manifest["relationships"]
+
+            # Nodes left by an interrupted restore never became the world
+            self._delete_restored_nodes()
+
+            committed = False
+            try:
+                with self._driver.session() as session:
+                    session.run(
+                        f"CREATE INDEX {self.RESTORE_INDEX} IF NOT EXISTS "
+                        f"FOR (n:{label}) ON (n.{restore_id})"
+                    ).consume()
+                    session.run("CALL db.awaitIndexes()").consume()
+
+                self._write_batches(
+                    (
+                        f"UNWIND $rows AS row "
+                        f"CREATE (n:{':'.join(map(quote_name, (self.RESTORE_LABEL, *labels)))}) "
+                        f"SET n = row.properties, n.{restore_id} = row.id",
+                        rows,
+                    )
+                    for labels, rows in self._batched(
+                        (labels, {"id": node_id, "properties": properties})
+                        for node_id, labels, properties in reader.nodes()
+                    )
+                )
+                self._write_batches(
+                    (
+                        f"UNWIND $rows AS row "
+                        f"MATCH (a:{label} {{{restore_id}: row.start}}) "
+                        f"MATCH (b:{label} {{{restore_id}: row.end}}) "
+                        f"CREATE (a)-[r:{quote_name(rel_type)}]->(b) "
+                        f"SET r = row.properties",
+                        rows,
+                    )
+                    for rel_type, rows in self._batched(
+                        (
+                            rel_type,
+                            {"start": start, "end": end, "properties": properties},
+                        )
+                        for start, end, rel_type, properties in reader.relationships()
+                    )
+                )
+
+                if not self._is_cancelled:
+                    committed = True
+                    self.restore_committing.emit()
+                    deleted = self._run_in_batches(
+                        f"MATCH (n) WHERE NOT n:{label} "
+                        f"WITH n LIMIT $batch_size DETACH DELETE n "
+                        f"RETURN count(*) AS count",
+                        cancellable=False,
+                    )
+                    logger.info("restore_replaced_world", nodes=deleted)
+                    self._run_in_batches(
+                        f"MATCH (n:{label}) WITH n LIMIT $batch_size "
+                        f"REMOVE n:{label}, n.{restore_id} RETURN count(*) AS count",
+                        cancellable=False,
+                    )
+            finally:
+                # A cancelled or failed restore leaves the current world as it was
+                if not committed:
+                    self._delete_restored_nodes()
+                with self._driver.session() as session:
+                    session.run(f"DROP INDEX {self.RESTORE_INDEX} IF EXISTS").consume()
+
+        if not committed:
+            logger.info("restore_cancelled", written=self._written)
+            return
+        counts = {
+            "nodes": manifest["nodes"],
+            "relationships": manifest["relationships"],
+        }
+        logger.info("backup_restored", file=self.file_name, **counts)
+        self.restore_finished.emit(counts)
+
+    def _delete_restored_nodes(self) -> None:
+        """Delete the nodes carrying the temporary restore label."""
+        label = quote_name(self.RESTORE_LABEL)
+        deleted = self._run_in_batches(
+            f"MATCH (n:{label}) WITH n LIMIT $batch_size DETACH DELETE n "
+            f"RETURN count(*) AS count",
+            cancellable=False,
+        )
+        if deleted:
+            logger.info("restore_rolled_back", nodes=deleted)
+
+
+class ImportWorker(ParallelWriteWorker):
+    """
+    Worker importing nodes from a CSV, JSON Lines or Fast Inject source.
+
+    The names and element ids of all nodes are read once, so every write
+    addresses nodes by id instead of scanning for their names. Rows are
+    parsed and normalized as they are read and written in batches: new
+    nodes are created, existing ones updated with the imported labels and
+    properties. Relationships are collected while reading and written last,
+    after missing targets have been created as STUMP nodes. Invalid rows are
+    reported and skipped. A cancelled import keeps the batches already
+    written.
+
+    Args:
+        uri (str): The URI of the Neo4j database.
+        auth (tuple): A tuple containing the username and password for authentication.
+        path (str): The import source.
+        batch_size (int): Rows per write transaction.
+        max_workers (int): Batches written concurrently.
+        max_name_length (int): Maximum length of a node name.
+        prepare (callable): Function finishing the node data of a row.
+    """
+
+    import_finished = pyqtSignal(object)  # ImportReport
+
+    STUMP_LABEL = "STUMP"
+
+    def __init__(
+        self,
+        uri: str,
+        auth: Tuple[str, str],
+        path: str,
+        batch_size: int,
+        max_workers: int,
+        max_name_length: int,
+        prepare: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> None:
+        """
+        Initialize the worker with the import source.
+
+        Args:
+            uri (str): The URI of the Neo4j database.
+            auth (tuple): A tuple containing the username and password for authentication.
+            path (str): The import source.
+            batch_size (int): Rows per write transaction.
+            max_workers (int): Batches written concurrently.
+            max_name_length (int): Maximum length of a node name.
+            prepare (callable): Function finishing the node data of a row.
+        """
+        super().__init__(uri, auth, batch_size, max_workers)
+        self.path = path
+        self.max_name_length = max_name_length
+        self.prepare = prepare
+        self._ids: Dict[str, str] = {}
+
+    def execute_operation(self) -> None:
+        """
+        Import the source and report the outcome.
+        """
+        started = time.perf_counter()
+        report = ImportReport()
+        relationships: List[Tuple[str, str, str, str, Dict[str, Any]]] = []
+
+        with self._driver.session() as session:
+            self._ids = {
+                record["name"]: record["id"]
+                for record in session.run(
+                    "MATCH (n) WHERE n.name IS NOT NULL "
+                    "RETURN n.name AS name, elementId(n) AS id"
+                )
+            }
+
+        self._write_batches(
+            (self._node_query(*key), rows)
+            for key, rows in self._batched(
+                self._node_rows(self._import_rows(report), report, relationships)
+            )
+        )
+        self._write_stubs(relationships, report)
+        self._write_batches(
+            (
+                f"UNWIND $rows AS row "
+                f"MATCH (a) WHERE elementId(a) = row.start "
+                f"MATCH (b) WHERE elementId(b) = row.end "
+                f"MERGE (a)-[r:{quote_name(rel_type)}]->(b) "
+                f"SET r = row.properties",
+                rows,
+            )
+            for rel_type, rows in self._batched(
+                self._relationship_rows(relationships, report)
+            )
+        )
+
+        if not self._is_cancelled:
+            self._after_import(report)
+
+        report.seconds = time.perf_counter() - started
+        if self._is_cancelled:
+            logger.info("import_cancelled", path=self.path, rows=report.rows)
+            return
+        logger.info(
+            "import_finished",
+            path=self.path,
+            rows=report.rows,
+            unchanged=report.unchanged,
+            created=report.created,
+            updated=report.updated,
+            stubs=report.stubs,
+            relationships=report.relationships,
+            errors=len(report.errors),
+            rows_per_second=round(report.rows_per_second),
+        )
+        self.import_finished.emit(report)
+
+    def _import_rows(self, report: ImportReport) -> Iterable[ImportRow]:
+        """
+        Get the rows to import.
+
+        Override to import rows from another kind of source.
+
+        Args:
+            report: The report of the import.
+
+        Returns:
+            Iterable[ImportRow]: The location and parse function of each row.
+        """
+        return iter_import_rows(self.path)
+
+    def _after_import(self, report: ImportReport) -> None:
+        """
+        Finish an import that was not cancelled.
+
+        Called after all rows and relationships are written. Override to do
+        further writes or record the imported state.
+
+        Args:
+            report: The report of the import.
+        """
+
+    def _node_rows(
+        self,
+        rows: Iterable[ImportRow],
+        report: ImportReport,
+        relationships: List[Tuple[str, str, str, str, Dict[str, Any]]],
+    ) -> Iterator[Tuple[Tuple[str, Tuple[str, ...]], Dict[str, Any]]]:
+        """
+        Parse import rows into keyed node rows.
+
+        Yields:
+            Tuple: The key ("create" or "update" and the sorted labels) and
+            the row of a node.
+        """
+        now = datetime.now().isoformat()
+        seen: Dict[str, str] = {}
+        for location, parse in rows:
+            if self._is_cancelled:
+                return
+            report.rows += 1
+            try:
+                node_data = self.prepare(normalize_node(parse(), self.max_name_length))
+            except (OSError, ValueError) as e:
+                report.errors.append((location, str(e)))
+                continue
+
+            name = node_data["name"]
+            if name in seen:
+                report.errors.append((location, f"Duplicate of {seen[name]}, skipped"))
+                continue
+            seen[name] = location
+
+            description = compact_html(node_data["description"])
+            properties = {
+                **node_data["additional_properties"],
+                "name": name,
+                "description": description,
+                "tags": node_data["tags"],
+                "_description_text": html_to_plain_text(description),
+                "_author": "System",
+                "_modified": now,
+            }
+            relationships.extend(
+                (name, *relationship) for relationship in node_data["relationships"]
+            )
+
+            labels = tuple(sorted(set(node_data["labels"])))
+            node_id = self._ids.get(name)
+            if node_id is None:
+                report.created += 1
+                properties["_created"] = now
+                yield ("create", labels), {"name": name, "properties": properties}
+            else:
+                report.updated += 1
+                yield ("update", labels), {"id": node_id, "properties": properties}
+
+    def _node_query(self, operation: str, labels: Tuple[str, ...]) -> str:
+        """Build the query creating or updating nodes with the given labels."""
+        if operation == "create":
+            label_clause = "".join(f":{quote_name(label)}" for label in labels)
+            return (
+                f"UNWIND $rows AS row CREATE (n{label_clause}) "
+                f"SET n = row.properties "
+                f"RETURN row.name AS name, elementId(n) AS id"
+            )
+        query = (
+            "UNWIND $rows AS row MATCH (n) WHERE elementId(n) = row.id "
+            "SET n += row.properties"
+        )
+        if labels:
+            query += " SET n" + "".join(f":{quote_name(label)}" for label in labels)
+        if self.STUMP_LABEL not in labels:
+            query += f" REMOVE n:{quote_name(self.STUMP_LABEL)}"
+        return query
+
+    def _batch_written(self, records: List[Dict[str, Any]]) -> None:
+        """Record the element ids of created nodes."""
+        for record in records:
+            self._ids[record["name"]] = record["id"]
+
+    def _write_stubs(
+        self,
+        relationships: List[Tuple[str, str, str, str, Dict[str, Any]]],
+        report: ImportReport,
+    ) -> None:
+        """Create STUMP nodes for relationship targets that don't exist."""
+        missing = {
+            target for _, _, target, _, _ in relationships if target not in self._ids
+        }
+        now = datetime.now().isoformat()
+        report.stubs = len(missing)
+        self._write_batches(
+            (
+                f"UNWIND $rows AS row CREATE (n:{quote_name(self.STUMP_LABEL)}) "
+                f"SET n = row.properties "
+                f"RETURN row.name AS name, elementId(n) AS id",
+                rows,
+            )
+            for _, rows in self._batched(
+                (
+                    None,
+                    {
+                        "name": target,
+                        "properties": {
+                            "name": target,
+                            "_author": "System",
+                            "_created": now,
+                            "_modified": now,
+                        },
+                    },
+                )
+                for target in sorted(missing)
+            )
+        )
+
+    def _relationship_rows(
+        self,
+        relationships: List[Tuple[str, str, str, str, Dict[str, Any]]],
+        report: ImportReport,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Resolve collected relationships to keyed rows of element ids.
+
+        Yields:
+            Tuple: The relationship type and the row of a relationship.
+        """
+        for name, rel_type, target, direction, properties in relationships:
+            start, end = self._ids.get(name), self._ids.get(target)
+            if start is None or end is None:
+                # The node or target was not written, e.g. after cancelling
+                continue
+            if direction == "<":
+                start, end = end, start
+            report.relationships += 1
+            yield rel_type, {"start": start, "end": end, "properties": properties}
+
+
+class VaultImportWorker(ImportWorker):
+    """
+    Worker importing a Markdown vault, one node per note.
+
+    Notes are parsed in a process pool. Front matter sets labels, tags and
+    properties, and wiki-links become relationships to the linked notes'
+    nodes, with missing targets created as STUMP nodes. Imports are
+    incremental: notes whose size and modification time, or else content
+    hash, match the sync state are skipped, and relationships a changed
+    note no longer links are removed. The parsed changed notes are held in
+    memory until written, as links can only be resolved once every note's
+    name is known.
+
+    Args:
+        uri (str): The URI of the Neo4j database.
+        auth (tuple): A tuple containing the username and password for authentication.
+        path (str): The vault directory.
+        state_path (str): Path of the vault's sync state file.
+        link_type (str): Relationship type of wiki-links in note bodies.
+        batch_size (int): Rows per write transaction.
+        max_workers (int): Batches written concurrently.
+        parse_chunk_size (int): Notes per parsing task.
+        parse_workers (int): Parsing processes, 0 for one per CPU.
+        max_name_length (int): Maximum length of a node name.
+        prepare (callable): Function finishing the node data of a row.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        auth: Tuple[str, str],
+        path: str,
+        state_path: str,
+        link_type: str,
+        batch_size: int,
+        max_workers: int,
+        parse_chunk_size: int,
+        parse_workers: int,
+        max_name_length: int,
+        prepare: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> None:
+        """
+        Initialize the worker with the vault and its sync state.
+
+        Args:
+            uri (str): The URI of the Neo4j database.
+            auth (tuple): A tuple containing the username and password for authentication.
+            path (str): The vault directory.
+            state_path (str): Path of the vault's sync state file.
+            link_type (str): Relationship type of wiki-links in note bodies.
+            batch_size (int): Rows per write transaction.
+            max_workers (int): Batches written concurrently.
+            parse_chunk_size (int): Notes per parsing task.
+            parse_workers (int): Parsing processes, 0 for one per CPU.
+            max_name_length (int): Maximum length of a node name.
+            prepare (callable): Function finishing the node data of a row.
+        """
+        super().__init__(
+            uri, auth, path, batch_size, max_workers, max_name_length, prepare
+        )
+        self.state_path = state_path
+        self.link_type = link_type
+        self.parse_chunk_size = parse_chunk_size
+        self.parse_workers = parse_workers or None
+        self._state = VaultSyncState(state_path)
+        # Written notes by path: stat, hash, name and links
+        self._notes: Dict[str, Tuple[os.stat_result, str, str, List[Tuple[str, str]]]] = {}
+
+    def _import_rows(self, report: ImportReport) -> Iterator[ImportRow]:
+        """
+        Parse the changed notes and yield them as import rows.
+
+        Yields:
+            ImportRow: The note path and a function returning its node data.
+        """
+        self._state = VaultSyncState.load(self.state_path)
+        notes = list(scan_vault(self.path))
+        current = {relative for relative, _, _ in notes}
+        removed = [relative for relative in self._state.notes if relative not in current]
+        for relative in removed:
+            del self._state.notes[relative]
+
+        candidates = [
+            (relative, path, stat)
+            for relative, path, stat in notes
+            if not self._state.is_unchanged(relative, stat)
+        ]
+        report.unchanged = len(notes) - len(candidates)
+        logger.info(
+            "vault_scanned",
+            path=self.path,
+            notes=len(notes),
+            candidates=len(candidates),
+            removed=len(removed),
+        )
+
+        changed = []
+        parsed = parse_notes(
+            [path for _, path, _ in candidates],
+            self.parse_chunk_size,
+            self.parse_workers,
+        )
+        try:
+            for (relative, _, stat), note in zip(candidates, parsed):
+                if self._is_cancelled:
+                    return
+                entry = self._state.notes.get(relative)
+                if "error" in note:
+                    report.rows += 1
+                    report.errors.append((relative, note["error"]))
+                elif entry and entry["sha256"] == note["sha256"]:
+                    # Touched without changes
+                    entry["mtime"], entry["bytes"] = stat.st_mtime_ns, stat.st_size
+                    report.unchanged += 1
+                else:
+                    changed.append((relative, stat, note))
+        finally:
+            parsed.close()
+
+        # Current node names of all notes, for resolving links
+        names: Dict[str, str] = {}
+        changed_names = {relative: note["name"] for relative, _, note in changed}
+        for relative, _, _ in notes:
+            entry = self._state.notes.get(relative)
+            name = changed_names.get(relative) or (entry and entry["name"])
+            if name:
+                self._add_note_name(names, relative, name)
+
+        for relative, stat, note in changed:
+            links = []
+            for key, target in note["links"]:
+                rel_type = ncc.to_upper_underscore(key) if key else self.link_type
+                target_name = names.get(note_key(target)) or os.path.basename(target)
+                if target_name != note["name"]:
+                    links.append((rel_type, target_name))
+            links = list(dict.fromkeys(links))
+            self._notes[relative] = (stat, note["sha256"], note["name"], links)
+            raw = {
+                "name": note["name"],
+                "description": note["description"],
+                "labels": note["labels"],
+                "tags": note["tags"],
+                "properties": note["properties"],
+                "relationships": [(rel_type, target, ">", {}) for rel_type, target in links],
+            }
+            yield relative, partial(dict, raw)
+
+    @staticmethod
+    def _add_note_name(names: Dict[str, str], relative: str, name: str) -> None:
+        """Make a note's node name resolvable by its path and its file name."""
+        names.setdefault(note_key(relative), name)
+        names.setdefault(note_key(relative.rsplit("/", 1)[-1]), name)
+
+    def _after_import(self, report: ImportReport) -> None:
+        """
+        Remove the links changed notes dropped and save the sync state.
+        """
+        failed = {location for location, _ in report.errors}
+        stale = []
+        for relative, (stat, digest, name, links) in self._notes.items():
+            if relative in failed:
+                continue
+            previous = self._state.notes.get(relative)
+            if previous:
+                kept = set(links) if previous["name"] == name else set()
+                start = self._ids.get(previous["name"])
+                for rel_type, target in map(tuple, previous["links"]):
+                    end = self._ids.get(target)
+                    if (rel_type, target) not in kept and start and end:
+                        stale.append((rel_type, {"start": start, "end": end}))
+            self._state.record(relative, stat, digest, name, links)
+
+        self._write_batches(
+            (
+                f"UNWIND $rows AS row "
+                f"MATCH (a)-[r:{quote_name(rel_type)}]->(b) "
+                f"WHERE elementId(a) = row.start AND elementId(b) = row.end "
+                f"DELETE r",
+                rows,
+            )
+            for rel_type, rows in self._batched(stale)
+        )
+        if self._is_cancelled:
+            return
+        logger.info("vault_links_removed", count=len(stale))
+        try:
+            self._state.save()
+        except OSError as e:
+            logger.warning("vault_state_save_failed", error=str(e))
+
+
+class MentionIndexWorker(ParallelWriteWorker):
+    """
+    Worker adding mention index entries from existing descriptions.
+
+    Descriptions are streamed from the database and matched with a
+    NameMatcher in the worker thread, so the scan never runs inside a save
+    transaction. Given names, such as those a save created, only
+    descriptions containing one of them are read and only those names are
+    linked. Without names, every description is matched against every node
+    name, which backfills the index for descriptions saved before it
+    existed. Entries are only added; saving a node replaces its own.
+
+    Args:
+        uri (str): The URI of the Neo4j database.
+        auth (tuple): A tuple containing the username and password for authentication.
+        batch_size (int): Rows per write transaction.
+        max_workers (int): Batches written concurrently.
+        relationship (str): Type of the mention relationships.
+        names (list): Names to link, or None to index every name.
+    """
+
+    mentions_indexed = pyqtSignal(int)  # number of mention entries written
+
+    def __init__(
+        self,
+        uri: str,
+        auth: Tuple[str, str],
+        batch_size: int,
+        max_workers: int,
+        relationship: str,
+        names: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize the worker with the names to link.
+
+        Args:
+            uri (str): The URI of the Neo4j database.
+            auth (tuple): A tuple containing the username and password for authentication.
+            batch_size (int): Rows per write transaction.
+            max_workers (int): Batches written concurrently.
+            relationship (str): Type of the mention relationships.
+            names (list): Names to link, or None to index every name.
+        """
+        super().__init__(uri, auth, batch_size, max_workers)
+        self.relationship = relationship
+        self.names = names
+
+    def execute_operation(self) -> None:
+        """
+        Match the descriptions and write their mention entries.
+        """
+        started = time.perf_counter()
+        with self._driver.session() as session:
+            ids = {
+                record["name"]: record["id"]
+                for record in session.run(
+                    "MATCH (n) WHERE n.name IS NOT NULL "
+                    "AND ($names IS NULL OR n.name IN $names) "
+                    "RETURN n.name AS name, elementId(n) AS id",
+                    names=self.names,
+                )
+            }
+        if not ids:
+            self.mentions_indexed.emit(0)
+            return
+
+        self._write_batches(
+            (
+                f"UNWIND $rows AS row "
+                f"MATCH (a), (b) "
+                f"WHERE elementId(a) = row.start AND elementId(b) = row.end "
+                f"MERGE (a)-[:{quote_name(self.relationship)}]->(b)",
+                rows,
+            )
+            for _, rows in self._batched(self._mentions(NameMatcher(ids), ids))
+        )
+        if self._is_cancelled:
+            logger.info("mention_index_cancelled", written=self._written)
+            return
+        logger.info(
+            "mentions_indexed",
+            names=len(ids),
+            mentions=self._written,
+            seconds=round(time.perf_counter() - started, 2),
+        )
+        self.mentions_indexed.emit(self._written)
+
+    def _mentions(
+        self, matcher: NameMatcher, ids: Dict[str, str]
+    ) -> Iterator[Tuple[None, Dict[str, str]]]:
+        """Yield a row per description mentioning one of the names."""
+        query = """
+            MATCH (source)
+            WHERE source._description_text IS NOT NULL
+              AND ($names IS NULL
+                   OR any(name IN $names WHERE source._description_text CONTAINS name))
+            RETURN source.name AS name,
+                   elementId(source) AS id,
+                   source._description_text AS text
+        """
+        with self._driver.session() as session:
+            for record in session.run(query, names=self.names):
+                if self._is_cancelled:
+                    return
+                mentioned = {name for _, _, name in matcher.find_all(record["text"])}
+                mentioned.discard(record["name"])
+                for name in mentioned:
+                    yield None, {"start": record["id"], "end": ids[name]}
+
+
 class BatchWorker(BaseNeo4jWorker):
     """
     Worker for batch operations.
@@ -387,9 +1488,14 @@ class SuggestionWorker(BaseNeo4jWorker):
         query = """
                 MATCH (n)
                 WHERE n.name = $node_name
-                OPTIONAL MATCH (n)-[r]->(m)
-                OPTIONAL MATCH (n)<-[r_in]-(m_in)
-                RETURN n,
+                OPTIONAL MATCH (n)-[r]->(m) WHERE NOT type(r) STARTS WITH '_'
+                OPTIONAL MATCH (n)<-[r_in]-(m_in) WHERE NOT type(r_in) STARTS WITH '_'
+                RETURN n {
+                           .*,
+                           description: coalesce(n._description_text, n.description),
+                           _description_text: null
+                       } AS n,
+                       labels(n) AS labels,
                        COLLECT(DISTINCT {
                            relationship: type(r),
                            target: m.name,
@@ -421,7 +1527,7 @@ class SuggestionWorker(BaseNeo4jWorker):
                 node_data = {
                     "name": node["name"],
                     "tags": node.get("tags", []),
-                    "labels": list(node.labels),
+                    "labels": result["labels"],
                     "properties": dict(node),
                     "relationships": relationships,
                 }
@@ -436,9 +1542,14 @@ class SuggestionWorker(BaseNeo4jWorker):
         query = """
                 MATCH (n)
                 WHERE ANY(label IN $node_labels WHERE label IN labels(n))
-                OPTIONAL MATCH (n)-[r]->(m)
-                OPTIONAL MATCH (n)<-[r_in]-(m_in)
-                RETURN n,
+                OPTIONAL MATCH (n)-[r]->(m) WHERE NOT type(r) STARTS WITH '_'
+                OPTIONAL MATCH (n)<-[r_in]-(m_in) WHERE NOT type(r_in) STARTS WITH '_'
+                RETURN n {
+                           .*,
+                           description: coalesce(n._description_text, n.description),
+                           _description_text: null
+                       } AS n,
+                       labels(n) AS labels,
                        COLLECT(DISTINCT {
                            relationship: type(r),
                            target: m.name,
@@ -471,7 +1582,7 @@ class SuggestionWorker(BaseNeo4jWorker):
                 node_data = {
                     "name": node["name"],
                     "tags": node.get("tags", []),
-                    "labels": list(node.labels),
+                    "labels": result["labels"],
                     "properties": dict(node),
                     "relationships": relationships,
                 }
@@ -484,9 +1595,14 @@ class SuggestionWorker(BaseNeo4jWorker):
         logger.debug("Fetching data for all nodes in the database")
         query = """
                 MATCH (n)
-                OPTIONAL MATCH (n)-[r]->(m)
-                OPTIONAL MATCH (n)<-[r_in]-(m_in)
-                RETURN n,
+                OPTIONAL MATCH (n)-[r]->(m) WHERE NOT type(r) STARTS WITH '_'
+                OPTIONAL MATCH (n)<-[r_in]-(m_in) WHERE NOT type(r_in) STARTS WITH '_'
+                RETURN n {
+                           .*,
+                           description: coalesce(n._description_text, n.description),
+                           _description_text: null
+                       } AS n,
+                       labels(n) AS labels,
                        COLLECT(DISTINCT {
                            relationship: type(r),
                            target: m.name,
@@ -518,7 +1634,7 @@ class SuggestionWorker(BaseNeo4jWorker):
                 node_data = {
                     "name": node["name"],
                     "tags": node.get("tags", []),
-                    "labels": list(node.labels),
+                    "labels": result["labels"],
                     "properties": dict(node),
                     "relationships": relationships,
                 }
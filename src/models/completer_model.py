@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Callable, Optional, Protocol
 
 from PyQt6.QtCore import Qt, QStringListModel
 from PyQt6.QtWidgets import QLineEdit, QTableWidget, QCompleter
@@ -13,6 +13,12 @@ class CompleterInput:
     model: QStringListModel
     case_sensitivity: Qt.CaseSensitivity = Qt.CaseSensitivity.CaseInsensitive
     filter_mode: Qt.MatchFlag = Qt.MatchFlag.MatchContains
+    # The model is already filtered and ranked, including fuzzy matches
+    completion_mode: QCompleter.CompletionMode = (
+        QCompleter.CompletionMode.UnfilteredPopupCompletion
+    )
+    # Complete only the last entry of a list joined by this separator
+    separator: Optional[str] = None
 
 
 class AutoCompletionUIHandler(Protocol):
@@ -31,3 +37,12 @@ class AutoCompletionUIHandler(Protocol):
     ) -> QLineEdit:
         """Create and setup a line edit widget for table cell"""
         ...
+
+    def setup_column_completer(
+        self,
+        table: QTableWidget,
+        column: int,
+        create_completer: Callable[[QLineEdit], QCompleter],
+    ) -> None:
+        """Give the editors of a table column a completer"""
+        ...
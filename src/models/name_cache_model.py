@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class NameDelta:
+    """
+    Node names added to or removed from the database by a single write.
+
+    Attributes:
+        added: Names of nodes created by the write, including stub targets
+        removed: Names of nodes deleted by the write
+        modified: The _modified timestamp written, if any
+        labels: Labels written to the saved node
+        tags: Tags written to the saved node
+        property_keys: Additional property keys written to the saved node
+    """
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: Optional[str] = None
+    labels: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    property_keys: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Check whether the write changed the set of node names."""
+        return not self.added and not self.removed
@@ -1,18 +1,28 @@
 import logging
+from pathlib import Path
 from typing import Any, List, Optional, Callable
 
+import appdirs
 from PyQt6.QtCore import QTimer, QStringListModel
-from PyQt6.QtWidgets import QLineEdit, QTableWidget
+from PyQt6.QtWidgets import QCompleter, QLineEdit, QTableWidget
 from structlog import get_logger
 
 from config.config import Config
 from core.neo4jmodel import Neo4jModel
 from models.completer_model import AutoCompletionUIHandler, CompleterInput
-from services.name_cache_service import NameCacheService
+from services.name_cache_service import CATALOG_KINDS, NameCacheService
 from services.worker_manager_service import WorkerManagerService
+from utils.completion_ranker import CompletionRanker
+from utils.name_cache_store import database_key
+from utils.usage_log import UsageLog
 
 logger = get_logger(__name__)
 
+# Prefix and infix candidates fetched per completion, as a multiple of the
+# result limit
+CANDIDATE_POOL_FACTOR = 10
+MIN_INFIX_LENGTH = 3  # Shortest text looked up anywhere in names
+
 
 class AutoCompletionService:
     """
@@ -27,6 +37,7 @@ class AutoCompletionService:
         ui_handler: AutoCompletionUIHandler,
         name_cache_service: NameCacheService,
         error_handler: Optional[Callable[[str], None]] = None,
+        usage_log: Optional[UsageLog] = None,
     ) -> None:
         self.model = model
         self.config = config
@@ -35,10 +46,24 @@ class AutoCompletionService:
         self.ui_handler = ui_handler
         self.error_handler = error_handler or self._default_error_handler
 
+        # Visits and edits feed the ranking of completion candidates
+        self.usage_log = usage_log or UsageLog(
+            Path(appdirs.user_data_dir("NeoWorldBuilder"))
+            / f"usage_{database_key(config.URI, config.USERNAME)}.json"
+        )
+        self.ranker = CompletionRanker(
+            self.usage_log, self.name_cache_service.get_degree
+        )
+
         # Initialize models for both completers
         self.node_name_model = QStringListModel()
         self.target_name_model = QStringListModel()
 
+        # Label, tag and property key completers read the schema catalogs
+        self.catalog_models = {kind: QStringListModel() for kind in CATALOG_KINDS}
+        self.name_cache_service.add_catalog_listener(self._refresh_catalog_models)
+        self._refresh_catalog_models()
+
         # Initialize debounce timer
         self.debounce_timer = self._setup_debounce_timer()
         self._current_completion_text: Optional[str] = None
@@ -78,6 +103,46 @@ class AutoCompletionService:
             )
             self.initialize_target_completer(line_edit)
 
+    def initialize_catalog_completer(
+        self, input_widget: QLineEdit, kind: str, separator: Optional[str] = None
+    ) -> None:
+        """
+        Initialize a completer offering the entries of a schema catalog.
+
+        Args:
+            input_widget: The input to complete
+            kind: One of "labels", "tags" or "property_keys"
+            separator: Set for inputs holding a list, such as "," for labels
+        """
+        input_widget.setCompleter(
+            self._create_catalog_completer(input_widget, kind, separator)
+        )
+
+    def initialize_property_key_completer(self, table: QTableWidget) -> None:
+        """Complete property keys typed in the key column of a properties table."""
+        self.ui_handler.setup_column_completer(
+            table,
+            0,
+            lambda editor: self._create_catalog_completer(editor, "property_keys"),
+        )
+
+    def _create_catalog_completer(
+        self, input_widget: QLineEdit, kind: str, separator: Optional[str] = None
+    ) -> QCompleter:
+        # Catalogs are small, so the completer filters them itself
+        completer_input = CompleterInput(
+            widget=input_widget,
+            model=self.catalog_models[kind],
+            completion_mode=QCompleter.CompletionMode.PopupCompletion,
+            separator=separator,
+        )
+        return self.ui_handler.create_completer(completer_input)
+
+    def _refresh_catalog_models(self) -> None:
+        """Copy the current schema catalogs into the completer models."""
+        for kind, model in self.catalog_models.items():
+            model.setStringList(self.name_cache_service.get_catalog(kind))
+
     # Rest of the original AutoCompletionService methods remain unchanged
     def debounce_completion(self, text: str, for_target: bool) -> None:
         """Debounce the completion request."""
@@ -96,24 +161,64 @@ class AutoCompletionService:
         text = self._current_completion_text.strip()
         model = self.target_name_model if self._for_target else self.node_name_model
 
-        # Use cached names
-        cached_names = self.name_cache_service.get_cached_names()
-        logger.debug("cached_names", names=cached_names)
+        candidates = self._candidates(text)
+
+        # Typo-tolerant matches only when exact matches are scarce
+        fuzzy: List[str] = []
+        if len(candidates) < self.config.COMPLETION_RESULT_LIMIT:
+            fuzzy = self.name_cache_service.get_fuzzy_matches(
+                text,
+                max_distance=1 if len(text) < 8 else 2,
+                limit=self.config.COMPLETION_RESULT_LIMIT,
+            )
+            candidates.extend(fuzzy)
+
+        ranked_names = self.ranker.rank(
+            text, candidates, self.config.COMPLETION_RESULT_LIMIT, fuzzy
+        )
         logger.debug(
             "fetching_matches",
             text=text,
-            cache_size=len(cached_names),
-            matches=len([n for n in cached_names if text in n.lower()]),
+            candidates=len(candidates),
+            matches=len(ranked_names),
+        )
+
+        model.setStringList(ranked_names)
+
+    def _candidates(self, text: str) -> List[str]:
+        """
+        Collect a bounded set of exact candidates for ranking.
+
+        The best prefix matches come from the prefix index, infix matches from
+        the trigram index up to the same cap, and recently used names are
+        added when they contain the text, so ranking cost does not grow with
+        the number of cached names.
+        """
+        pool_size = self.config.COMPLETION_RESULT_LIMIT * CANDIDATE_POOL_FACTOR
+        candidates = self.name_cache_service.get_matching_names(text, pool_size)
+        # Shorter texts match most names, so infix matches are left to the
+        # prefix and usage candidates rather than found with a scan
+        if len(text) >= MIN_INFIX_LENGTH:
+            candidates.extend(
+                self.name_cache_service.get_substring_matches(text, pool_size)
+            )
+        query = text.casefold()
+        candidates.extend(
+            name
+            for name in self.usage_log.names()
+            if query in name.casefold() and self.name_cache_service.has_name(name)
         )
+        return list(dict.fromkeys(candidates))
 
-        # Algorythm that matches partial inputs to cached names
-        matching_names: List = []
-        text_length = len(text)
-        for name in cached_names:
-            if text.lower() in name[:text_length].lower():
-                matching_names.append(name)
+    def record_visit(self, name: str) -> None:
+        """Record that a node was opened, for completion ranking."""
+        if name:
+            self.usage_log.record_visit(name)
 
-        model.setStringList(matching_names)
+    def record_edit(self, name: str) -> None:
+        """Record that a node was saved, for completion ranking."""
+        if name:
+            self.usage_log.record_edit(name)
 
     def _setup_debounce_timer(self) -> QTimer:
         """Setup and return the debounce timer."""
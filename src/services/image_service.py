@@ -1,22 +1,98 @@
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import appdirs
+from PyQt6.QtCore import QSize, QThread, pyqtSignal
+from PyQt6.QtGui import QImage
 from PyQt6.QtWidgets import QWidget
+from structlog import get_logger
 
 from models.image_model import ImageResult
 from ui.providers.dialog_provider import ImageDialogProvider, DefaultImageDialogProvider
+from utils.image_cache import DecodedImageCache, decode_scaled
+from utils.thumbnail_store import ThumbnailStore
+
+logger = get_logger(__name__)
+
+# Path, modification time and target width and height of a decoded image
+ImageKey = Tuple[str, int, int, int]
+
+
+class ImageDecodeWorker(QThread):
+    """Thread for decoding an image at its display resolution."""
+
+    decoded = pyqtSignal(object)  # QImage
+    failed = pyqtSignal(str)
+
+    def __init__(self, image_path: str, max_size: QSize):
+        super().__init__()
+        self.image_path = image_path
+        self.max_size = max_size
+
+    def run(self):
+        try:
+            image = decode_scaled(self.image_path, self.max_size)
+        except ValueError as e:
+            self.failed.emit(str(e))
+            return
+        self.decoded.emit(image)
+
+
+class ThumbnailWorker(QThread):
+    """Thread for generating the thumbnails of a list of images."""
+
+    thumbnail_ready = pyqtSignal(str, object)  # source path, index entry
+    progress_updated = pyqtSignal(int, int)  # done, total
+
+    def __init__(self, store: ThumbnailStore, image_paths: List[str]):
+        super().__init__()
+        self.store = store
+        self.image_paths = image_paths
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Stop after the current image."""
+        self._cancelled = True
+
+    def run(self):
+        total = len(self.image_paths)
+        for done, path in enumerate(self.image_paths, start=1):
+            if self._cancelled:
+                return
+            try:
+                entry = self.store.generate(path)
+            except (OSError, ValueError) as e:
+                logger.warning("thumbnail_generation_failed", path=path, error=str(e))
+            else:
+                self.thumbnail_ready.emit(path, entry)
+            self.progress_updated.emit(done, total)
 
 
 class ImageService:
     """Service for managing node images."""
 
     def __init__(
-        self, dialog_provider: ImageDialogProvider = DefaultImageDialogProvider()
+        self,
+        config,
+        dialog_provider: ImageDialogProvider = DefaultImageDialogProvider(),
     ) -> None:
         """
         Initialize the ImageService.
 
         Args:
+            config: Application configuration
             dialog_provider: Provider for file dialogs, defaults to QFileDialog implementation
         """
         self.dialog_provider = dialog_provider
+        self.cache = DecodedImageCache(config.DECODED_IMAGE_CACHE_MB * 1024 * 1024)
+        self._pending: Dict[
+            ImageKey, List[Tuple[Callable[[QImage], None], Callable[[str], None]]]
+        ] = {}
+        self._active_workers = set()  # Keep threads referenced until they finish
+        self.thumbnails = ThumbnailStore(
+            os.path.join(appdirs.user_cache_dir("NeoWorldBuilder"), "thumbnails"),
+            config.THUMBNAIL_SIZES,
+        )
 
     def select_image(self, parent: QWidget) -> ImageResult:
         """
@@ -33,8 +109,133 @@ class ImageService:
                 parent, "Select Image", "", "Image Files (*.png *.jpg *.bmp)"
             )
             if file_name:
+                self.generate_thumbnails([file_name])
                 return ImageResult(True, path=file_name)
             return ImageResult(False)
 
         except Exception as e:
             return ImageResult(False, error_message=str(e))
+
+    def load_image(
+        self,
+        image_path: str,
+        max_size: QSize,
+        on_loaded: Callable[[QImage], None],
+        on_failed: Callable[[str], None],
+    ) -> None:
+        """
+        Get an image decoded at no more than a display size.
+
+        Cached images are delivered immediately; otherwise the image is
+        decoded in a worker thread and the callbacks run on its completion.
+        A stored thumbnail large enough for the size is decoded instead of
+        the source. Concurrent requests for the same image share one decode.
+        A changed file gets a new modification time and is decoded again.
+
+        Args:
+            image_path: Path of the image file
+            max_size: Bounding size in device pixels
+            on_loaded: Called with the decoded image
+            on_failed: Called with an error message
+        """
+        thumbnail = self.thumbnails.lookup(
+            image_path, max(max_size.width(), max_size.height())
+        )
+        if thumbnail:
+            image_path = thumbnail
+
+        try:
+            mtime = os.stat(image_path).st_mtime_ns
+        except OSError as e:
+            on_failed(str(e))
+            return
+
+        key = (image_path, mtime, max_size.width(), max_size.height())
+        image = self.cache.get(key)
+        if image is not None:
+            on_loaded(image)
+            return
+
+        if key in self._pending:
+            self._pending[key].append((on_loaded, on_failed))
+            return
+        self._pending[key] = [(on_loaded, on_failed)]
+
+        worker = ImageDecodeWorker(image_path, max_size)
+        worker.decoded.connect(lambda image, key=key: self._on_decoded(key, image))
+        worker.failed.connect(lambda message, key=key: self._on_failed(key, message))
+        self._active_workers.add(worker)
+        worker.finished.connect(lambda w=worker: self._active_workers.discard(w))
+        worker.start()
+
+    def _on_decoded(self, key: ImageKey, image: QImage) -> None:
+        """Cache a decoded image and deliver it to every waiting request."""
+        self.cache.put(key, image)
+        for on_loaded, _ in self._pending.pop(key, []):
+            on_loaded(image)
+
+    def _on_failed(self, key: ImageKey, message: str) -> None:
+        """Report a failed decode to every waiting request."""
+        logger.warning("image_decode_failed", path=key[0], error=message)
+        for _, on_failed in self._pending.pop(key, []):
+            on_failed(message)
+
+    def generate_thumbnails(
+        self,
+        image_paths: List[str],
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_finished: Optional[Callable[[int], None]] = None,
+    ) -> Optional[ThumbnailWorker]:
+        """
+        Generate the missing thumbnails of images in a worker thread.
+
+        Args:
+            image_paths: Paths of source images
+            on_progress: Optional callback receiving done and total counts
+            on_finished: Optional callback receiving the number of images
+                whose thumbnails were generated
+
+        Returns:
+            Optional[ThumbnailWorker]: The running worker, which can be
+            cancelled, or None if no thumbnails were missing.
+        """
+        missing = self.thumbnails.missing(image_paths)
+        if not missing:
+            if on_finished:
+                on_finished(0)
+            return None
+
+        generated: List[Tuple[str, Dict[str, Any]]] = []
+        worker = ThumbnailWorker(self.thumbnails, missing)
+        worker.thumbnail_ready.connect(
+            lambda path, entry: generated.append((path, entry))
+        )
+        if on_progress:
+            worker.progress_updated.connect(on_progress)
+        worker.finished.connect(
+            lambda w=worker: self._on_thumbnails_finished(w, generated, on_finished)
+        )
+        self._active_workers.add(worker)
+        worker.start()
+        return worker
+
+    def _on_thumbnails_finished(
+        self,
+        worker: ThumbnailWorker,
+        generated: List[Tuple[str, Dict[str, Any]]],
+        on_finished: Optional[Callable[[int], None]],
+    ) -> None:
+        """Record the generated thumbnails in the store index."""
+        self._active_workers.discard(worker)
+        for path, entry in generated:
+            self.thumbnails.record(path, entry)
+        if generated:
+            try:
+                self.thumbnails.save_index()
+            except OSError as e:
+                logger.warning("thumbnail_index_save_failed", error=str(e))
+        logger.info(
+            "thumbnails_generated", count=len(generated), requested=len(worker.image_paths)
+        )
+        if on_finished:
+            on_finished(len(generated))
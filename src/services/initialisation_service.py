@@ -85,7 +85,7 @@ class InitializationService:
         """Initialize all application services in dependency order."""
         # 1. Basic services that have no dependencies
         self.property_service = PropertyService(self.config)
-        self.image_service = ImageService()
+        self.image_service = ImageService(self.config)
 
         # 2. Core services that others depend on
         self.worker_manager = WorkerManagerService(self.error_handler)
@@ -94,8 +94,8 @@ class InitializationService:
         self.fast_inject_service = FastInjectService()
         self.exporter = Exporter(self.ui, self.config)
 
-        # Initialize the name cache for the first time
-        self.name_cache_service.rebuild_cache()
+        # Warm the name cache from disk, rebuilding in the background if stale
+        self.name_cache_service.initialize()
 
         # Services requiring UI
         self.auto_completion_service = AutoCompletionService(
@@ -114,6 +114,8 @@ class InitializationService:
             self.property_service,
             self.error_handler,
         )
+        # Index descriptions saved before the mention index existed
+        self.node_operations.backfill_mentions_once()
 
         self.suggestion_service = SuggestionService(
             self.model,
@@ -166,6 +168,7 @@ class InitializationService:
         self.controller.relationship_tree_service = self.relationship_tree_service
         self.controller.search_service = self.search_service
         self.ui.description_input.name_cache_service = self.name_cache_service
+        self.ui.image_group.image_service = self.image_service
 
         # Initialize search panel handlers
 
@@ -189,8 +192,17 @@ class InitializationService:
         self.ui.tree_view.setHeaderHidden(False)
 
     def _initialize_completers(self) -> None:
-        """Initialize auto-completion for node names and relationship targets."""
+        """Initialize auto-completion for node names, labels, tags and properties."""
         self.auto_completion_service.initialize_node_completer(self.ui.name_input)
+        self.auto_completion_service.initialize_catalog_completer(
+            self.ui.labels_input, "labels", separator=","
+        )
+        self.auto_completion_service.initialize_catalog_completer(
+            self.ui.tags_input, "tags", separator=","
+        )
+        self.auto_completion_service.initialize_property_key_completer(
+            self.ui.properties_table
+        )
 
     def _connect_signals(self) -> None:
         """Connect all UI signals to handlers."""
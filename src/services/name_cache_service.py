@@ -1,11 +1,22 @@
-from typing import Set, List, Callable
+import time
+from typing import Set, List, Callable, Any, Optional, Dict
 
+from PyQt6.QtCore import QTimer
 from structlog import get_logger
 
+from models.name_cache_model import NameDelta
 from models.worker_model import WorkerOperation
+from utils.name_cache_store import NameCacheStore
+from utils.name_index import NamePrefixIndex
+from utils.name_matcher import NameMatcher
+from utils.trigram_index import TrigramIndex, supports_fuzzy
 
 logger = get_logger(__name__)
 
+CATALOG_KINDS = ("labels", "tags", "property_keys")
+# Shorter texts match too many names with a typo to be useful
+MIN_FUZZY_PREFIX_LENGTH = 3
+
 
 class NameCacheService:
     def __init__(
@@ -13,23 +24,122 @@ class NameCacheService:
         model: "Neo4jModel",
         worker_manager: "WorkerManagerService",
         error_handler: Callable[[str], None],
+        check_interval: int = 60000,  # Drift check every 60 seconds
+        store: Optional[NameCacheStore] = None,
     ) -> None:
         self.model = model
         self.worker_manager = worker_manager
         self.error_handler = error_handler
+        self.store = store
         self._name_cache: Set[str] = set()
+        self._name_index = NamePrefixIndex()
+        self._trigram_index = TrigramIndex()
+        self._name_matcher = NameMatcher()
         self._name_cache_valid = False
+        self._catalogs: Dict[str, Set[str]] = {kind: set() for kind in CATALOG_KINDS}
+        self._degrees: Dict[str, int] = {}
+        self._change_listeners: List[Callable[[], None]] = []
+        self._catalog_listeners: List[Callable[[], None]] = []
+
+        # Whether the in-memory state differs from the persisted file
+        self._dirty = False
+
+        # Latest _modified stamp known to be reflected in the cache.
+        # None means the next matching checksum is adopted as the baseline.
+        self._last_modified: Optional[str] = None
+
+        # Periodic drift detection against the database checksum
+        self.check_timer = QTimer()
+        self.check_timer.setInterval(check_interval)
+        self.check_timer.timeout.connect(self.check_for_drift)
+
+    def initialize(self) -> None:
+        """
+        Warm the cache from disk and validate it in the background.
+
+        Falls back to a full rebuild when no usable persisted cache exists.
+        """
+        if self.load_persisted():
+            self.check_for_drift()
+            self.refresh_degrees()
+            self.check_timer.start()
+        else:
+            self.rebuild_cache()
+
+    def load_persisted(self) -> bool:
+        """
+        Synchronously load the persisted names and catalogs.
+
+        Returns:
+            bool: True if a persisted cache was loaded.
+        """
+        if not self.store:
+            return False
+
+        start = time.perf_counter()
+        loaded = self.store.load()
+        if not loaded:
+            return False
+
+        stamp, sections = loaded
+        count, _, last_modified = stamp.partition("\t")
+        names = sections.get("names", [])
+        if not last_modified or not count.isdigit() or int(count) != len(names):
+            return False
+
+        self._name_cache = set(names)
+        self._name_index.rebuild(names)
+        self._trigram_index.rebuild(names)
+        self._name_matcher.rebuild(names)
+        self._catalogs = {
+            kind: set(sections.get(kind, [])) for kind in CATALOG_KINDS
+        }
+        self._name_cache_valid = True
+        self._last_modified = last_modified
+        self._dirty = False
+
+        self._notify_change()
+        self._notify_catalog_change()
+        logger.info(
+            "name_cache_loaded_from_disk",
+            cache_size=len(self._name_cache),
+            elapsed_ms=round((time.perf_counter() - start) * 1000, 1),
+        )
+        return True
+
+    def persist(self) -> None:
+        """Write the cache to disk if it changed and its version stamp is known."""
+        if not self.store or not self._dirty or self._last_modified is None:
+            return
+
+        stamp = f"{len(self._name_cache)}\t{self._last_modified}"
+        sections = {"names": self._name_cache, **self._catalogs}
+        try:
+            self.store.save(stamp, sections)
+            self._dirty = False
+        except OSError as e:
+            logger.warning("name_cache_persist_failed", error=str(e))
 
     def rebuild_cache(self) -> None:
-        """Rebuild the name cache from database."""
+        """Rebuild the name cache and catalogs from database."""
 
         def handle_names(result: List[str]) -> None:
             if result:
                 self._name_cache = set(result)
+                self._name_index.rebuild(self._name_cache)
+                self._trigram_index.rebuild(self._name_cache)
+                self._name_matcher.rebuild(self._name_cache)
                 self._name_cache_valid = True
+                self._last_modified = None
+                self._dirty = True
+                self._notify_change()
                 logger.info("Name Cache built", cache_size=len(self._name_cache))
-                # log the actually cached names as strings
-                logger.debug("Names cached", cached_names=str(self._name_cache))
+
+                # Establish the version stamp so the rebuilt cache can be persisted
+                self.check_for_drift()
+
+                if not self.check_timer.isActive():
+                    self.check_timer.start()
 
         worker = self.model.get_all_node_names(handle_names)
         operation = WorkerOperation(
@@ -41,12 +151,192 @@ class NameCacheService:
             operation_name="rebuild_name_cache",
         )
         self.worker_manager.execute_worker("name_cache", operation)
+        self.refresh_catalogs()
+        self.refresh_degrees()
+
+    def refresh_catalogs(self) -> None:
+        """Reload the label, tag and property key catalogs from database."""
+
+        def handle_catalogs(records: List[Any]) -> None:
+            if not records:
+                return
+            self._catalogs = {
+                kind: set(records[0][kind] or []) for kind in CATALOG_KINDS
+            }
+            self._dirty = True
+            self._notify_catalog_change()
+            logger.debug(
+                "schema_catalogs_refreshed",
+                **{kind: len(values) for kind, values in self._catalogs.items()},
+            )
+
+        worker = self.model.get_schema_catalog(handle_catalogs)
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=handle_catalogs,
+            error_callback=lambda msg: logger.warning(
+                "schema_catalog_refresh_failed", error=msg
+            ),
+            operation_name="refresh_schema_catalog",
+        )
+        self.worker_manager.execute_worker("schema_catalog", operation)
+
+    def refresh_degrees(self) -> None:
+        """Reload node relationship counts used for completion ranking."""
+
+        def handle_degrees(records: List[Any]) -> None:
+            self._degrees = {record["name"]: record["degree"] for record in records}
+            logger.debug("node_degrees_refreshed", nodes=len(self._degrees))
+
+        worker = self.model.get_node_degrees(handle_degrees)
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=handle_degrees,
+            error_callback=lambda msg: logger.warning(
+                "node_degree_refresh_failed", error=msg
+            ),
+            operation_name="refresh_node_degrees",
+        )
+        self.worker_manager.execute_worker("node_degrees", operation)
+
+    def apply_delta(self, delta: NameDelta) -> None:
+        """
+        Apply names added or removed by a write without reloading the cache.
+
+        Args:
+            delta: The name changes reported by the save or delete transaction
+        """
+        for name in delta.removed:
+            self._name_cache.discard(name)
+            self._name_index.remove(name)
+            self._trigram_index.remove(name)
+            self._name_matcher.remove(name)
+
+        for name in delta.added:
+            if name not in self._name_cache:
+                self._name_cache.add(name)
+                self._name_index.add(name)
+                self._trigram_index.add(name)
+                self._name_matcher.add(name)
+
+        catalog_sizes = [len(values) for values in self._catalogs.values()]
+        self._catalogs["labels"].update(delta.labels)
+        self._catalogs["tags"].update(delta.tags)
+        self._catalogs["property_keys"].update(delta.property_keys)
+        self._dirty = True
+
+        if delta.removed:
+            # Deleting may lower the database's max _modified, so re-baseline
+            self._last_modified = None
+        elif delta.modified and self._last_modified is not None:
+            self._last_modified = max(self._last_modified, delta.modified)
+
+        if not delta.is_empty():
+            self._notify_change()
+        if catalog_sizes != [len(values) for values in self._catalogs.values()]:
+            self._notify_catalog_change()
+
+        logger.debug(
+            "name_cache_delta_applied",
+            added=len(delta.added),
+            removed=len(delta.removed),
+            cache_size=len(self._name_cache),
+        )
+
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback invoked whenever the set of cached names changes.
+
+        Args:
+            listener: Function called without arguments
+        """
+        self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Unregister a callback added with add_change_listener.
+
+        Args:
+            listener: The registered function; unknown functions are ignored
+        """
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def add_catalog_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback invoked whenever a schema catalog changes.
+
+        Args:
+            listener: Function called without arguments
+        """
+        self._catalog_listeners.append(listener)
+
+    def _notify_catalog_change(self) -> None:
+        """Notify listeners that the label, tag or property key catalogs changed."""
+        for listener in self._catalog_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error("catalog_listener_failed", error=str(e))
+
+    def _notify_change(self) -> None:
+        """Notify listeners that the set of cached names changed."""
+        for listener in self._change_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error("name_cache_listener_failed", error=str(e))
+
+    def check_for_drift(self) -> None:
+        """Compare the cache with the database checksum and rebuild on mismatch."""
+        if not self._name_cache_valid:
+            return
+
+        def handle_checksum(records: List[Any]) -> None:
+            if not records:
+                return
+            count = records[0]["count"]
+            last_modified = records[0]["last_modified"]
+
+            if count == len(self._name_cache) and (
+                self._last_modified is None or last_modified == self._last_modified
+            ):
+                self._last_modified = last_modified
+                self.persist()
+                return
+
+            # Keep serving the stale names until the rebuild lands
+            logger.info(
+                "name_cache_drift_detected",
+                cache_size=len(self._name_cache),
+                database_count=count,
+            )
+            self.rebuild_cache()
+
+        worker = self.model.get_name_checksum(handle_checksum)
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=handle_checksum,
+            error_callback=lambda msg: logger.warning(
+                "name_cache_checksum_failed", error=msg
+            ),
+            operation_name="name_cache_checksum",
+        )
+        self.worker_manager.execute_worker("name_cache_checksum", operation)
+
+    def stop_drift_check(self) -> None:
+        """Stop periodic drift detection."""
+        self.check_timer.stop()
 
     def invalidate_cache(self) -> None:
         """Mark name cache as invalid."""
         self._name_cache_valid = False
         logger.debug("name_cache_invalidated")
 
+    def is_valid(self) -> bool:
+        """Whether the cached names reflect the database."""
+        return self._name_cache_valid
+
     def ensure_valid_cache(self) -> None:
         """Ensure name cache is valid, rebuilding if necessary."""
         if not self._name_cache_valid:
@@ -58,3 +348,87 @@ class NameCacheService:
         if not self._name_cache:
             logger.warning("name_cache_empty_after_validation")
         return self._name_cache.copy()  # Return copy to prevent external modification
+
+    def has_name(self, name: str) -> bool:
+        """Check whether a node name is cached, without triggering a rebuild."""
+        return name in self._name_cache
+
+    def get_matching_names(self, prefix: str, limit: int = 0) -> List[str]:
+        """
+        Get cached node names starting with a prefix, compared case-insensitively.
+
+        Args:
+            prefix: The prefix typed by the user
+            limit: Maximum number of names to return, 0 for no limit
+
+        Returns:
+            Matching names in alphabetical order
+        """
+        self.ensure_valid_cache()
+        return self._name_index.prefix_matches(prefix, limit)
+
+    def get_substring_matches(self, text: str, limit: int = 0) -> List[str]:
+        """
+        Get cached node names containing a text, compared case-insensitively.
+
+        Args:
+            text: The text typed by the user
+            limit: Maximum number of names to return, 0 for no limit
+
+        Returns:
+            Matching names in no particular order
+        """
+        self.ensure_valid_cache()
+        return self._trigram_index.substring_matches(text, limit)
+
+    def get_fuzzy_matches(
+        self, text: str, max_distance: int = 1, limit: int = 0
+    ) -> List[str]:
+        """
+        Get cached node names containing a text with up to max_distance typos.
+
+        Texts too short for max_distance use the largest distance they
+        support; texts too short for trigram matching at all fall back to
+        names starting with the text with one typo.
+
+        Args:
+            text: The text typed by the user
+            max_distance: Maximum number of edits
+            limit: Maximum number of names to return, 0 for no limit
+
+        Returns:
+            Matching names, closest first
+        """
+        self.ensure_valid_cache()
+        for distance in range(max_distance, 0, -1):
+            if supports_fuzzy(text, distance):
+                return self._trigram_index.fuzzy_matches(text, distance, limit)
+        if len(text.strip()) < MIN_FUZZY_PREFIX_LENGTH:
+            return []
+        return self._name_index.fuzzy_prefix_matches(text.strip(), limit)
+
+    def get_name_matcher(self) -> NameMatcher:
+        """
+        Get the matcher for linking node names in text.
+
+        The matcher is kept up to date with the cache and must not be modified.
+        It does not trigger a rebuild, as it is queried per text block; change
+        listeners are notified once names become available.
+        """
+        return self._name_matcher
+
+    def get_degree(self, name: str) -> int:
+        """Get the last known relationship count of a node, 0 if unknown."""
+        return self._degrees.get(name, 0)
+
+    def get_catalog(self, kind: str) -> List[str]:
+        """
+        Get a cached schema catalog.
+
+        Args:
+            kind: One of "labels", "tags" or "property_keys"
+
+        Returns:
+            The catalog entries in alphabetical order
+        """
+        return sorted(self._catalogs[kind])
@@ -1,7 +1,10 @@
 import json
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Callable
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Callable
+
+import appdirs
 
 from config.config import Config
 from core.neo4jmodel import Neo4jModel
@@ -10,6 +13,7 @@ from models.worker_model import WorkerOperation
 from services.property_service import PropertyService
 from services.worker_manager_service import WorkerManagerService
 from utils.error_handler import ErrorHandler
+from utils.name_cache_store import database_key
 from utils.parsers import parse_comma_separated
 from utils.validation import (
     ValidationResult,
@@ -60,6 +64,13 @@ class NodeOperationsService:
         self.property_service = property_service
         self.error_handler = error_handler
 
+        # Mention indexing runs one job at a time; requests made meanwhile
+        # are merged into the next job
+        self._mention_job_running = False
+        self._pending_mention_names: Set[str] = set()
+        self._pending_mention_backfill = False
+        self._mention_callbacks: List[Callable[[int], None]] = []
+
     def save_node(
         self, node_data: Dict[str, Any], success_callback: Callable[[Any], None]
     ) -> None:
@@ -112,6 +123,368 @@ class NodeOperationsService:
 
         self.worker_manager.execute_worker("load", operation)
 
+    def load_node_fields(
+        self,
+        name: str,
+        keys: List[str],
+        success_callback: Callable[[List[Any]], None],
+    ) -> None:
+        """Load the large fields of a node that load_node deferred.
+
+        Args:
+            name: Name of the node
+            keys: The deferred property keys
+            success_callback: Callback receiving records with "key" and "value"
+        """
+        if not name.strip() or not keys:
+            return
+
+        worker = self.model.load_node_fields(name, keys, success_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=lambda msg: self.error_handler.handle_error(
+                f"Error loading node fields: {msg}"
+            ),
+            operation_name="load_node_fields",
+        )
+
+        self.worker_manager.execute_worker("node_fields", operation)
+
+    def load_map_pins(
+        self, name: str, success_callback: Callable[[List[Any]], None]
+    ) -> None:
+        """Load the pins of a map node.
+
+        Args:
+            name: Name of the map node
+            success_callback: Callback receiving records with "target", "x",
+                "y", "geometry_type" and "geometry" fields
+        """
+        if not name.strip():
+            return
+
+        worker = self.model.get_map_pins(name, success_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=lambda msg: self.error_handler.handle_error(
+                f"Error loading map pins: {msg}"
+            ),
+            operation_name="load_map_pins",
+        )
+
+        self.worker_manager.execute_worker("map_pins", operation)
+
+    def export_nodes(
+        self,
+        names: List[str],
+        consume: Callable[[Iterable[Dict[str, Any]]], None],
+        progress_callback: Callable[[int, int], None],
+        success_callback: Callable[[int], None],
+        error_callback: Callable[[str], None],
+    ) -> None:
+        """Stream the data of several nodes from the database into a consumer.
+
+        Args:
+            names: Names of the nodes to export
+            consume: Function consuming the iterator of node data in the
+                worker thread, typically an export writer
+            progress_callback: Callback receiving done and total counts
+            success_callback: Callback receiving the number of exported nodes
+            error_callback: Callback receiving an error message
+        """
+        worker = self.model.export_nodes(names, consume, success_callback)
+        worker.export_progress.connect(progress_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=error_callback,
+            operation_name="export_nodes",
+        )
+
+        self.worker_manager.execute_worker("export", operation)
+
+    def load_export_versions(
+        self, names: List[str], success_callback: Callable[[Dict[str, str]], None]
+    ) -> None:
+        """Load the export version of several nodes.
+
+        Args:
+            names: Names of the nodes
+            success_callback: Callback receiving the versions by node name
+        """
+        worker = self.model.get_export_versions(names, success_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=lambda msg: self.error_handler.handle_error(
+                f"Error loading export versions: {msg}"
+            ),
+            operation_name="load_export_versions",
+        )
+
+        self.worker_manager.execute_worker("export_versions", operation)
+
+    def cancel_export(self) -> None:
+        """Cancel the running export, discarding its partial output."""
+        self.worker_manager.cancel_worker("export")
+
+    def backup_world(
+        self,
+        file_name: str,
+        progress_callback: Callable[[int, int], None],
+        success_callback: Callable[[Dict[str, int]], None],
+        error_callback: Callable[[str], None],
+    ) -> None:
+        """Write the whole world to a backup file.
+
+        Args:
+            file_name: Path of the backup file
+            progress_callback: Callback receiving done and total counts
+            success_callback: Callback receiving the node and relationship counts
+            error_callback: Callback receiving an error message
+        """
+        worker = self.model.backup_world(file_name, success_callback)
+        worker.backup_progress.connect(progress_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=error_callback,
+            operation_name="backup_world",
+        )
+
+        self.worker_manager.execute_worker("backup", operation)
+
+    def restore_world(
+        self,
+        file_name: str,
+        progress_callback: Callable[[int, int], None],
+        success_callback: Callable[[Dict[str, int]], None],
+        error_callback: Callable[[str], None],
+        committing_callback: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Replace the whole world with a backup.
+
+        Args:
+            file_name: Path of the backup file
+            progress_callback: Callback receiving written and total counts
+            success_callback: Callback receiving the node and relationship counts
+            error_callback: Callback receiving an error message
+            committing_callback: Optional callback once the backup is written
+                and the current world is being replaced, which can no longer
+                be cancelled
+        """
+        worker = self.model.restore_world(file_name, success_callback)
+        worker.write_progress.connect(progress_callback)
+        if committing_callback:
+            worker.restore_committing.connect(committing_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=error_callback,
+            operation_name="restore_world",
+        )
+
+        self.worker_manager.execute_worker("backup", operation)
+
+    def import_nodes(
+        self,
+        path: str,
+        progress_callback: Callable[[int, int], None],
+        success_callback: Callable[[Any], None],
+        error_callback: Callable[[str], None],
+    ) -> None:
+        """Import nodes from a CSV, JSON Lines or Fast Inject source.
+
+        Args:
+            path: A CSV or JSON Lines file, or a directory of .fi files
+            progress_callback: Callback receiving written and total counts;
+                the total is 0 as the source is streamed
+            success_callback: Callback receiving the ImportReport
+            error_callback: Callback receiving an error message
+        """
+        worker = self.model.import_nodes(path, success_callback)
+        worker.write_progress.connect(progress_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=error_callback,
+            operation_name="import_nodes",
+        )
+
+        self.worker_manager.execute_worker("import", operation)
+
+    def import_vault(
+        self,
+        path: str,
+        progress_callback: Callable[[int, int], None],
+        success_callback: Callable[[Any], None],
+        error_callback: Callable[[str], None],
+    ) -> None:
+        """Import the notes of a Markdown vault changed since the last import.
+
+        Args:
+            path: The vault directory
+            progress_callback: Callback receiving written and total counts;
+                the total is 0 as the vault is streamed
+            success_callback: Callback receiving the ImportReport
+            error_callback: Callback receiving an error message
+        """
+        worker = self.model.import_vault(path, success_callback)
+        worker.write_progress.connect(progress_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=error_callback,
+            operation_name="import_vault",
+        )
+
+        self.worker_manager.execute_worker("vault_import", operation)
+
+    def cancel_import(self) -> None:
+        """Cancel the running import, keeping the batches already written."""
+        self.worker_manager.request_cancel("import")
+
+    def cancel_vault_import(self) -> None:
+        """Cancel the running vault import, keeping the batches already written."""
+        self.worker_manager.request_cancel("vault_import")
+
+    def cancel_backup(self) -> None:
+        """Cancel the running backup or restore, leaving the world as it was."""
+        self.worker_manager.request_cancel("backup")
+
+    def load_image_paths(
+        self, success_callback: Callable[[List[str]], None]
+    ) -> None:
+        """Load the distinct image paths referenced by nodes.
+
+        Args:
+            success_callback: Callback receiving the list of paths
+        """
+        worker = self.model.get_image_paths(success_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=lambda msg: self.error_handler.handle_error(
+                f"Error loading image paths: {msg}"
+            ),
+            operation_name="load_image_paths",
+        )
+
+        self.worker_manager.execute_worker("image_paths", operation)
+
+    def load_mentioned_by(
+        self, name: str, success_callback: Callable[[List[Any]], None]
+    ) -> None:
+        """Load the names of nodes whose descriptions mention a node.
+
+        Args:
+            name: Name of the mentioned node
+            success_callback: Callback receiving records with a "name" field
+        """
+        if not name.strip():
+            return
+
+        worker = self.model.get_mentioned_by(name, success_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=lambda msg: self.error_handler.handle_error(
+                f"Error loading mentions: {msg}"
+            ),
+            operation_name="load_mentioned_by",
+        )
+
+        self.worker_manager.execute_worker("mentioned_by", operation)
+
+    def index_mentions(
+        self,
+        names: Optional[List[str]] = None,
+        success_callback: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """Add mention index entries from existing descriptions in the background.
+
+        Args:
+            names: Names to link, such as the nodes a save created, or None
+                to backfill the index for every name
+            success_callback: Callback receiving the number of entries written
+        """
+        if names is None:
+            self._pending_mention_backfill = True
+        else:
+            self._pending_mention_names.update(names)
+        if success_callback:
+            self._mention_callbacks.append(success_callback)
+        if not self._mention_job_running:
+            self._start_mention_job()
+
+    def backfill_mentions_once(self) -> None:
+        """Backfill the mention index once per database.
+
+        Descriptions saved before the index existed have no entries; a
+        marker file records that the backfill completed.
+        """
+        marker = Path(appdirs.user_data_dir("NeoWorldBuilder")) / (
+            f"mentions_{database_key(self.config.URI, self.config.USERNAME)}.done"
+        )
+        if marker.exists():
+            return
+
+        def on_done(count: int) -> None:
+            try:
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.touch()
+            except OSError as e:
+                logging.warning(f"Could not record the mention backfill: {e}")
+
+        self.index_mentions(None, on_done)
+
+    def _start_mention_job(self) -> None:
+        """Start a mention indexing job for the pending requests, if any."""
+        if not self._pending_mention_backfill and not self._pending_mention_names:
+            self._mention_job_running = False
+            return
+
+        names = (
+            None
+            if self._pending_mention_backfill
+            else sorted(self._pending_mention_names)
+        )
+        callbacks = self._mention_callbacks
+        self._pending_mention_backfill = False
+        self._pending_mention_names = set()
+        self._mention_callbacks = []
+
+        def on_indexed(count: int) -> None:
+            for callback in callbacks:
+                callback(count)
+
+        self._mention_job_running = True
+        worker = self.model.index_mentions(names, on_indexed)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=on_indexed,
+            error_callback=lambda msg: self.error_handler.handle_error(
+                f"Error indexing mentions: {msg}"
+            ),
+            finished_callback=self._start_mention_job,
+            operation_name="index_mentions",
+        )
+
+        self.worker_manager.execute_worker("mention_index", operation)
+
     def delete_node(self, name: str, success_callback: Callable[[Any], None]) -> None:
         """Delete node using worker thread.
 
@@ -378,7 +378,7 @@ class FieldSearchBuilder:
                 field_search.exact_match,
             ),
             SearchField.DESCRIPTION: lambda: TextSearchBuilder.build_condition(
-                "n.description",
+                "coalesce(n._description_text, n.description)",
                 param_ref,
                 field_search.case_sensitive,
                 field_search.exact_match,
@@ -438,8 +438,12 @@ class FilterClauseBuilder(ClauseBuilder):
 
         # Changed to use pattern predicate for relationship check
         if self.criteria.has_relationships is not None:
+            # System relationships such as mentions do not count
+            has_relationship = "EXISTS { (n)-[r]-() WHERE NOT type(r) STARTS WITH '_' }"
             clauses.append(
-                "()-[]-(n)" if self.criteria.has_relationships else "NOT ()-[]-(n)"
+                has_relationship
+                if self.criteria.has_relationships
+                else f"NOT {has_relationship}"
             )
 
         # Changed to use pattern predicates for relationship types
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 
 from PyQt6.QtCore import QObject
 
@@ -12,6 +12,8 @@ class WorkerManagerService(QObject):
         super().__init__()
         self.error_handler = error_handler
         self._active_workers: Dict[str, WorkerOperation] = {}
+        # Workers cancelled without waiting, kept alive until they finish
+        self._stopping_workers: List[WorkerOperation] = []
 
     def execute_worker(self, worker_id: str, operation: WorkerOperation) -> None:
         """
@@ -40,6 +42,11 @@ class WorkerManagerService(QObject):
         # Start the worker
         operation.worker.start()
 
+    def _release_worker(self, worker_id: str, operation: WorkerOperation) -> None:
+        """Clean up a worker unless a newer operation has taken its ID."""
+        if self._active_workers.get(worker_id) is operation:
+            self.cancel_worker(worker_id)
+
     def cancel_worker(self, worker_id: str) -> None:
         """
         Cancel and clean up a specific worker.
@@ -52,10 +59,29 @@ class WorkerManagerService(QObject):
             operation.worker.wait()
             del self._active_workers[worker_id]
 
+    def request_cancel(self, worker_id: str) -> None:
+        """
+        Ask a worker to stop without blocking the calling thread.
+
+        The worker is released from its id at once, so a new operation can
+        start under the same id, and is kept alive until its thread finishes.
+
+        Args:
+            worker_id: ID of the worker to cancel
+        """
+        if operation := self._active_workers.pop(worker_id, None):
+            self._stopping_workers.append(operation)
+            operation.worker.finished.connect(
+                lambda: self._stopping_workers.remove(operation)
+            )
+            operation.worker.request_cancel()
+
     def cancel_all_workers(self) -> None:
         """Cancel and clean up all active workers."""
         for worker_id in list(self._active_workers.keys()):
             self.cancel_worker(worker_id)
+        for operation in list(self._stopping_workers):
+            operation.worker.wait()
 
     def _handle_worker_error(
         self, worker_id: str, error: str, operation: WorkerOperation
@@ -67,7 +93,7 @@ class WorkerManagerService(QObject):
             self.error_handler.handle_error(
                 f"Error in {operation.operation_name}: {error}"
             )
-        self.cancel_worker(worker_id)
+        self._release_worker(worker_id, operation)
 
     def _handle_worker_finished(
         self, worker_id: str, operation: WorkerOperation
@@ -75,4 +101,4 @@ class WorkerManagerService(QObject):
         """Handle worker completion with cleanup."""
         if operation.finished_callback:
             operation.finished_callback()
-        self.cancel_worker(worker_id)
+        self._release_worker(worker_id, operation)
@@ -0,0 +1,48 @@
+from typing import Callable, List
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex
+from PyQt6.QtWidgets import (
+    QCompleter,
+    QLineEdit,
+    QStyleOptionViewItem,
+    QStyledItemDelegate,
+    QWidget,
+)
+
+
+class SeparatedValuesCompleter(QCompleter):
+    """Completer for inputs holding a separated list, such as labels or tags."""
+
+    def __init__(self, model: QAbstractItemModel, separator: str = ","):
+        super().__init__(model)
+        self.separator = separator
+
+    def splitPath(self, path: str) -> List[str]:
+        """Complete only the entry after the last separator."""
+        return [path.split(self.separator)[-1].strip()]
+
+    def pathFromIndex(self, index: QModelIndex) -> str:
+        """Replace the entry being typed and keep the ones before it."""
+        completion = super().pathFromIndex(index)
+        text = self.widget().text() if self.widget() else ""
+        if self.separator not in text:
+            return completion
+        head = text.rsplit(self.separator, 1)[0]
+        return f"{head}{self.separator} {completion}"
+
+
+class CompleterDelegate(QStyledItemDelegate):
+    """Table delegate whose line edit editors get a completer."""
+
+    def __init__(
+        self, create_completer: Callable[[QLineEdit], QCompleter], parent=None
+    ):
+        super().__init__(parent)
+        self.create_completer = create_completer
+
+    def createEditor(
+        self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex
+    ) -> QWidget:
+        editor = QLineEdit(parent)
+        editor.setCompleter(self.create_completer(editor))
+        return editor
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import (
     QGroupBox,
     QVBoxLayout,
@@ -23,6 +23,7 @@ class ImageGroup(QGroupBox):
     def __init__(self, parent=None):
         super().__init__("Image", parent)
         self.setObjectName("imageGroupBox")
+        self.image_service = None  # Set once services are initialized
         self._init_image_group_ui()
 
     def _init_image_group_ui(self) -> None:
@@ -82,28 +83,36 @@ class ImageGroup(QGroupBox):
 
     def set_basic_image(self, image_path: Optional[str]) -> None:
         """Set or clear the displayed image."""
+        self.image_label.clear()
         if not image_path:
-            self.image_label.clear()
             self.image_label.setToolTip("")
             return
 
-        try:
-            pixmap = QPixmap(image_path)
-            if pixmap.isNull():
-                raise ValueError("Failed to load image")
-
-            scaled_pixmap = pixmap.scaled(
-                self.image_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self.image_label.setPixmap(scaled_pixmap)
-            self.image_label.setToolTip(image_path)  # Store path in toolTip
-
-        except Exception as e:
-            self.image_label.clear()
-            self.image_label.setToolTip("")
-            QMessageBox.warning(self, "Image Error", f"Failed to load image: {str(e)}")
+        self.image_label.setToolTip(image_path)  # Store path in toolTip
+        ratio = self.devicePixelRatioF()
+        max_size = self.image_label.size() * ratio
+        self.image_service.load_image(
+            image_path,
+            max_size,
+            lambda image, path=image_path: self._show_image(path, image),
+            lambda message, path=image_path: self._show_error(path, message),
+        )
+
+    def _show_image(self, image_path: str, image: QImage) -> None:
+        """Show a decoded image unless another one was set meanwhile."""
+        if image_path != self.image_label.toolTip():
+            return
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self.image_label.setPixmap(pixmap)
+
+    def _show_error(self, image_path: str, message: str) -> None:
+        """Report an image that could not be loaded."""
+        if image_path != self.image_label.toolTip():
+            return
+        self.image_label.clear()
+        self.image_label.setToolTip("")
+        QMessageBox.warning(self, "Image Error", f"Failed to load image: {message}")
 
     def get_basic_image_path(self) -> Optional[str]:
         """Get the current image path."""
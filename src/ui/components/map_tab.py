@@ -1,184 +1,669 @@
 import json
+import math
 import os
-from typing import Optional, Dict, Tuple, List
-
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QTimer, QSize, QThread
+from typing import Any, Optional, Dict, Set, Tuple, List
+
+import appdirs
+import shapely
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QObject,
+    QPoint,
+    QPointF,
+    QTimer,
+    QThread,
+    QRectF,
+    QSize,
+    QVariantAnimation,
+)
 from PyQt6.QtGui import (
-    QPixmap,
-    QTransform,
+    QColor,
+    QFont,
+    QFontMetricsF,
+    QImage,
     QMouseEvent,
     QCursor,
+    QPixmap,
+    QTransform,
     QWheelEvent,
     QKeyEvent,
+    QPainter,
+    QPixmapCache,
+    QResizeEvent,
 )
-from PyQt6.QtSvgWidgets import QSvgWidget
+from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
-    QScrollArea,
     QSlider,
     QHBoxLayout,
     QPushButton,
     QFileDialog,
+    QGraphicsItem,
+    QGraphicsScene,
+    QGraphicsSimpleTextItem,
+    QGraphicsView,
+    QMenu,
+    QStyleOptionGraphicsItem,
+    QToolButton,
 )
 from structlog import get_logger
 
 from ui.components.dialogs import PinPlacementDialog
 from utils.geometry_handler import GeometryHandler
 from utils.path_helper import get_resource_path
+from utils.pin_clusters import ClusterLevel, PinClusterer
+from utils.spatial_index import PinSpatialIndex
+from utils.tile_pyramid import TilePyramid
 
 logger = get_logger(__name__)
 
+# Zoom range of the map view
+MIN_ZOOM_SCALE = 0.1
+MAX_ZOOM_SCALE = 2.0
 
-class MapImageLoader(QThread):
-    """Thread for loading map images."""
+# Delay coalescing bursts of relationship table edits into one pin refresh
+PIN_REFRESH_DELAY_MS = 50
 
-    loaded = pyqtSignal(QPixmap)
+# Most entries listed in the "Pins in View" menu
+PINS_IN_VIEW_MENU_LIMIT = 50
 
-    def __init__(self, image_path: str):
+
+class MapImageLoader(QThread):
+    """Thread for opening the tile pyramid of a map image, building it if needed."""
+
+    loaded = pyqtSignal(object)  # TilePyramid
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        image_path: str,
+        cache_root: str,
+        tile_size: int,
+        max_cache_bytes: int = 0,
+        max_pixels: int = 0,
+    ):
         super().__init__()
         self.image_path = image_path
+        self.cache_root = cache_root
+        self.tile_size = tile_size
+        self.max_cache_bytes = max_cache_bytes
+        self.max_pixels = max_pixels
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Stop building at the next tile."""
+        self._cancelled = True
 
     def run(self):
-        pixmap = QPixmap(self.image_path)
-        self.loaded.emit(pixmap)
+        try:
+            pyramid = TilePyramid.for_image(
+                self.image_path,
+                self.cache_root,
+                self.tile_size,
+                is_cancelled=lambda: self._cancelled,
+                max_cache_bytes=self.max_cache_bytes,
+                max_pixels=self.max_pixels,
+            )
+        except (OSError, ValueError) as e:
+            self.failed.emit(str(e))
+            return
+        if pyramid and not self._cancelled:
+            self.loaded.emit(pyramid)
+
+
+class MapRenderWorker(QThread):
+    """Thread for rendering the visible part of a map smoothly at its exact scale."""
+
+    rendered = pyqtSignal(int, object, object)  # generation, QImage, decoded tiles
+
+    def __init__(
+        self, pyramid: TilePyramid, exposed: QRectF, size: QSize, generation: int
+    ):
+        super().__init__()
+        self.pyramid = pyramid
+        self.exposed = exposed
+        self.size = size
+        self.generation = generation
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Stop rendering at the next tile."""
+        self._cancelled = True
+
+    def run(self):
+        result = self.pyramid.render(
+            self.exposed, self.size, is_cancelled=lambda: self._cancelled
+        )
+        if result and not self._cancelled:
+            image, tiles = result
+            self.rendered.emit(self.generation, image, tiles)
+
+
+class MapImageItem(QGraphicsItem):
+    """
+    Scene item painting the visible tiles of a map image pyramid.
+
+    While the view is zooming or panning, the item draws whatever tiles are
+    already decoded without smooth filtering. Once the view settles, a
+    smoothly rendered image of the viewport is laid over the tiles for as
+    long as the scale stays the same.
+    """
+
+    def __init__(self, pyramid: TilePyramid):
+        super().__init__()
+        self.pyramid = pyramid
+        self.interactive = False
+        self.rendered: Optional[Tuple[QPixmap, QRectF, float]] = None
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self.setZValue(-1)
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(0, 0, self.pyramid.width, self.pyramid.height)
+
+    def set_rendered(self, pixmap: QPixmap, rect: QRectF, scale: float) -> None:
+        """Lay a smooth render of a region over the tiles."""
+        self.rendered = (pixmap, rect, scale)
+        self.interactive = False
+        self.update()
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: Optional[QWidget] = None,
+    ) -> None:
+        """Paint the exposed tiles at the level matching the view scale."""
+        scale = option.levelOfDetailFromTransform(painter.worldTransform())
+        if self.interactive:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+        self.pyramid.paint(painter, option.exposedRect, scale)
+
+        if self.rendered:
+            pixmap, rect, rendered_scale = self.rendered
+            if math.isclose(scale, rendered_scale) and rect.intersects(
+                option.exposedRect
+            ):
+                painter.drawPixmap(rect, pixmap, QRectF(pixmap.rect()))
+
+
+class MapRenderScheduler(QObject):
+    """
+    Schedules the smooth render of a map view once zooming or panning settles.
+
+    Every view change bumps the generation, cancels the render in flight and
+    restarts the settle timer, so only the last view of an interaction is
+    rendered and results of stale renders are dropped.
+
+    Args:
+        view: The map view to render.
+        settle_ms: Time without view changes before rendering.
+    """
+
+    def __init__(self, view: "MapView", settle_ms: int):
+        super().__init__(view)
+        self.view = view
+        self.generation = 0
+        self.current_worker: Optional[MapRenderWorker] = None
+        self._active_workers = set()  # Keep threads referenced until they finish
+
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(settle_ms)
+        self.settle_timer.timeout.connect(self._start_render)
+
+    def schedule(self) -> None:
+        """Note a view change and render again once changes stop."""
+        self.generation += 1
+        if self.current_worker:
+            self.current_worker.cancel()
+            self.current_worker = None
+        if self.view.image_item:
+            self.view.image_item.interactive = True
+        self.settle_timer.start()
+
+    def _start_render(self) -> None:
+        """Render the visible region at the current scale in a worker."""
+        item = self.view.image_item
+        if not item:
+            return
+
+        scale = self.view.transform().m11()
+        exposed = (
+            self.view.mapToScene(self.view.viewport().rect())
+            .boundingRect()
+            .intersected(item.boundingRect())
+        )
+        if exposed.isEmpty():
+            return
+        if item.rendered:
+            _, rect, rendered_scale = item.rendered
+            if math.isclose(scale, rendered_scale) and rect.contains(exposed):
+                item.interactive = False
+                item.update()
+                return
+
+        ratio = self.view.devicePixelRatioF()
+        size = QSize(
+            max(1, round(exposed.width() * scale * ratio)),
+            max(1, round(exposed.height() * scale * ratio)),
+        )
+        worker = MapRenderWorker(item.pyramid, exposed, size, self.generation)
+        worker.rendered.connect(
+            lambda generation, image, tiles, rect=exposed, scale=scale: (
+                self._on_rendered(generation, image, tiles, rect, scale)
+            )
+        )
+        self._active_workers.add(worker)
+        worker.finished.connect(lambda w=worker: self._active_workers.discard(w))
+        self.current_worker = worker
+        worker.start()
+
+    def _on_rendered(
+        self,
+        generation: int,
+        image: QImage,
+        tiles: List[Tuple[str, QImage]],
+        rect: QRectF,
+        scale: float,
+    ) -> None:
+        """Cache the decoded tiles and show the render unless it is stale."""
+        for key, tile in tiles:
+            if QPixmapCache.find(key) is None:
+                QPixmapCache.insert(key, QPixmap.fromImage(tile))
+
+        if generation != self.generation or not self.view.image_item:
+            return
+        self.current_worker = None
+        self.view.image_item.set_rendered(QPixmap.fromImage(image), rect, scale)
+
+
+class PinItem(QGraphicsItem):
+    """
+    Lightweight map pin anchored at its image coordinates.
 
+    The pin ignores the view transform, so it keeps its screen size at every
+    zoom level and its shared raster never has to be re-rendered.
+    """
 
-class PannableLabel(QLabel):
-    """Custom QLabel that supports panning with click and drag."""
+    def __init__(self, target_node: str, pin_pixmap: QPixmap, font: QFont):
+        super().__init__()
+        self.target_node = target_node
+        self._pixmap = pin_pixmap
+        self._font = font
+
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.setToolTip(target_node)
+        self.setZValue(1)
+
+        # Pin bottom-centre sits on the point, label centred below it
+        pin_size = pin_pixmap.deviceIndependentSize()
+        self._pin_rect = QRectF(
+            -pin_size.width() / 2, -pin_size.height(), pin_size.width(), pin_size.height()
+        )
+        metrics = QFontMetricsF(font)
+        label_width = metrics.horizontalAdvance(target_node) + 8
+        self._label_rect = QRectF(
+            -label_width / 2, 2, label_width, metrics.height() + 4
+        )
+        self._bounds = self._pin_rect.united(self._label_rect)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: Optional[QWidget] = None,
+    ) -> None:
+        painter.drawPixmap(self._pin_rect.topLeft(), self._pixmap)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 50))
+        painter.drawRoundedRect(self._label_rect, 3, 3)
+        painter.setPen(QColor("white"))
+        painter.setFont(self._font)
+        painter.drawText(self._label_rect, Qt.AlignmentFlag.AlignCenter, self.target_node)
+
+
+class ClusterItem(QGraphicsItem):
+    """Bubble standing in for several pins, labelled with their count."""
+
+    def __init__(self, count: int, font: QFont):
+        super().__init__()
+        self.count = count
+        self._font = font
+
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.setToolTip(f"{count} pins - click to zoom in")
+        self.setZValue(2)
+
+        radius = 12 + 3 * math.log2(count)
+        self._bounds = QRectF(-radius, -radius, 2 * radius, 2 * radius)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: Optional[QWidget] = None,
+    ) -> None:
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QColor("white"))
+        painter.setBrush(QColor(200, 60, 40, 200))
+        painter.drawEllipse(self._bounds.adjusted(1, 1, -1, -1))
+        painter.setFont(self._font)
+        painter.drawText(self._bounds, Qt.AlignmentFlag.AlignCenter, str(self.count))
+
+
+class MapView(QGraphicsView):
+    """Graphics view of a map image and its pins, with panning and wheel zoom."""
 
     zoom_requested = pyqtSignal(float)  # Signal for zoom requests
     pin_placed = pyqtSignal(int, int)  # Signal for pin placement
+    pin_placement_cancelled = pyqtSignal()
     pin_clicked = pyqtSignal(str)
+    cluster_clicked = pyqtSignal()
+
+    def __init__(
+        self,
+        parent=None,
+        config=None,
+        spatial_index: Optional[PinSpatialIndex] = None,
+    ):
+        super().__init__(parent)
+        self.config = config
+        self.spatial_index = spatial_index
+        self.pin_placement_active = False
 
-    def __init__(self, parent=None, config=None):
-        super().__init__()
+        self.map_scene = QGraphicsScene(self)
+        self.setScene(self.map_scene)
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
         self.setMouseTracking(True)
-        self.is_panning = False
-        self.last_mouse_pos = QPoint()
-        self.pin_placement_active = False
-        self.parent_map_tab = parent
-        self.config = config
+
+        self.image_item: Optional[MapImageItem] = None
+        self.render_scheduler = MapRenderScheduler(
+            self, self.config.map.RENDER_SETTLE_MS
+        )
+        self.horizontalScrollBar().valueChanged.connect(self.render_scheduler.schedule)
+        self.verticalScrollBar().valueChanged.connect(self.render_scheduler.schedule)
+        self.message_item: Optional[QGraphicsSimpleTextItem] = None
+        self.pins: Dict[str, PinItem] = {}
+        self.pin_pixmap = self._create_pin_pixmap()
+        self.pin_font = QFont(self.font())
+        self.pin_font.setPointSize(8)
+
+        # Clusters replace overlapping pins when zoomed out
+        self.clusterer = PinClusterer(
+            self.config.map.CLUSTER_CELL_SIZE,
+            MIN_ZOOM_SCALE,
+            self.config.map.CLUSTER_MAX_SCALE,
+        )
+        self.cluster_font = QFont(self.pin_font)
+        self.cluster_font.setBold(True)
+        self.cluster_items: List[ClusterItem] = []
+        self.cluster_level: Optional[int] = None
+        self._pin_order: List[PinItem] = []
+        self._expand_animation: Optional[QVariantAnimation] = None
+
         # Coordinate Label for cursor pos
-        self.cursor_pos = QPoint()
-        self.coordinate_label = QLabel(self)
+        self.coordinate_label = QLabel(self.viewport())
         self.coordinate_label.setStyleSheet(
             "QLabel { background-color: rgba(0, 0, 0, 150); color: white; padding: 5px; border-radius: 3px; }"
         )
         self.coordinate_label.hide()
 
-        self.pin_container = QWidget(self)
+    def _create_pin_pixmap(self) -> QPixmap:
+        """Render the pin graphic once, falling back to an emoji."""
+        width = self.config.map.BASE_PIN_WIDTH
+        height = self.config.map.BASE_PIN_HEIGHT
+        ratio = self.devicePixelRatioF()
 
-        self.pin_container.setGeometry(0, 0, self.width(), self.height())
-        self.pins: Dict[str, QLabel] = {}
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
 
-    def resizeEvent(self, event):
-        """Handle resize events to keep pin container matched to size."""
+        painter = QPainter(pixmap)
+        renderer = QSvgRenderer(get_resource_path(self.config.map.PIN_SVG_SOURCE))
+        if renderer.isValid():
+            renderer.render(painter, QRectF(0, 0, width, height))
+        else:
+            logger.warning(
+                "pin_svg_unavailable", source=self.config.map.PIN_SVG_SOURCE
+            )
+            painter.drawText(
+                QRectF(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, "📍"
+            )
+        painter.end()
+        return pixmap
+
+    def set_pyramid(self, pyramid: Optional[TilePyramid]) -> None:
+        """Show a tiled map image, or nothing if None."""
+        if self.image_item:
+            self.map_scene.removeItem(self.image_item)
+            self.image_item = None
+        self._clear_message()
+        if pyramid:
+            self.image_item = MapImageItem(pyramid)
+            self.map_scene.addItem(self.image_item)
+            self.setSceneRect(self.image_item.boundingRect())
+            self.render_scheduler.schedule()
+
+    def show_message(self, text: str) -> None:
+        """Replace the map image with a status message."""
+        self.set_pyramid(None)
+        self.message_item = self.map_scene.addSimpleText(text)
+        self.setSceneRect(self.message_item.boundingRect())
+
+    def _clear_message(self) -> None:
+        if self.message_item:
+            self.map_scene.removeItem(self.message_item)
+            self.message_item = None
+
+    def set_zoom(self, scale: float) -> None:
+        """Zoom by replacing the view transform; pins keep their screen size."""
+        self.setTransform(QTransform.fromScale(scale, scale))
+        self._update_clusters()
+        self.render_scheduler.schedule()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
-        self.pin_container.setGeometry(0, 0, self.width(), self.height())
-        self.pin_container.raise_()
+        self.render_scheduler.schedule()
+
+    def _rebuild_clusters(self) -> None:
+        """Precompute the cluster levels of the current pins."""
+        self._finish_expansion()
+        self._pin_order = list(self.pins.values())
+        self.clusterer.build(
+            [pin.pos().x() for pin in self._pin_order],
+            [pin.pos().y() for pin in self._pin_order],
+        )
+        self._update_clusters(force=True)
+
+    def _update_clusters(self, force: bool = False) -> None:
+        """
+        Show the cluster level matching the current zoom.
+
+        Nothing changes while the zoom stays within one level. When zooming
+        in, new clusters and pins fly out from the cluster that held them.
+        """
+        level = self.clusterer.level_for_scale(self.transform().m11())
+        if level == self.cluster_level and not force:
+            return
+        previous = self.cluster_level
+        self.cluster_level = level
+
+        self._finish_expansion()
+        for item in self.cluster_items:
+            self.map_scene.removeItem(item)
+        self.cluster_items = []
+
+        if level is None:
+            shown = list(self._pin_order)
+            for pin in shown:
+                pin.setVisible(True)
+            members = list(range(len(shown)))
+        else:
+            clusters = self.clusterer.levels[level]
+            single = (clusters.counts == 1)[clusters.labels]
+            for pin, visible in zip(self._pin_order, single.tolist()):
+                pin.setVisible(visible)
+
+            shown, members = [], []
+            for index, visible in enumerate(single.tolist()):
+                if visible:
+                    shown.append(self._pin_order[index])
+                    members.append(index)
+            for cluster, count in enumerate(clusters.counts.tolist()):
+                if count == 1:
+                    continue
+                item = ClusterItem(count, self.cluster_font)
+                item.setPos(clusters.centers_x[cluster], clusters.centers_y[cluster])
+                self.map_scene.addItem(item)
+                self.cluster_items.append(item)
+                shown.append(item)
+                members.append(int(clusters.representatives[cluster]))
+
+        zoomed_in = previous is not None and (level is None or level < previous)
+        if zoomed_in and not force:
+            self._animate_expansion(shown, members, self.clusterer.levels[previous])
+
+    def _animate_expansion(
+        self,
+        items: List[QGraphicsItem],
+        members: List[int],
+        parent_level: ClusterLevel,
+    ) -> None:
+        """
+        Move items from the centre of their former cluster to their position.
+
+        Args:
+            items: The newly shown pins and clusters
+            members: Index of a member pin of each item
+            parent_level: The coarser level that was shown before
+        """
+        paths = []
+        for item, member in zip(items, members):
+            parent = parent_level.labels[member]
+            if parent_level.counts[parent] == 1:
+                continue
+            start = QPointF(
+                parent_level.centers_x[parent], parent_level.centers_y[parent]
+            )
+            paths.append((item, start, item.pos()))
+        if not paths:
+            return
+
+        def step(progress: float) -> None:
+            for item, start, end in paths:
+                item.setPos(start + (end - start) * progress)
+
+        animation = QVariantAnimation(self)
+        animation.setStartValue(0.0)
+        animation.setEndValue(1.0)
+        animation.setDuration(self.config.map.CLUSTER_EXPAND_MS)
+        animation.valueChanged.connect(step)
+        step(0.0)
+        animation.start()
+        self._expand_animation = animation
+
+    def _finish_expansion(self) -> None:
+        """Jump a running expansion to its end so items sit at their positions."""
+        if self._expand_animation:
+            self._expand_animation.stop()
+            self._expand_animation.setCurrentTime(self._expand_animation.duration())
+            self._expand_animation = None
+
+    def set_pin_placement_active(self, active: bool) -> None:
+        """Switch between panning and pin placement."""
+        self.pin_placement_active = active
+        if active:
+            self.setDragMode(QGraphicsView.DragMode.NoDrag)
+            self.viewport().setCursor(QCursor(Qt.CursorShape.CrossCursor))
+        else:
+            self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+            self.viewport().unsetCursor()
+            self.coordinate_label.hide()
+
+    def _image_position(self, pos: QPoint) -> Optional[QPointF]:
+        """Map a viewport position to image coordinates, None if off the image."""
+        if not self.image_item:
+            return None
+        scene_pos = self.mapToScene(pos)
+        if not self.image_item.boundingRect().contains(scene_pos):
+            return None
+        return scene_pos
+
+    def _pin_at(self, pos: QPoint) -> Optional[str]:
+        """
+        Find the pin under a viewport position.
+
+        Exact hits on a pin's graphic win; otherwise the nearest pin anchor
+        within PIN_HIT_RADIUS screen pixels is taken from the spatial index.
+        """
+        item = self.itemAt(pos)
+        if isinstance(item, PinItem):
+            return item.target_node
+        if not self.spatial_index or self.cluster_level is not None:
+            return None
+        scene_pos = self.mapToScene(pos)
+        radius = self.config.map.PIN_HIT_RADIUS / self.transform().m11()
+        return self.spatial_index.nearest(scene_pos.x(), scene_pos.y(), radius)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
-        """Handle mouse press events for panning and pin placement."""
-        pixmap = self.pixmap()
-        if pixmap:
-            # Get the displayed image dimensions
-            pixmap_size = pixmap.size()
-            widget_width, widget_height = self.width(), self.height()
-            offset_x = max(0, (widget_width - pixmap_size.width()) // 2)
-            offset_y = max(0, (widget_height - pixmap_size.height()) // 2)
-
-            # Mouse position relative to the widget
-            widget_pos = event.pos()
-
-            # Calculate image-relative position
-            scaled_x = widget_pos.x() - offset_x
-            scaled_y = widget_pos.y() - offset_y
-            current_scale = self.parent_map_tab.current_scale
-            original_x = scaled_x / current_scale
-            original_y = scaled_y / current_scale
-
-            # Handle pin placement
-            if (
-                self.pin_placement_active
-                and event.button() == Qt.MouseButton.LeftButton
-            ):
-                if (
-                    0 <= scaled_x <= pixmap_size.width()
-                    and 0 <= scaled_y <= pixmap_size.height()
-                ):
-                    self.pin_placed.emit(int(original_x), int(original_y))
-
-            # Handle panning
-            elif (
-                not self.pin_placement_active
-                and event.button() == Qt.MouseButton.LeftButton
-            ):
-                self.is_panning = True
-                self.last_mouse_pos = widget_pos
-                self.setCursor(QCursor(Qt.CursorShape.ClosedHandCursor))
+        """Handle pin clicks and pin placement, leaving panning to the view."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            if self.pin_placement_active:
+                image_pos = self._image_position(event.pos())
+                if image_pos is not None:
+                    self.pin_placed.emit(int(image_pos.x()), int(image_pos.y()))
+                return
+
+            if isinstance(self.itemAt(event.pos()), ClusterItem):
+                self.cluster_clicked.emit()
+                return
+
+            if target_node := self._pin_at(event.pos()):
+                self.pin_clicked.emit(target_node)
+                return
+
+        super().mousePressEvent(event)
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """Handle key press events."""
         if event.key() == Qt.Key.Key_Escape and self.pin_placement_active:
-            self.pin_placement_active = False
-            self.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
-            self.coordinate_label.hide()
+            self.pin_placement_cancelled.emit()
         else:
             super().keyPressEvent(event)
 
-    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
-        """Handle mouse release events to stop panning."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.is_panning = False
-            if not self.pin_placement_active:
-                self.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
-
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """Handle mouse movement for panning and cursor updates."""
-        pixmap = self.pixmap()
-        if pixmap:
-            # Handle panning
-            if self.is_panning:
-                delta = event.pos() - self.last_mouse_pos
-                self.last_mouse_pos = event.pos()
-
-                # Adjust scroll bars to pan the image
-                h_bar = self.parent_map_tab.scroll_area.horizontalScrollBar()
-                v_bar = self.parent_map_tab.scroll_area.verticalScrollBar()
-                h_bar.setValue(h_bar.value() - delta.x())
-                v_bar.setValue(v_bar.value() - delta.y())
-
-            else:
-                # Get the displayed image dimensions
-                pixmap_size = pixmap.size()
-                widget_width, widget_height = self.width(), self.height()
-                offset_x = max(0, (widget_width - pixmap_size.width()) // 2)
-                offset_y = max(0, (widget_height - pixmap_size.height()) // 2)
-
-                # Mouse position relative to the widget
-                widget_pos = event.pos()
-
-                # Calculate image-relative position
-                scaled_x = widget_pos.x() - offset_x
-                scaled_y = widget_pos.y() - offset_y
-                current_scale = self.parent_map_tab.current_scale
-                original_x = scaled_x / current_scale
-                original_y = scaled_y / current_scale
-
-                # Update cursor coordinates if within image bounds
-                if (
-                    0 <= scaled_x <= pixmap_size.width()
-                    and 0 <= scaled_y <= pixmap_size.height()
-                ):
-                    self.coordinate_label.setText(
-                        f"X: {int(original_x)}, Y: {int(original_y)}"
-                    )
-                    self.coordinate_label.move(widget_pos.x() + 15, widget_pos.y() + 15)
-                    self.coordinate_label.show()
-                else:
-                    self.coordinate_label.hide()
+        super().mouseMoveEvent(event)
+
+        image_pos = self._image_position(event.pos())
+        if image_pos is None:
+            self.coordinate_label.hide()
+            return
+
+        self.coordinate_label.setText(f"X: {int(image_pos.x())}, Y: {int(image_pos.y())}")
+        self.coordinate_label.adjustSize()
+        self.coordinate_label.move(event.pos().x() + 15, event.pos().y() + 15)
+        self.coordinate_label.show()
+
+    def leaveEvent(self, event) -> None:
+        self.coordinate_label.hide()
+        super().leaveEvent(event)
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         """Handle mouse wheel events for zooming."""
@@ -192,112 +677,27 @@ class PannableLabel(QLabel):
 
     def create_pin(self, target_node: str, x: int, y: int) -> None:
         """Create and position a pin with tooltip."""
-
-        if target_node in self.pins:
-            self.pins[target_node].deleteLater()
-            del self.pins[target_node]
-
-        # Create pin container with both pin and label
-        pin_container = PinContainer(
-            target_node, self.pin_container, config=self.config
-        )
-
-        # Add this line to connect the pin's click signal
-        pin_container.pin_clicked.connect(self.pin_clicked.emit)
-
-        # Set initial scale
-        pin_container.set_scale(self.parent_map_tab.current_scale)
-
-        # Store original coordinates
-        pin_container.original_x = x
-        pin_container.original_y = y
-
-        self.pins[target_node] = pin_container
-        pin_container.show()
-        self.update_pin_container_position(target_node, x, y)
+        self.batch_create_pins([(target_node, x, y)])
 
     def batch_create_pins(self, pin_data: List[Tuple[str, int, int]]) -> None:
-        """Create multiple pins efficiently."""
-        # Pre-allocate widgets to minimize layout recalculations
+        """Create multiple pins; the scene index handles culling and hit-testing."""
         for target_node, x, y in pin_data:
             if target_node in self.pins:
-                self.pins[target_node].deleteLater()
-                del self.pins[target_node]
-
-        # Temporarily disable updates
-        self.pin_container.setUpdatesEnabled(False)
-
-        try:
-            for target_node, x, y in pin_data:
-                pin_container = PinContainer(
-                    target_node, self.pin_container, config=self.config
-                )
-                pin_container.pin_clicked.connect(self.pin_clicked.emit)
-                pin_container.set_scale(self.parent_map_tab.current_scale)
-                pin_container.original_x = x
-                pin_container.original_y = y
-                self.pins[target_node] = pin_container
-                self.update_pin_container_position(target_node, x, y)
-                pin_container.show()
-        finally:
-            # Re-enable updates and force a single update
-            self.pin_container.setUpdatesEnabled(True)
-            self.pin_container.update()
-
-    def update_pin_container_position(self, target_node: str, x: int, y: int) -> None:
-        """Update position of a pin container."""
-        if target_node not in self.pins:
-            return
-
-        viewport_width = self.parent_map_tab.scroll_area.viewport().width()
-        viewport_height = self.parent_map_tab.scroll_area.viewport().height()
-
-        pin_container = self.pins[target_node]
-
-        if not hasattr(pin_container, "original_x"):
-            pin_container.original_x = x
-            pin_container.original_y = y
-
-        # Update the container's scale
-        pin_container.set_scale(self.parent_map_tab.current_scale)
-
-        # Calculate scaled position using stored original coordinates
-        current_scale = self.parent_map_tab.current_scale
-        scaled_x = pin_container.original_x * current_scale
-        scaled_y = pin_container.original_y * current_scale
-
-        # Account for Widget and scaled image size
-        if pixmap := self.pixmap():
-            image_width = pixmap.width()
-            image_height = pixmap.height()
-            if image_width < viewport_width:
-                scaled_x += (viewport_width - image_width) / 2
-            if image_height < viewport_height:
-                scaled_y += (viewport_height - image_height) / 2
-
-        # Account for container dimensions - align bottom of pin with point
-        pin_x = int(scaled_x - (pin_container.pin_svg.width() / 2))
-        pin_y = int(scaled_y - pin_container.pin_svg.height())
+                self.map_scene.removeItem(self.pins.pop(target_node))
 
-        pin_container.move(pin_x, pin_y)
-        pin_container.raise_()
-        pin_container.show()
+            pin = PinItem(target_node, self.pin_pixmap, self.pin_font)
+            pin.setPos(x, y)
+            self.map_scene.addItem(pin)
+            self.pins[target_node] = pin
 
-    def update_pin_positions(self) -> None:
-        """Update all pin positions using stored original coordinates."""
-
-        for target_node, pin in self.pins.items():
-            # Use the stored original coordinates rather than trying to calculate back
-            if hasattr(pin, "original_x") and hasattr(pin, "original_y"):
-                self.update_pin_container_position(
-                    target_node, pin.original_x, pin.original_y
-                )
+        self._rebuild_clusters()
 
     def clear_pins(self) -> None:
         """Remove all pins."""
         for pin in self.pins.values():
-            pin.deleteLater()
+            self.map_scene.removeItem(pin)
         self.pins.clear()
+        self._rebuild_clusters()
 
 
 class MapTab(QWidget):
@@ -319,13 +719,22 @@ class MapTab(QWidget):
         self.controller = controller
         self.config = controller.config
 
-        self.zoom_timer = QTimer()
-        self.zoom_timer.setSingleShot(True)
-        self.zoom_timer.timeout.connect(self._perform_zoom)
-        self.pending_scale = None
-
-        self._pixmap_cache = {}
+        self._pyramid_cache: Dict[str, TilePyramid] = {}
+        self.spatial_index = PinSpatialIndex()
+        # Saved pins of the last loaded map node, as (map name, records)
+        self._pin_records: Tuple[str, List[Any]] = ("", [])
+        self._pin_refresh_timer = QTimer(self)
+        self._pin_refresh_timer.setSingleShot(True)
+        self._pin_refresh_timer.setInterval(PIN_REFRESH_DELAY_MS)
+        self._pin_refresh_timer.timeout.connect(self.refresh_pins)
         self.current_loader = None
+        self._active_loaders = set()  # Keep threads referenced until they finish
+        self.tile_cache_root = os.path.join(
+            appdirs.user_cache_dir("NeoWorldBuilder"), "map_tiles"
+        )
+        QPixmapCache.setCacheLimit(
+            max(QPixmapCache.cacheLimit(), self.config.map.TILE_CACHE_KB)
+        )
 
         self.setup_map_tab_ui()
 
@@ -352,18 +761,30 @@ class MapTab(QWidget):
         self.pin_toggle_btn.toggled.connect(self.toggle_pin_placement)
         self.pin_toggle_btn.setToolTip("Toggle pin placement mode (ESC to cancel)")
 
+        # Pins in view menu, listing pins hidden inside clusters too
+        self.pins_in_view_btn = QToolButton()
+        self.pins_in_view_btn.setText("Pins in View")
+        self.pins_in_view_btn.setPopupMode(
+            QToolButton.ToolButtonPopupMode.InstantPopup
+        )
+        self.pins_in_view_btn.setToolTip("Open a node pinned in the visible area")
+        self.pins_in_view_menu = QMenu(self.pins_in_view_btn)
+        self.pins_in_view_menu.aboutToShow.connect(self._populate_pins_in_view_menu)
+        self.pins_in_view_btn.setMenu(self.pins_in_view_menu)
+
         image_controls.addWidget(self.change_map_btn)
         image_controls.addWidget(self.clear_map_btn)
         image_controls.addStretch()
         image_controls.addWidget(self.pin_toggle_btn)
+        image_controls.addWidget(self.pins_in_view_btn)
         image_controls.addStretch()
 
         # Zoom controls
         zoom_controls = QHBoxLayout()
 
         self.zoom_slider = QSlider(Qt.Orientation.Horizontal)
-        self.zoom_slider.setMinimum(10)  # 10% zoom
-        self.zoom_slider.setMaximum(200)  # 200% zoom
+        self.zoom_slider.setMinimum(int(MIN_ZOOM_SCALE * 100))  # 10% zoom
+        self.zoom_slider.setMaximum(int(MAX_ZOOM_SCALE * 100))  # 200% zoom
         self.zoom_slider.setValue(100)  # 100% default
         self.zoom_slider.valueChanged.connect(self._handle_zoom)
 
@@ -374,28 +795,26 @@ class MapTab(QWidget):
         zoom_controls.addWidget(self.zoom_slider)
         zoom_controls.addWidget(self.reset_button)
 
-        # Create scrollable image area
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        # Image display using PannableLabel
-        self.image_label = PannableLabel(self, config=self.config)
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.zoom_requested.connect(self._handle_wheel_zoom)
-        self.image_label.pin_placed.connect(self._handle_pin_placement)
+        # Map scene display
+        self.map_view = MapView(
+            self, config=self.config, spatial_index=self.spatial_index
+        )
+        self.map_view.zoom_requested.connect(self._handle_wheel_zoom)
+        self.map_view.pin_placed.connect(self._handle_pin_placement)
+        self.map_view.cluster_clicked.connect(lambda: self._handle_wheel_zoom(2.0))
+        self.map_view.pin_placement_cancelled.connect(
+            lambda: self.pin_toggle_btn.setChecked(False)
+        )
 
         if self.controller:
-            self.image_label.pin_clicked.connect(self.controller._handle_pin_click)
+            self.map_view.pin_clicked.connect(self.controller._handle_pin_click)
         else:
             print("Warning: No controller present for pin clicks")
 
-        self.scroll_area.setWidget(self.image_label)
-
         # Add all components to layout
         layout.addLayout(image_controls)
         layout.addLayout(zoom_controls)
-        layout.addWidget(self.scroll_area)
+        layout.addWidget(self.map_view)
 
         self.setLayout(layout)
 
@@ -405,7 +824,7 @@ class MapTab(QWidget):
         new_scale = self.current_scale * zoom_factor
 
         # Clamp scale to slider limits (10% to 200%)
-        new_scale = max(0.1, min(2.0, new_scale))
+        new_scale = max(MIN_ZOOM_SCALE, min(MAX_ZOOM_SCALE, new_scale))
 
         # Update slider value
         self.zoom_slider.setValue(int(new_scale * 100))
@@ -414,89 +833,224 @@ class MapTab(QWidget):
         """Set the map image path and display the image."""
         self.map_image_path = image_path
 
+        if self.current_loader:
+            self.current_loader.cancel()
+            self.current_loader = None
+
         # Early exit for no image
         if not image_path:
-            self.image_label.clear_pins()
-            self.image_label.clear()
-            self.image_label.setText("No map image set")
+            self.map_view.clear_pins()
+            self.map_view.show_message("No map image set")
             return
 
-        # Check cache first
-        if image_path in self._pixmap_cache:
-            pixmap = self._pixmap_cache[image_path]
-            self.original_pixmap = pixmap
+        # Check cache first; a pyramid evicted from disk is opened again
+        pyramid = self._pyramid_cache.get(image_path)
+        if pyramid and pyramid.touch():
+            self.map_view.set_pyramid(pyramid)
             self._update_map_image_display()
             self.load_pins()
             return
 
         # Show loading state
-        self.image_label.setText("Loading map...")
-
-        # Start loading in background
-        self.current_loader = MapImageLoader(image_path)
-        self.current_loader.loaded.connect(self._on_image_loaded)
+        self.map_view.show_message("Loading map...")
+
+        # Open or build the tile pyramid in background
+        self.current_loader = MapImageLoader(
+            image_path,
+            self.tile_cache_root,
+            self.config.map.TILE_SIZE,
+            max_cache_bytes=self.config.map.TILE_DISK_CACHE_MB << 20,
+            max_pixels=self.config.map.MAX_IMAGE_MEGAPIXELS * 1_000_000,
+        )
+        self.current_loader.loaded.connect(
+            lambda pyramid, path=image_path: self._on_image_loaded(path, pyramid)
+        )
+        self.current_loader.failed.connect(self._on_image_failed)
+        self._active_loaders.add(self.current_loader)
+        self.current_loader.finished.connect(
+            lambda loader=self.current_loader: self._active_loaders.discard(loader)
+        )
         self.current_loader.start()
 
-    def _on_image_loaded(self, pixmap: QPixmap) -> None:
-        """Handle when image has finished loading."""
-        if pixmap.isNull():
-            self.image_label.clear_pins()
-            self.image_label.setText(f"Error loading map image: {self.map_image_path}")
+    def _on_image_loaded(self, image_path: str, pyramid: TilePyramid) -> None:
+        """Handle when the tile pyramid of an image is ready."""
+        self._pyramid_cache[image_path] = pyramid
+        if image_path != self.map_image_path:
             return
 
-        # Cache the successfully loaded pixmap
-        self._pixmap_cache[self.map_image_path] = pixmap
-
         # Update display
-        self.original_pixmap = pixmap
+        self.map_view.set_pyramid(pyramid)
         self._update_map_image_display()
         self.load_pins()
 
+    def _on_image_failed(self, message: str) -> None:
+        """Handle a map image that could not be loaded."""
+        logger.error("map_image_load_failed", error=message)
+        self.map_view.clear_pins()
+        self.map_view.show_message(f"Error loading map image: {self.map_image_path}")
+
     def load_pins(self) -> None:
-        """Process and load pin data from relationships table using WKT format."""
-        self.image_label.clear_pins()
+        """Load the pins of the current map node from the database."""
+        if not self.controller:
+            return
 
-        if not self.controller or not self.controller.ui.relationships_table:
+        map_name = self.controller.ui.name_input.text().strip()
+        if not map_name:
+            self.map_view.clear_pins()
+            self.spatial_index.rebuild([], [])
             return
 
-        # Batch collect all pin data first
-        pin_data = []
-        relationships_table = self.controller.ui.relationships_table
+        self.controller.node_operations.load_map_pins(
+            map_name, lambda records: self._handle_pin_records(map_name, records)
+        )
 
-        for row in range(relationships_table.rowCount()):
-            try:
-                rel_type = relationships_table.item(row, 0)
-                if not rel_type or rel_type.text() != "SHOWS":
-                    continue
+    def schedule_pin_refresh(self) -> None:
+        """Refresh the pins shortly, after the relationships table changed."""
+        self._pin_refresh_timer.start()
 
-                target_item = relationships_table.item(row, 1)
-                props_item = relationships_table.item(row, 3)
+    def refresh_pins(self) -> None:
+        """Show the saved pins again with the current relationship table edits."""
+        map_name, records = self._pin_records
+        if self.controller and map_name == self.controller.ui.name_input.text().strip():
+            self._show_pins(records)
 
-                if not (target_item and props_item):
-                    continue
+    def _handle_pin_records(self, map_name: str, records: List[Any]) -> None:
+        """
+        Show and index the pins returned for a map node.
 
-                properties = json.loads(props_item.text())
-                if "geometry" not in properties:
-                    logger.warning(
-                        f"Pin relationship missing geometry for {target_item.text()}"
-                    )
-                    continue
+        Args:
+            map_name: Name of the map node the pins were requested for
+            records: Records with "target", "x", "y" and "geometry" fields
+        """
+        if map_name != self.controller.ui.name_input.text().strip():
+            return
 
-                # Extract coordinates from WKT
-                if not GeometryHandler.validate_wkt(properties["geometry"]):
-                    logger.error(f"Invalid WKT geometry for {target_item.text()}")
-                    continue
+        self._pin_records = (map_name, records)
+        self._show_pins(records)
 
-                x, y = GeometryHandler.get_coordinates(properties["geometry"])
-                pin_data.append((target_item.text(), x, y))
+    def _table_pin_edits(self) -> Tuple[Set[str], Dict[str, str]]:
+        """
+        Read the pin relationships of the relationships table.
+
+        The table holds unsaved edits. Rows are compared as text with the
+        relationships of the loaded node, so only edited rows are decoded.
 
-            except (json.JSONDecodeError, AttributeError) as e:
-                logger.error(f"Error loading pin: {e}")
+        Returns:
+            The targets of all pin rows, and the properties text of the rows
+            added or changed since the node was loaded
+        """
+        original = self.controller.original_node_data or {}
+        saved = {
+            target: json.dumps(properties)
+            for rel_type, target, direction, properties in original.get(
+                "relationships", []
+            )
+            if rel_type == "SHOWS" and direction == ">"
+        }
+
+        targets: Set[str] = set()
+        edited: Dict[str, str] = {}
+        for rel_type, target, direction, properties in (
+            self.controller._collect_table_relationships()
+        ):
+            target = target.strip()
+            if rel_type.strip().upper() != "SHOWS" or direction != ">" or not target:
                 continue
+            targets.add(target)
+            if saved.get(target) != properties.strip():
+                edited[target] = properties
+        return targets, edited
 
-        # Batch create all pins at once
-        if pin_data:
-            self.image_label.batch_create_pins(pin_data)
+    def _show_pins(self, records: List[Any]) -> None:
+        """
+        Show and index saved pins merged with the relationships table.
+
+        Pins whose rows were removed from the table are dropped, and pins
+        added or moved in the table override the saved ones.
+
+        Args:
+            records: Saved pin records of the current map node
+        """
+        targets, edited = self._table_pin_edits()
+
+        names: List[str] = []
+        xs: List[float] = []
+        ys: List[float] = []
+        legacy_names: List[str] = []
+        legacy_wkts: List[str] = []
+        for record in records:
+            if record["target"] not in targets or record["target"] in edited:
+                continue
+            if record["x"] is not None and record["y"] is not None:
+                names.append(record["target"])
+                xs.append(record["x"])
+                ys.append(record["y"])
+            elif record["geometry"]:
+                legacy_names.append(record["target"])
+                legacy_wkts.append(record["geometry"])
+
+        for target, text in edited.items():
+            try:
+                properties = json.loads(text) if text.strip() else {}
+            except ValueError as e:
+                logger.error(f"Error loading pin for {target}: {e}")
+                continue
+            if not isinstance(properties, dict):
+                continue
+            if isinstance(properties.get("x"), (int, float)) and isinstance(
+                properties.get("y"), (int, float)
+            ):
+                names.append(target)
+                xs.append(properties["x"])
+                ys.append(properties["y"])
+            elif properties.get("geometry"):
+                legacy_names.append(target)
+                legacy_wkts.append(properties["geometry"])
+
+        # Pins saved before native coordinates only have WKT; parse them at once
+        if legacy_wkts:
+            geometries = PinSpatialIndex.parse_wkt(legacy_wkts)
+            valid = ~shapely.is_missing(geometries)
+            for name, ok in zip(legacy_names, valid):
+                if not ok:
+                    logger.error(f"Invalid WKT geometry for {name}")
+            legacy_xs, legacy_ys = PinSpatialIndex.anchor_points(geometries[valid])
+            names.extend(name for name, ok in zip(legacy_names, valid) if ok)
+            xs.extend(legacy_xs.tolist())
+            ys.extend(legacy_ys.tolist())
+
+        self.map_view.clear_pins()
+        self.spatial_index.rebuild(names, shapely.points(xs, ys))
+        if names:
+            self.map_view.batch_create_pins(
+                [(name, int(x), int(y)) for name, x, y in zip(names, xs, ys)]
+            )
+
+    def visible_pins(self) -> List[str]:
+        """Get the names of the pins inside the visible part of the map."""
+        rect = self.map_view.mapToScene(self.map_view.viewport().rect()).boundingRect()
+        return self.spatial_index.query_box(
+            rect.left(), rect.top(), rect.right(), rect.bottom()
+        )
+
+    def _populate_pins_in_view_menu(self) -> None:
+        """Fill the pins in view menu from a spatial index viewport query."""
+        self.pins_in_view_menu.clear()
+        names = sorted(self.visible_pins(), key=str.lower)
+        if not names:
+            self.pins_in_view_menu.addAction("No pins in view").setEnabled(False)
+            return
+
+        for name in names[:PINS_IN_VIEW_MENU_LIMIT]:
+            action = self.pins_in_view_menu.addAction(name)
+            action.triggered.connect(
+                lambda _checked=False, n=name: self.map_view.pin_clicked.emit(n)
+            )
+        hidden = len(names) - PINS_IN_VIEW_MENU_LIMIT
+        if hidden > 0:
+            self.pins_in_view_menu.addAction(
+                f"… {hidden} more, zoom in to narrow"
+            ).setEnabled(False)
 
     def get_map_image_path(self) -> Optional[str]:
         """Get the current map image path."""
@@ -520,22 +1074,10 @@ class MapTab(QWidget):
         self.map_image_changed.emit("")
 
     def _handle_zoom(self) -> None:
-        """Handle zoom slider value changes with debouncing."""
-        self.pending_scale = self.zoom_slider.value() / 100
-
-        # Reset and restart the timer
-        self.zoom_timer.start(10)  # 10ms debounce
-
-    def _perform_zoom(self) -> None:
-        """Actually perform the zoom operation after debounce."""
-        if self.pending_scale is not None:
-
-            self.current_scale = self.pending_scale
-            self._update_map_image_display()
-
-            self.image_label.pin_container.raise_()
-            self.image_label.update_pin_positions()
-            self.pending_scale = None
+        """Handle zoom slider value changes."""
+        # Cheap transform now; the view's render scheduler refines it later
+        self.current_scale = self.zoom_slider.value() / 100
+        self._update_map_image_display()
 
     def _reset_zoom(self) -> None:
         """Reset zoom to 100%."""
@@ -544,80 +1086,18 @@ class MapTab(QWidget):
         self._update_map_image_display()
 
     def _update_map_image_display(self) -> None:
-        """Update the displayed image with current scale while maintaining the center point."""
-        if not hasattr(self, "original_pixmap"):
-            return
-
-        # Get the scroll area's viewport dimensions
-        viewport_width = self.scroll_area.viewport().width()
-        viewport_height = self.scroll_area.viewport().height()
-
-        # Get current scroll bars' positions and ranges
-        h_bar = self.scroll_area.horizontalScrollBar()
-        v_bar = self.scroll_area.verticalScrollBar()
-
-        # Calculate current viewport center in scroll coordinates
-        visible_center_x = h_bar.value() + viewport_width / 2
-        visible_center_y = v_bar.value() + viewport_height / 2
-
-        # Calculate relative position (0 to 1) in the current image
-        if self.image_label.pixmap():
-            current_image_width = self.image_label.pixmap().width()
-            current_image_height = self.image_label.pixmap().height()
-            rel_x = (
-                visible_center_x / current_image_width
-                if current_image_width > 0
-                else 0.5
-            )
-            rel_y = (
-                visible_center_y / current_image_height
-                if current_image_height > 0
-                else 0.5
-            )
-        else:
-            rel_x = 0.5
-            rel_y = 0.5
-
-        # Create the scaled pixmap
-        scaled_pixmap = self.original_pixmap.transformed(
-            QTransform().scale(self.current_scale, self.current_scale),
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        # Update the image
-        self.image_label.setPixmap(scaled_pixmap)
-
-        # Calculate new scroll position based on relative position
-        new_width = scaled_pixmap.width()
-        new_height = scaled_pixmap.height()
-        new_x = int(new_width * rel_x - viewport_width / 2)
-        new_y = int(new_height * rel_y - viewport_height / 2)
-
-        # Use a short delay to ensure the scroll area has updated its geometry
-        QTimer.singleShot(1, lambda: self._set_scroll_position(new_x, new_y))
-
-    def _set_scroll_position(self, x: int, y: int) -> None:
-        """Set scroll position with boundary checking."""
-        h_bar = self.scroll_area.horizontalScrollBar()
-        v_bar = self.scroll_area.verticalScrollBar()
-
-        # Ensure values are within valid range
-        x = max(0, min(x, h_bar.maximum()))
-        y = max(0, min(y, v_bar.maximum()))
-
-        h_bar.setValue(x)
-        v_bar.setValue(y)
+        """Apply the current scale as the view transform."""
+        self.map_view.set_zoom(self.current_scale)
 
     def toggle_pin_placement(self, active: bool) -> None:
         """Toggle pin placement mode."""
         self.pin_placement_active = active
-        self.image_label.pin_placement_active = active
+        self.map_view.set_pin_placement_active(active)
 
-        # Update cursor based on mode
+        # Update button based on mode
         if active:
-            self.image_label.setCursor(QCursor(Qt.CursorShape.CrossCursor))
             self.pin_toggle_btn.setStyleSheet("background: white")
         else:
-            self.image_label.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
             self.pin_toggle_btn.setStyleSheet("background: grey")
         # Emit signal for other components
         self.pin_mode_toggled.emit(active)
@@ -636,126 +1116,9 @@ class MapTab(QWidget):
 
                 self.pin_created.emit(target_node, ">", properties)
 
-                # Create pin immediately after dialog success
-                self.image_label.create_pin(target_node, x, y)
+                # Create and index pin immediately after dialog success
+                self.spatial_index.set(target_node, shapely.points(x, y))
+                self.map_view.create_pin(target_node, x, y)
 
                 # Exit pin placement mode
                 self.pin_toggle_btn.setChecked(False)
-
-
-class PinContainer(QWidget):
-    """Container widget that holds both a pin and its label."""
-
-    pin_clicked = pyqtSignal(str)
-
-    def __init__(self, target_node: str, parent=None, config=None):
-        super().__init__(parent)
-        self._scale = 1.0  # Initialize scale attribute
-        self.config = config
-
-        # Make mouse interactive
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
-        self.setMouseTracking(True)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-
-        # Create layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(2)
-
-        # Create SVG pin with error handling
-
-        svg_path = get_resource_path(self.config.map.PIN_SVG_SOURCE)
-
-        try:
-            if not os.path.exists(svg_path):
-                print(f"SVG file not found: {svg_path}")
-                raise FileNotFoundError(f"SVG file not found: {svg_path}")
-
-            self.pin_svg = QSvgWidget(self)
-            self.pin_svg.load(svg_path)
-
-            # Verify the widget has valid dimensions after loading
-            if self.pin_svg.width() == 0 or self.pin_svg.height() == 0:
-                print(f"Failed to load SVG properly: {svg_path}")
-                raise RuntimeError(f"Failed to load SVG properly: {svg_path}")
-
-            self.update_pin_size()
-
-        except Exception as e:
-            print(f"Error loading SVG, falling back to emoji: {e}")
-            # Fallback to emoji if SVG fails
-            self.pin_svg = QLabel("📍", self)
-            self.pin_svg.setFixedSize(
-                QSize(self.config.map.BASE_PIN_WIDTH, self.config.map.BASE_PIN_HEIGHT)
-            )  # Set initial size for emoji
-
-        # Create text label
-        self.text_label = QLabel(target_node)
-        self.update_label_style()
-
-        # Add widgets to layout
-        layout.addWidget(self.pin_svg)
-        layout.addWidget(self.text_label)
-
-        # Set container to be transparent
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-
-        # Adjust size
-        self.adjustSize()
-
-    def update_pin_size(self) -> None:
-        """Update pin size based on current scale."""
-        # Calculate size based on scale, but don't go below minimum
-        width = max(
-            int(self.config.map.BASE_PIN_WIDTH * self._scale),
-            self.config.map.MIN_PIN_WIDTH,
-        )
-        height = max(
-            int(self.config.map.BASE_PIN_HEIGHT * self._scale),
-            self.config.map.MIN_PIN_HEIGHT,
-        )
-
-        # Check if we're using SVG or emoji fallback
-        if isinstance(self.pin_svg, QSvgWidget):
-            self.pin_svg.setFixedSize(QSize(width, height))
-        else:
-            # For emoji label, just update the font size
-            font_size = max(int(14 * self._scale), 8)  # Minimum font size for emoji
-            font = self.pin_svg.font()
-            font.setPointSize(font_size)
-            self.pin_svg.setFont(font)
-
-    def update_label_style(self) -> None:
-        """Update label style based on current scale."""
-        # Adjust font size based on scale
-        font_size = max(int(8 * self._scale), 6)  # Minimum font size of 6pt
-        self.text_label.setStyleSheet(
-            f"""
-            QLabel {{
-                background-color: rgba(0, 0, 0, 50);
-                color: white;
-                padding: {max(int(2 * self._scale), 1)}px {max(int(4 * self._scale), 2)}px;
-                border-radius: 3px;
-                font-size: {font_size}pt;
-            }}
-        """
-        )
-
-    def set_scale(self, scale: float) -> None:
-        """Set the current scale and update sizes."""
-        self._scale = scale
-        self.update_pin_size()
-        self.update_label_style()
-        self.adjustSize()
-
-    @property
-    def pin_height(self) -> int:
-        """Get the height of the pin."""
-        return self.pin_svg.height()
-
-    def mousePressEvent(self, event: QMouseEvent) -> None:
-
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.pin_clicked.emit(self.text_label.text())
-        event.accept()  # Make sure we handle the event
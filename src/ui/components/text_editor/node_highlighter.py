@@ -0,0 +1,72 @@
+"""
+This module provides the NodeReferenceHighlighter class, which marks names of
+existing nodes in the description editor so they can be followed as links.
+"""
+
+from typing import Optional
+
+from PyQt6.QtGui import (
+    QColor,
+    QSyntaxHighlighter,
+    QTextBlock,
+    QTextCharFormat,
+    QTextDocument,
+    QTextFormat,
+)
+
+# Character format property carrying the referenced node name
+NODE_REFERENCE_PROPERTY = QTextFormat.Property.UserProperty + 1
+
+
+class NodeReferenceHighlighter(QSyntaxHighlighter):
+    """
+    Marks node names in a document, one text block at a time.
+
+    Qt only re-runs highlightBlock for blocks whose text changed, so edits cost
+    O(block) instead of O(document). The formats live in the block layout, not
+    in the document, so they never reach toHtml().
+    """
+
+    def __init__(self, document: QTextDocument, name_cache_service: "NameCacheService"):
+        """
+        Initialize the highlighter.
+
+        Args:
+            document: The document to highlight
+            name_cache_service: Source of the shared node name matcher
+        """
+        super().__init__(document)
+        self.name_cache_service = name_cache_service
+
+    def highlightBlock(self, text: str) -> None:
+        """Format every node name found in a block of text."""
+        matcher = self.name_cache_service.get_name_matcher()
+        for start, end, name in matcher.find_all(text):
+            self.setFormat(start, end - start, self._reference_format(name))
+
+    @staticmethod
+    def _reference_format(name: str) -> QTextCharFormat:
+        """Create the format of a node reference."""
+        char_format = QTextCharFormat()
+        char_format.setBackground(QColor("#e0e0e0"))
+        char_format.setProperty(NODE_REFERENCE_PROPERTY, name)
+        return char_format
+
+    @staticmethod
+    def node_at(block: QTextBlock, position: int) -> Optional[str]:
+        """
+        Get the node referenced at a position within a block.
+
+        Args:
+            block: The text block
+            position: Character offset relative to the block start
+
+        Returns:
+            The node name, or None if the position is not on a reference
+        """
+        for format_range in block.layout().formats():
+            if format_range.start <= position < format_range.start + format_range.length:
+                name = format_range.format.property(NODE_REFERENCE_PROPERTY)
+                if name:
+                    return name
+        return None
@@ -1,13 +1,14 @@
-import re
 from typing import Optional
 
-from PyQt6.QtCore import pyqtSignal, Qt, QTimer
+from PyQt6.QtCore import pyqtSignal, Qt, QPoint, QPointF
 from PyQt6.QtGui import QMouseEvent
 from PyQt6.QtWidgets import QTextEdit, QWidget, QVBoxLayout
 from structlog import get_logger
 
 from ui.components.quick_relation_dialog import QuickRelationDialog
+from ui.components.text_editor.node_highlighter import NodeReferenceHighlighter
 from ui.components.text_editor.text_toolbar import TextToolbar
+from utils.html_text import unwrap_node_references
 
 logger = get_logger(__name__)
 
@@ -20,26 +21,41 @@ class LinkableTextEdit(QTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMouseTracking(True)
-        self._clickable_links = {}  # Maps positions to node names
+
+    def node_at(self, point: QPoint) -> Optional[str]:
+        """
+        Get the node referenced by the character under a viewport point.
+
+        Args:
+            point: Position in viewport coordinates
+
+        Returns:
+            The node name, or None if the point is not on a node reference
+        """
+        document_point = QPointF(
+            point.x() + self.horizontalScrollBar().value(),
+            point.y() + self.verticalScrollBar().value(),
+        )
+        position = self.document().documentLayout().hitTest(
+            document_point, Qt.HitTestAccuracy.ExactHit
+        )
+        if position < 0:
+            return None
+
+        block = self.document().findBlock(position)
+        return NodeReferenceHighlighter.node_at(block, position - block.position())
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Handle mouse press events to detect link clicks."""
         if event.button() == Qt.MouseButton.LeftButton:
-            cursor = self.cursorForPosition(event.pos())
-            char_format = cursor.charFormat()
-            if char_format.isAnchor():
-                node_name = char_format.anchorHref()
-                if node_name:
-                    self.linkClicked.emit(node_name)
-                    return
+            if node_name := self.node_at(event.pos()):
+                self.linkClicked.emit(node_name)
+                return
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """Handle mouse movement to update cursor."""
-        cursor = self.cursorForPosition(event.pos())
-        char_format = cursor.charFormat()
-
-        if char_format.isAnchor():
+        if self.node_at(event.pos()):
             self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
         else:
             self.viewport().setCursor(Qt.CursorShape.IBeamCursor)
@@ -70,17 +86,35 @@ class TextEditor(QWidget):
         """
         super().__init__(parent)
         self.main_ui = main_ui
-        self.name_cache_service = None
-
-        # Setup scanning timer
-        self.scan_timer = QTimer(self)
-        self.scan_timer.setInterval(2000)  # 2 seconds
-        self.scan_timer.setSingleShot(True)
-        self.scan_timer.timeout.connect(self._scan_for_node_names)
+        self._name_cache_service = None
+        self.highlighter: Optional[NodeReferenceHighlighter] = None
 
         self._setup_ui()
         self._connect_signals()
 
+    @property
+    def name_cache_service(self) -> Optional["NameCacheService"]:
+        """The name cache providing node names to link."""
+        return self._name_cache_service
+
+    @name_cache_service.setter
+    def name_cache_service(self, service: Optional["NameCacheService"]) -> None:
+        """Attach the name cache and start highlighting node references."""
+        if self.highlighter:
+            if self._name_cache_service:
+                self._name_cache_service.remove_change_listener(
+                    self.highlighter.rehighlight
+                )
+            self.highlighter.setDocument(None)
+            self.highlighter = None
+        self._name_cache_service = service
+
+        if service:
+            self.highlighter = NodeReferenceHighlighter(
+                self.text_edit.document(), service
+            )
+            service.add_change_listener(self.highlighter.rehighlight)
+
     def _setup_ui(self) -> None:
         """Initialize UI components."""
         layout = QVBoxLayout(self)
@@ -105,7 +139,6 @@ class TextEditor(QWidget):
 
     def _connect_signals(self) -> None:
         """Connect internal signals."""
-        self.text_edit.textChanged.connect(self._handle_text_changed)
         self.text_edit.textChanged.connect(self.textChanged.emit)
 
     def _show_context_menu(self, position) -> None:
@@ -120,78 +153,6 @@ class TextEditor(QWidget):
 
         menu.exec(self.text_edit.mapToGlobal(position))
 
-    def _scan_for_node_names(self) -> None:
-        """Scan the text content for node names and format them while preserving rich text."""
-        if not self.name_cache_service:
-            logger.warning("scan_skipped_service_not_initialized")
-            return
-
-        try:
-            # Get current cursor and selection state
-            cursor = self.text_edit.textCursor()
-            has_selection = cursor.hasSelection()
-            selection_start = cursor.selectionStart()
-            selection_end = cursor.selectionEnd()
-
-            # Store current content before formatting
-            original_content = self.text_edit.toHtml()
-
-            # Get cached node names and verify cache
-            node_names = self.name_cache_service.get_cached_names()
-            if not node_names:
-                return
-
-            # Create regex pattern from node names
-            sorted_names = sorted(node_names, key=len, reverse=True)
-            pattern = (
-                r"\b(" + "|".join(re.escape(name) for name in sorted_names) + r")\b"
-            )
-
-            # Split content into HTML tags and text
-            parts = re.split(r"(<[^>]+>)", original_content)
-
-            # Process each part
-            processed_parts = []
-            for part in parts:
-                if part.startswith("<"):
-                    processed_parts.append(part)  # Keep HTML tags as-is
-                else:
-                    # Apply node name highlighting only to text content
-                    processed = re.sub(
-                        pattern,
-                        lambda m: (
-                            f'<a href="{m.group(0)}" class="node-reference" '
-                            f'style="background-color: #e0e0e0; '
-                            f"border-radius: 3px; padding: 0 2px; "
-                            f'text-decoration: none; color: inherit;">'
-                            f"{m.group(0)}</a>"
-                        ),
-                        part,
-                    )
-                    processed_parts.append(processed)
-
-            # Join processed parts back together
-            processed_content = "".join(processed_parts)
-
-            # Block signals during HTML update to prevent recursion
-            self.text_edit.blockSignals(True)
-            try:
-                self.text_edit.setHtml(processed_content)
-
-                # Restore selection
-                cursor = self.text_edit.textCursor()
-                if has_selection:
-                    cursor.setPosition(selection_start)
-                    cursor.setPosition(selection_end, cursor.MoveMode.KeepAnchor)
-                else:
-                    cursor.setPosition(selection_start)
-                self.text_edit.setTextCursor(cursor)
-            finally:
-                self.text_edit.blockSignals(False)
-
-        except Exception as e:
-            logger.error("scan_failed", error=str(e))
-
     def _handle_create_node_request(self) -> None:
         """Handle request to create node from selected text."""
         cursor = self.text_edit.textCursor()
@@ -209,12 +170,6 @@ class TextEditor(QWidget):
                     target, rel_type, direction, str(properties)
                 )
 
-    def _handle_text_changed(self) -> None:
-        """Handle text changes and schedule a rescan."""
-        # Reset and restart the timer
-        if self.name_cache_service:
-            self.scan_timer.start()
-
     def _handle_node_click(self, url) -> None:
         """Handle clicks on node name links."""
         """Handle clicks on node name links."""
@@ -222,25 +177,12 @@ class TextEditor(QWidget):
             self.main_ui.name_input.setText(url)
 
     def setHtml(self, text: str) -> None:
-        """Set the HTML content of the editor."""
-        self.text_edit.setHtml(text)
+        """Set the HTML content of the editor, unwrapping legacy node links."""
+        self.text_edit.setHtml(unwrap_node_references(text))
 
     def toHtml(self) -> str:
-        """Get the content as HTML, cleaned for saving."""
-        """Get the content as HTML, cleaned for saving."""
-        current_html = self.text_edit.toHtml()
-
-        # First remove our link formatting
-        cleaned = re.sub(
-            r'<a href="[^"]*" class="node-reference"[^>]*style="[^"]*">([^<]+)</a>',
-            r"\1",  # Keep just the text content
-            current_html,
-        )
-
-        # Then remove any empty paragraphs that might have been created
-        cleaned = re.sub(r"<p[^>]*>\s*<br\s*/?>\s*</p>", "", cleaned)
-
-        return cleaned if cleaned else ""
+        """Get the content as HTML. Node highlighting is not part of the document."""
+        return self.text_edit.toHtml()
 
     def toPlainText(self) -> str:
         """Get the content as plain text."""
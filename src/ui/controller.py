@@ -2,7 +2,7 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Set, Tuple, Callable
 
 from PyQt6.QtCore import QObject, Qt, pyqtSlot, QTimer
 from PyQt6.QtGui import QStandardItem
@@ -14,10 +14,13 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QApplication,
     QFileDialog,
+    QListWidgetItem,
+    QProgressDialog,
 )
 from structlog import get_logger
 
 from models.completer_model import AutoCompletionUIHandler, CompleterInput
+from models.name_cache_model import NameDelta
 from models.property_model import PropertyItem
 from models.suggestion_model import SuggestionUIHandler, SuggestionResult
 from models.worker_model import WorkerOperation
@@ -29,8 +32,10 @@ from ui.components.dialogs import (
     SuggestionDialog,
     FastInjectDialog,
 )
+from ui.components.completers import CompleterDelegate, SeparatedValuesCompleter
 from ui.components.map_tab import MapTab
 from utils.error_handler import ErrorHandler
+from utils.export_manifest import ExportManifest
 
 logger = get_logger(__name__)
 
@@ -85,6 +90,13 @@ class WorldBuildingController(QObject):
         self.original_node_data: Optional[Dict[str, Any]] = None
         self.all_props: Dict[str, Any] = {}
 
+        # Large fields left out of the last load, fetched when shown
+        self.deferred_keys: List[str] = []
+        # Deferred fields being fetched, and those requested meanwhile
+        self._deferred_fetching: Set[str] = set()
+        self._deferred_wanted: Set[str] = set()
+        self._after_deferred_load: Optional[Callable[[], None]] = None
+
         # Connect ImageGroup signals
         self.ui.image_group.basic_image_changed.connect(
             self._handle_basic_image_changed
@@ -148,6 +160,7 @@ class WorldBuildingController(QObject):
                     if name == self.ui.name_input.text().strip():
                         logger.info("Wiping all_props for new node", new_name=name)
                         self.all_props = {}
+                        self._set_deferred_keys([])
                         self.ui.clear_all_fields()
 
             return callback
@@ -186,6 +199,7 @@ class WorldBuildingController(QObject):
 
         # Clear all fields to populate them again
         self.ui.clear_all_fields()
+        self._set_deferred_keys([])
 
         self.node_operations.load_node(
             name, self._handle_node_data, lambda: self.update_relationship_tree(name)
@@ -368,6 +382,12 @@ class WorldBuildingController(QObject):
         try:
             record = data[0]
             self._populate_node_fields(record)
+            self.auto_completion_service.record_visit(
+                self.ui.name_input.text().strip()
+            )
+            self.node_operations.load_mentioned_by(
+                self.ui.name_input.text().strip(), self._handle_mentioned_by
+            )
 
             # Simple direct all_props update from record
             self.all_props = record.get("all_props", {})
@@ -396,6 +416,9 @@ class WorldBuildingController(QObject):
             self.save_service.update_save_state(self.original_node_data)
             self.ui.save_button.setStyleSheet(self.config.colors.passiveSave)
 
+            self._set_deferred_keys(record.get("deferred_keys", []))
+            self.on_tab_changed(self.ui.tabs.currentIndex())
+
         except AttributeError as e:
             logger.error("invalid_data_format", error=str(e))
             self.error_handler.handle_error("Invalid data format in node properties")
@@ -403,6 +426,132 @@ class WorldBuildingController(QObject):
             logger.error("node_processing_error", error=str(e))
             self.error_handler.handle_error(f"Error processing node data: {str(e)}")
 
+    def on_tab_changed(self, index: int) -> None:
+        """
+        Fetch the deferred large fields shown on a tab when it becomes visible.
+
+        Args:
+            index: Index of the newly shown tab
+        """
+        widget = self.ui.tabs.widget(index)
+        if widget is self.ui.basic_info_tab:
+            self._load_deferred_fields(
+                [key for key in self.deferred_keys if key == "description"]
+            )
+        elif widget is self.ui.properties_tab:
+            self._load_deferred_fields(
+                [key for key in self.deferred_keys if key != "description"]
+            )
+
+    def _set_deferred_keys(self, keys: List[str]) -> None:
+        """
+        Track the large fields still missing from the loaded node.
+
+        Args:
+            keys: The deferred property keys
+        """
+        self.deferred_keys = list(keys)
+        self._deferred_fetching = set()
+        self._deferred_wanted = set()
+        if not keys:
+            self._after_deferred_load = None
+        self._update_deferred_fields_ui()
+
+    def _update_deferred_fields_ui(self) -> None:
+        """Lock the widgets whose large fields are still deferred."""
+        self.ui.set_deferred_fields_loading(
+            description="description" in self.deferred_keys,
+            properties=any(key != "description" for key in self.deferred_keys),
+        )
+
+    def _load_deferred_fields(
+        self,
+        keys: Optional[List[str]] = None,
+        on_loaded: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Fetch deferred large fields of the current node.
+
+        Args:
+            keys: The deferred keys to fetch, by default all of them
+            on_loaded: Optional callback once no fields are deferred
+        """
+        if on_loaded:
+            self._after_deferred_load = on_loaded
+        if not self.deferred_keys:
+            if on_loaded:
+                on_loaded()
+            return
+
+        self._deferred_wanted.update(self.deferred_keys if keys is None else keys)
+        self._fetch_wanted_fields()
+
+    def _fetch_wanted_fields(self) -> None:
+        """Fetch the requested deferred fields, one request at a time."""
+        if self._deferred_fetching:
+            return
+        keys = [key for key in self.deferred_keys if key in self._deferred_wanted]
+        self._deferred_wanted = set()
+        if not keys:
+            return
+
+        self._deferred_fetching = set(keys)
+        name = self.ui.name_input.text().strip()
+        self.node_operations.load_node_fields(
+            name,
+            keys,
+            lambda records: self._handle_deferred_fields(name, records),
+        )
+
+    def _handle_deferred_fields(self, name: str, records: List[Any]) -> None:
+        """
+        Populate the deferred large fields of a node.
+
+        The loaded values are folded into the original node data so they do
+        not count as unsaved changes, without absorbing edits made meanwhile.
+
+        Args:
+            name: Name of the node the fields were requested for
+            records: Records with "key" and "value" fields
+        """
+        if name != self.ui.name_input.text().strip() or not self._deferred_fetching:
+            return
+
+        fields = {record["key"]: record["value"] for record in records}
+        self.all_props.update(fields)
+        if "description" in fields:
+            self.ui.description_input.setHtml(fields["description"] or "")
+        for key, value in fields.items():
+            if key != "description" and self._should_display_property(key):
+                self._add_property_row(key, value)
+
+        # Fetched keys are no longer deferred, even if the node lost them
+        fetched = self._deferred_fetching
+        self._deferred_fetching = set()
+        self.deferred_keys = [key for key in self.deferred_keys if key not in fetched]
+        self._update_deferred_fields_ui()
+        on_loaded = None
+        if not self.deferred_keys:
+            on_loaded = self._after_deferred_load
+            self._after_deferred_load = None
+
+        current_data = self._get_current_node_data()
+        if self.original_node_data and current_data:
+            if "description" in fields:
+                self.original_node_data["description"] = current_data["description"]
+            loaded_props = current_data["additional_properties"]
+            for key in fields.keys() & loaded_props.keys():
+                self.original_node_data["additional_properties"][key] = loaded_props[
+                    key
+                ]
+            self.save_service.update_save_state(self.original_node_data)
+        self.update_unsaved_changes_indicator()
+
+        if on_loaded:
+            on_loaded()
+        else:
+            self._fetch_wanted_fields()
+
     def update_unsaved_changes_indicator(self) -> None:
         """Update the unsaved changes indicator based on current state."""
         current_data = self.node_operations.collect_node_data(
@@ -420,17 +569,15 @@ class WorldBuildingController(QObject):
         else:
             self.ui.save_button.setStyleSheet(self.config.colors.passiveSave)
 
-    def _handle_delete_success(self, _: Any) -> None:
+    def _handle_delete_success(self, result: Any) -> None:
         """
         Handle successful node deletion.
 
         Args:
-            _: The result of the delete operation.
+            result: The result of the delete operation.
         """
         try:
-            # Invalidate and rebuild name cache
-            self.name_cache_service.invalidate_cache()
-            self.name_cache_service.rebuild_cache()
+            self._update_name_cache(result)
 
             QMessageBox.information(self.ui, "Success", "Node deleted successfully")
             self._load_empty_state()
@@ -447,6 +594,7 @@ class WorldBuildingController(QObject):
         """Reset all UI components to their empty state while preserving headers and structure."""
 
         # Clear basic info fields
+        self._set_deferred_keys([])
         self.ui.name_input.setText("")
         self.ui.description_input.clear()
         self.ui.tags_input.clear()
@@ -461,6 +609,7 @@ class WorldBuildingController(QObject):
         self.ui.relationships_table.setHorizontalHeaderLabels(
             ["Type", "Related Node", "Direction", "Properties", " ", " "]
         )
+        self.ui.mentioned_by_list.clear()
 
         # Clear tree view
         tree_model = self.ui.tree_view.model()
@@ -533,8 +682,7 @@ class WorldBuildingController(QObject):
         Returns:
             Dict containing organized node data.
         """
-        node = record["n"]
-        node_properties = dict(node)
+        node_properties = record["all_props"]
 
         return {
             "node_properties": node_properties,
@@ -595,6 +743,11 @@ class WorldBuildingController(QObject):
         # Update save state to reflect changes
         self.update_unsaved_changes_indicator()
 
+    def on_relationships_changed(self, *_: Any) -> None:
+        """Refresh the map pins after rows of the relationships table changed."""
+        if self.ui.map_tab:
+            self.ui.map_tab.schedule_pin_refresh()
+
     def _handle_pin_click(self, target_node: str) -> None:
         """Handle pin click by loading the target node."""
 
@@ -748,6 +901,8 @@ class WorldBuildingController(QObject):
         Clean up resources.
         """
         self.save_service.stop_periodic_check()
+        self.name_cache_service.stop_drift_check()
+        self.name_cache_service.persist()
         self.worker_manager.cancel_all_workers()
         self.model.close()
 
@@ -771,6 +926,55 @@ class WorldBuildingController(QObject):
                 f"Error changing image - {result.error_message}"
             )
 
+    def generate_missing_thumbnails(self) -> None:
+        """Generate thumbnails for every node image that lacks them."""
+        self.node_operations.load_image_paths(self._start_thumbnail_generation)
+
+    def _start_thumbnail_generation(self, image_paths: List[str]) -> None:
+        """
+        Run the thumbnail job for the given images with a progress dialog.
+
+        Args:
+            image_paths: Paths of the node images.
+        """
+        progress = QProgressDialog(
+            "Generating thumbnails...", "Cancel", 0, 0, self.ui
+        )
+        progress.setWindowTitle("Thumbnails")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+
+        def on_progress(done: int, total: int) -> None:
+            progress.setMaximum(total)
+            progress.setValue(done)
+
+        def on_finished(count: int) -> None:
+            progress.close()
+            QMessageBox.information(
+                self.ui, "Thumbnails", f"Generated thumbnails for {count} image(s)."
+            )
+
+        worker = self.image_service.generate_thumbnails(
+            image_paths, on_progress, on_finished
+        )
+        if worker:
+            progress.canceled.connect(worker.cancel)
+        else:
+            progress.close()
+
+    def rebuild_mention_index(self) -> None:
+        """Add mention index entries for every description in the background."""
+
+        def on_indexed(count: int) -> None:
+            QMessageBox.information(
+                self.ui, "Mention Index", f"Indexed {count} mention(s)."
+            )
+            self.node_operations.load_mentioned_by(
+                self.ui.name_input.text().strip(), self._handle_mentioned_by
+            )
+
+        self.node_operations.index_mentions(None, on_indexed)
+
     def delete_basic_image(self) -> None:
         """Handle image deletion request from UI."""
         self.all_props["imagepath"] = None
@@ -781,21 +985,339 @@ class WorldBuildingController(QObject):
         """
         Generic export method that handles all export formats.
 
+        The checked nodes are read from the database in one query and
+        streamed into the writer of the format in a worker thread.
+
         Args:
-            format_type (str): The type of export format ('json', 'txt', 'csv', 'pdf')
+            format_type (str): The type of export format ('json', 'jsonl', 'txt', 'csv', 'pdf')
         """
-        selected_nodes = self.get_selected_nodes()
+        selected_nodes = self._get_export_nodes()
         if not selected_nodes:
-            QMessageBox.warning(self.ui, "Warning", "No nodes selected for export.")
             return
 
         try:
-            self.exporter.export(
-                format_type, selected_nodes, self._collect_node_data_for_export
-            )
+            file_name = self.exporter.get_file_name(format_type)
         except ValueError as e:
+            self.error_handler.handle_error(f"Export error: {str(e)}")
+            return
+        if not file_name:
+            return
+
+        self._run_export(
+            format_type,
+            selected_nodes,
+            lambda nodes: self.exporter.write_nodes(format_type, file_name, nodes),
+            lambda count: self.exporter.show_success_message(format_type),
+        )
+
+    def export_incremental(self, format_type: str) -> None:
+        """
+        Update an incremental export of the checked nodes in a directory.
+
+        Only nodes whose export version changed since the last run, because
+        they or their relationships changed, are exported again; nodes that
+        are no longer checked or no longer exist are removed from the export.
+
+        Args:
+            format_type (str): The type of export format ('json', 'jsonl', 'txt', 'csv', 'pdf')
+        """
+        selected_nodes = self._get_export_nodes()
+        if not selected_nodes:
+            return
 
+        try:
+            directory = self.exporter.get_directory(format_type)
+        except ValueError as e:
             self.error_handler.handle_error(f"Export error: {str(e)}")
+            return
+        if not directory:
+            return
+
+        self.node_operations.load_export_versions(
+            selected_nodes,
+            lambda versions: self._run_incremental_export(
+                format_type, directory, versions
+            ),
+        )
+
+    def _run_incremental_export(
+        self, format_type: str, directory: str, versions: Dict[str, str]
+    ) -> None:
+        """
+        Export the nodes changed since the last incremental export.
+
+        Args:
+            format_type (str): The type of export format.
+            directory (str): The export directory.
+            versions (Dict[str, str]): The export version of each node, by name.
+        """
+        manifest = ExportManifest.load(directory, format_type)
+        changed, removed = manifest.plan(versions)
+        logger.info(
+            "incremental_export_planned",
+            format=format_type,
+            changed=len(changed),
+            removed=len(removed),
+            unchanged=len(versions) - len(changed),
+        )
+
+        def on_success(count: int) -> None:
+            QMessageBox.information(
+                self.ui,
+                "Success",
+                f"Incremental {format_type.upper()} export updated: "
+                f"{count} node(s) exported, {len(removed)} removed.",
+            )
+
+        self._run_export(
+            format_type,
+            changed,
+            lambda nodes: self.exporter.write_incremental(
+                manifest, nodes, versions, removed
+            ),
+            on_success,
+        )
+
+    def _get_export_nodes(self) -> List[str]:
+        """Get the distinct checked nodes, warning if there are none."""
+        # The tree can list a node several times
+        selected_nodes = list(dict.fromkeys(self.get_selected_nodes()))
+        if not selected_nodes:
+            QMessageBox.warning(self.ui, "Warning", "No nodes selected for export.")
+        return selected_nodes
+
+    def _run_export(
+        self,
+        format_type: str,
+        names: List[str],
+        consume: Callable[[Any], None],
+        on_success: Callable[[int], None],
+    ) -> None:
+        """
+        Stream nodes into an export writer with a cancellable progress dialog.
+
+        Args:
+            format_type (str): The type of export format.
+            names (List[str]): Names of the nodes to export.
+            consume (Callable): Writer consuming the node data in the worker.
+            on_success (Callable): Called with the number of exported nodes.
+        """
+        progress = QProgressDialog(
+            f"Exporting {len(names)} nodes...", "Cancel", 0, len(names), self.ui
+        )
+        progress.setWindowTitle("Export")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(self.node_operations.cancel_export)
+
+        def on_progress(done: int, total: int) -> None:
+            progress.setValue(done)
+
+        def on_finished(count: int) -> None:
+            progress.close()
+            logger.info("export_finished", format=format_type, nodes=count)
+            on_success(count)
+
+        def on_error(message: str) -> None:
+            progress.close()
+            self.exporter.handle_error(
+                f"Error exporting as {format_type.upper()}: {message}"
+            )
+
+        self.node_operations.export_nodes(
+            names, consume, on_progress, on_finished, on_error
+        )
+
+    def backup_world(self) -> None:
+        """Write the whole world to a backup file chosen by the user."""
+        file_name, _ = QFileDialog.getSaveFileName(
+            self.ui, "Back Up World", "", "World Backup (*.nwb)"
+        )
+        if not file_name:
+            return
+        if not file_name.endswith(".nwb"):
+            file_name += ".nwb"
+
+        def on_success(counts: Dict[str, int]) -> None:
+            QMessageBox.information(
+                self.ui,
+                "Backup",
+                f"Backed up {counts['nodes']} nodes and "
+                f"{counts['relationships']} relationships.",
+            )
+
+        self._run_backup_job(
+            "Backing up world...",
+            self.node_operations.backup_world,
+            file_name,
+            on_success,
+        )
+
+    def restore_world(self) -> None:
+        """Replace the whole world with a backup file chosen by the user."""
+        file_name, _ = QFileDialog.getOpenFileName(
+            self.ui, "Restore World", "", "World Backup (*.nwb)"
+        )
+        if not file_name:
+            return
+
+        reply = QMessageBox.warning(
+            self.ui,
+            "Restore World",
+            "Restoring a backup replaces all current nodes and relationships. "
+            "The current world is kept until the backup is fully written, but "
+            "the final replacement cannot be cancelled. Continue?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        def on_success(counts: Dict[str, int]) -> None:
+            self.refresh_tree_view()
+            self.name_cache_service.invalidate_cache()
+            self.name_cache_service.rebuild_cache()
+            QMessageBox.information(
+                self.ui,
+                "Restore",
+                f"Restored {counts['nodes']} nodes and "
+                f"{counts['relationships']} relationships.",
+            )
+
+        self._run_backup_job(
+            "Restoring world...",
+            self.node_operations.restore_world,
+            file_name,
+            on_success,
+            committing_label="Replacing the current world...",
+        )
+
+    def _run_backup_job(
+        self,
+        label: str,
+        start: Callable[..., None],
+        file_name: str,
+        on_success: Callable[[Dict[str, int]], None],
+        committing_label: Optional[str] = None,
+    ) -> None:
+        """
+        Run a backup or restore with a cancellable progress dialog.
+
+        Args:
+            label (str): Text of the progress dialog.
+            start (Callable): The service method starting the job.
+            file_name (str): Path of the backup file.
+            on_success (Callable): Called with the node and relationship counts.
+            committing_label (str): For a restore, the text shown once it
+                replaces the world and can no longer be cancelled.
+        """
+        progress = QProgressDialog(label, "Cancel", 0, 0, self.ui)
+        progress.setWindowTitle("Backup")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(self.node_operations.cancel_backup)
+
+        def on_progress(done: int, total: int) -> None:
+            progress.setMaximum(total)
+            progress.setValue(done)
+
+        def on_finished(counts: Dict[str, int]) -> None:
+            progress.close()
+            on_success(counts)
+
+        def on_error(message: str) -> None:
+            progress.close()
+            self.error_handler.handle_error(f"Backup error: {message}")
+
+        if committing_label is None:
+            start(file_name, on_progress, on_finished, on_error)
+            return
+
+        def on_committing() -> None:
+            progress.canceled.disconnect(self.node_operations.cancel_backup)
+            progress.setCancelButton(None)
+            progress.setLabelText(committing_label)
+
+        start(file_name, on_progress, on_finished, on_error, on_committing)
+
+    def import_nodes_from_file(self) -> None:
+        """Import nodes from a CSV or JSON Lines file chosen by the user."""
+        file_name, _ = QFileDialog.getOpenFileName(
+            self.ui,
+            "Import Nodes",
+            "",
+            "Node Files (*.csv *.jsonl *.ndjson);;CSV Files (*.csv);;"
+            "JSON Lines Files (*.jsonl *.ndjson)",
+        )
+        if file_name:
+            self._run_import(file_name)
+
+    def import_nodes_from_folder(self) -> None:
+        """Import a folder of Fast Inject style files, one node per file."""
+        directory = QFileDialog.getExistingDirectory(self.ui, "Import Nodes from Folder")
+        if directory:
+            self._run_import(directory)
+
+    def import_markdown_vault(self) -> None:
+        """Import or re-sync a Markdown vault chosen by the user."""
+        directory = QFileDialog.getExistingDirectory(self.ui, "Import Markdown Vault")
+        if directory:
+            self._run_import(
+                directory,
+                self.node_operations.import_vault,
+                self.node_operations.cancel_vault_import,
+            )
+
+    def _run_import(
+        self,
+        path: str,
+        start: Optional[Callable[..., None]] = None,
+        cancel: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Run a bulk import with a cancellable progress dialog and report it.
+
+        Args:
+            path (str): The import source.
+            start (Callable): The service method starting the import, by
+                default the node import.
+            cancel (Callable): The service method cancelling that import, by
+                default the node import cancel.
+        """
+        start = start or self.node_operations.import_nodes
+        cancel = cancel or self.node_operations.cancel_import
+        progress = QProgressDialog("Importing nodes...", "Cancel", 0, 0, self.ui)
+        progress.setWindowTitle("Import")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(cancel)
+
+        def on_progress(done: int, total: int) -> None:
+            progress.setLabelText(f"Importing nodes... {done} rows written")
+
+        def on_finished(report: Any) -> None:
+            progress.close()
+            self.refresh_tree_view()
+            self.name_cache_service.invalidate_cache()
+            self.name_cache_service.rebuild_cache()
+            # Imported descriptions and names are not in the mention index yet
+            self.node_operations.index_mentions()
+
+            message_box = QMessageBox(self.ui)
+            message_box.setWindowTitle("Import")
+            message_box.setText(report.summary())
+            if report.errors:
+                message_box.setIcon(QMessageBox.Icon.Warning)
+                message_box.setDetailedText(
+                    "\n".join(f"{location}: {error}" for location, error in report.errors)
+                )
+            message_box.exec()
+
+        def on_error(message: str) -> None:
+            progress.close()
+            self.error_handler.handle_error(f"Import error: {message}")
+
+        start(path, on_progress, on_finished, on_error)
 
     def get_selected_nodes(self) -> List[str]:
         """
@@ -851,27 +1373,6 @@ class WorldBuildingController(QObject):
         logging.debug(f"Found checked nodes: {unique_nodes}")
         return unique_nodes
 
-    def _collect_node_data_for_export(self, node_name: str) -> Optional[Dict[str, Any]]:
-        """
-        Collect node data for export.
-
-        Args:
-            node_name (str): The name of the node to collect data for.
-
-        Returns:
-            Optional[Dict[str, Any]]: The collected node data.
-        """
-
-        return self.node_operations.collect_node_data(
-            name=node_name,
-            description=self.ui.description_input.toPlainText().strip(),
-            tags=self.ui.tags_input.text(),
-            labels=self.ui.labels_input.text(),
-            properties=self._collect_table_properties(),
-            relationships=self._collect_table_relationships(),
-            all_props=self.all_props,
-        )
-
     def load_last_modified_node(self) -> None:
         """Load the last modified node and display it in the UI."""
 
@@ -895,6 +1396,11 @@ class WorldBuildingController(QObject):
         if not self.node_operations.validate_node_name(name).is_valid:
             return
 
+        # Saving replaces every property, so deferred fields must be loaded
+        if self.deferred_keys:
+            self._load_deferred_fields(on_loaded=self.save_node)
+            return
+
         # Collect properties from UI
         properties = self._collect_table_properties()
         relationships = self._collect_table_relationships()
@@ -910,9 +1416,44 @@ class WorldBuildingController(QObject):
         )
 
         if node_data:
+            # Without valid names the matcher may be empty, and writing its
+            # result would wipe the mention index of this node
+            if self.name_cache_service.is_valid():
+                node_data["mentions"] = self._extract_mentions(name)
             self.node_operations.save_node(node_data, self._handle_save_success)
 
-    def _handle_save_success(self, _: Any) -> None:
+    def _extract_mentions(self, name: str) -> List[str]:
+        """
+        Find the node names mentioned in the current description.
+
+        Args:
+            name: Name of the node being saved, excluded from its own mentions
+
+        Returns:
+            Sorted names of the mentioned nodes
+        """
+        matcher = self.name_cache_service.get_name_matcher()
+        text = self.ui.description_input.toPlainText()
+        mentions = {mention for _, _, mention in matcher.find_all(text)}
+        mentions.discard(name)
+        return sorted(mentions)
+
+    def _handle_mentioned_by(self, records: List[Any]) -> None:
+        """Show the nodes mentioning the current node."""
+        self.ui.set_mentioned_by([record["name"] for record in records])
+
+    def on_mention_activated(self, item: QListWidgetItem) -> None:
+        """
+        Open a node from the mentioned-by list.
+
+        Args:
+            item: The activated list item
+        """
+        if item and item.text():
+            self.ui.name_input.setText(item.text())
+            self.load_node_data()
+
+    def _handle_save_success(self, result: Any) -> None:
         """Handle successful node save with proper UI updates."""
         msg_box = QMessageBox(self.ui)
         msg_box.setIcon(QMessageBox.Icon.Information)
@@ -924,9 +1465,8 @@ class WorldBuildingController(QObject):
         # Auto-close message after 1 second
         QTimer.singleShot(500, msg_box.accept)
 
-        # Invalidate and rebuild name cache
-        self.name_cache_service.invalidate_cache()
-        self.name_cache_service.rebuild_cache()
+        self._update_name_cache(result)
+        self.auto_completion_service.record_edit(self.ui.name_input.text().strip())
 
         # Refresh UI state
         self.refresh_tree_view()
@@ -938,6 +1478,25 @@ class WorldBuildingController(QObject):
         # Activate the basic info tab
         self.ui.tabs.setCurrentIndex(0)
 
+    def _update_name_cache(self, result: Any) -> None:
+        """
+        Update the name cache after a write.
+
+        Applies the name delta reported by the transaction in place and falls
+        back to a full rebuild when the write did not report one.
+
+        Args:
+            result: The result emitted by the write or delete worker.
+        """
+        if isinstance(result, NameDelta):
+            self.name_cache_service.apply_delta(result)
+            # Existing descriptions may mention the created nodes
+            if result.added:
+                self.node_operations.index_mentions(result.added)
+        else:
+            self.name_cache_service.invalidate_cache()
+            self.name_cache_service.rebuild_cache()
+
     def _get_current_node_data(self) -> Dict[str, Any]:
         """Get current node data from UI."""
         return self.node_operations.collect_node_data(
@@ -1024,9 +1583,13 @@ class WorldBuildingController(QObject):
 
             def create_completer(self, input: CompleterInput) -> QCompleter:
                 """Create a configured completer for the input widget."""
-                completer = QCompleter(input.model)
+                if input.separator:
+                    completer = SeparatedValuesCompleter(input.model, input.separator)
+                else:
+                    completer = QCompleter(input.model)
                 completer.setCaseSensitivity(input.case_sensitivity)
                 completer.setFilterMode(input.filter_mode)
+                completer.setCompletionMode(input.completion_mode)
 
                 # Connect completer activation signal to node data loading
                 if input.widget == self.controller.ui.name_input:
@@ -1046,6 +1609,17 @@ class WorldBuildingController(QObject):
                 table.setCellWidget(row, column, line_edit)
                 return line_edit
 
+            def setup_column_completer(
+                self,
+                table: QTableWidget,
+                column: int,
+                create_completer: Callable[[QLineEdit], QCompleter],
+            ) -> None:
+                """Edit a table column with line edits that complete."""
+                table.setItemDelegateForColumn(
+                    column, CompleterDelegate(create_completer, table)
+                )
+
         return UIHandler(self)
 
     def handle_fast_inject(self) -> None:
@@ -1,5 +1,5 @@
 import json
-from typing import Optional, Set
+from typing import List, Optional, Set
 
 from PyQt6.QtCore import pyqtSignal, Qt, QPoint
 from PyQt6.QtWidgets import (
@@ -19,6 +19,7 @@ from PyQt6.QtWidgets import (
     QTableWidget,
     QMenu,
     QHeaderView,
+    QListWidget,
     QMessageBox,
     QTableWidgetItem,
     QComboBox,
@@ -112,6 +113,12 @@ class WorldBuildingUI(QWidget):
         self.relationships_table.itemChanged.connect(
             self.controller.update_unsaved_changes_indicator
         )
+        self.relationships_table.itemChanged.connect(
+            self.controller.on_relationships_changed
+        )
+        self.relationships_table.model().rowsRemoved.connect(
+            self.controller.on_relationships_changed
+        )
 
         # Depth spinbox change
         self.depth_spinbox.valueChanged.connect(self.controller.on_depth_changed)
@@ -122,6 +129,14 @@ class WorldBuildingUI(QWidget):
         # FastInject
         self.fast_inject_button.clicked.connect(self.controller.handle_fast_inject)
 
+        # Fetch deferred large fields once their tab is shown
+        self.tabs.currentChanged.connect(self.controller.on_tab_changed)
+
+        # Mentioned-by navigation
+        self.mentioned_by_list.itemDoubleClicked.connect(
+            self.controller.on_mention_activated
+        )
+
     def setup_ui(self) -> None:
         """Connect signals and finalize UI setup after controller is set"""
         if not self.controller:
@@ -243,9 +258,11 @@ class WorldBuildingUI(QWidget):
         # Tabs
         self.tabs = QTabWidget()
         self.tabs.setObjectName("mainTabs")
-        self.tabs.addTab(self._create_basic_info_tab(), "Basic Info")
+        self.basic_info_tab = self._create_basic_info_tab()
+        self.properties_tab = self._create_properties_tab()
+        self.tabs.addTab(self.basic_info_tab, "Basic Info")
         self.tabs.addTab(self._create_relationships_tab(), "Relationships")
-        self.tabs.addTab(self._create_properties_tab(), "Properties")
+        self.tabs.addTab(self.properties_tab, "Properties")
 
         # Add label change monitoring
         self.labels_input.textChanged.connect(self._handle_label_changes)
@@ -390,8 +407,15 @@ class WorldBuildingUI(QWidget):
         # Set up columns
         self._setup_relationships_table_columns()
 
+        # Nodes whose descriptions mention this node
+        self.mentioned_by_list = QListWidget()
+        self.mentioned_by_list.setObjectName("mentionedByList")
+        self.mentioned_by_list.setMaximumHeight(120)
+
         layout.addWidget(self.add_rel_button)
         layout.addWidget(self.relationships_table)
+        layout.addWidget(QLabel("Mentioned By"))
+        layout.addWidget(self.mentioned_by_list)
 
         return tab
 
@@ -542,6 +566,7 @@ class WorldBuildingUI(QWidget):
         self.tags_input.clear()
         self.properties_table.setRowCount(0)
         self.relationships_table.setRowCount(0)
+        self.mentioned_by_list.clear()
         self.image_group.set_basic_image(None)
 
         # Clear map tab if it exists
@@ -551,6 +576,27 @@ class WorldBuildingUI(QWidget):
                 self.tabs.removeTab(map_tab_index)
             self.map_tab = None
 
+    def set_mentioned_by(self, names: List[str]) -> None:
+        """
+        Show the nodes whose descriptions mention the current node.
+
+        Args:
+            names: Names of the mentioning nodes
+        """
+        self.mentioned_by_list.clear()
+        self.mentioned_by_list.addItems(names)
+
+    def set_deferred_fields_loading(self, description: bool, properties: bool) -> None:
+        """
+        Lock the description and properties while their large fields load.
+
+        Args:
+            description: True while the description is deferred
+            properties: True while large properties are deferred
+        """
+        self.description_input.setEnabled(not description)
+        self.properties_table.setEnabled(not properties)
+
     def set_image(self, image_path: Optional[str]) -> None:
         """Set image with proper scaling and error handling."""
         self.image_group.set_basic_image(image_path)
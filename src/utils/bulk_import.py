@@ -0,0 +1,292 @@
+"""
+This module provides the readers and row normalization of bulk node imports
+from CSV, JSON Lines and directories of Fast Inject style JSON files.
+"""
+
+import csv
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from utils.converters import NamingConventionConverter as ncc
+from utils.parsers import parse_comma_separated
+from utils.validation import validate_node_name
+
+# Relationships as written by the CSV and TXT exporters
+RELATIONSHIP_PATTERN = re.compile(
+    r"Type: (?P<type>.*?), Target: (?P<target>.*?), Direction: (?P<direction>\S+), "
+    r"Properties: (?P<properties>\{.*?\})(?=\s*;\s*Type: |\s*$)"
+)
+DIRECTIONS = {">": ">", "<": "<", "OUTGOING": ">", "INCOMING": "<"}
+CSV_COLUMNS = {
+    "name": "name",
+    "description": "description",
+    "tags": "tags",
+    "labels": "labels",
+    "relationships": "relationships",
+    "additional properties": "additional_properties",
+}
+FAST_INJECT_SUFFIXES = (".fi", ".json")
+
+# A row location, such as "line 12", and a function parsing the row
+ImportRow = Tuple[str, Callable[[], Dict[str, Any]]]
+
+
+@dataclass
+class ImportReport:
+    """Outcome of a bulk import."""
+
+    rows: int = 0
+    # Rows skipped because they match what an earlier import wrote
+    unchanged: int = 0
+    created: int = 0
+    updated: int = 0
+    stubs: int = 0
+    relationships: int = 0
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows read per second over the whole import."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        """Describe the import in one paragraph."""
+        unchanged = f"{self.unchanged} unchanged, " if self.unchanged else ""
+        return (
+            f"Imported {self.created + self.updated} of {self.rows} rows in "
+            f"{self.seconds:.1f} s ({self.rows_per_second:.0f} rows/s): "
+            f"{unchanged}{self.created} created, {self.updated} updated, "
+            f"{self.stubs} stub targets, {self.relationships} relationships, "
+            f"{len(self.errors)} errors."
+        )
+
+
+def iter_import_rows(path: str) -> Iterator[ImportRow]:
+    """
+    Stream the rows of an import source.
+
+    Files are read lazily row by row; parsing a row is deferred to the
+    returned function so a bad row is reported without stopping the import.
+
+    Args:
+        path: A CSV or JSON Lines file, or a directory of ``.fi`` files.
+
+    Yields:
+        ImportRow: The location and parse function of each row.
+
+    Raises:
+        ValueError: If the source type is not supported.
+    """
+    if os.path.isdir(path):
+        yield from _fast_inject_rows(path)
+    elif path.lower().endswith(".csv"):
+        yield from _csv_rows(path)
+    elif path.lower().endswith((".jsonl", ".ndjson")):
+        yield from _jsonl_rows(path)
+    else:
+        raise ValueError(f"Unsupported import source: {path}")
+
+
+def _csv_rows(path: str) -> Iterator[ImportRow]:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield f"line {reader.line_num}", partial(_decode_csv, row)
+
+
+def _decode_csv(row: Dict[str, str]) -> Dict[str, Any]:
+    """Map a CSV row to node data; unknown columns become properties."""
+    node: Dict[str, Any] = {"properties": {}}
+    for column, value in row.items():
+        if column is None or value is None or not value.strip():
+            continue
+        key = CSV_COLUMNS.get(column.strip().lower())
+        if key:
+            node[key] = value.strip()
+        else:
+            node["properties"][column.strip()] = value.strip()
+    return node
+
+
+def _jsonl_rows(path: str) -> Iterator[ImportRow]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.strip():
+                yield f"line {line_number}", partial(_decode_jsonl, line)
+
+
+def _decode_jsonl(line: str) -> Dict[str, Any]:
+    try:
+        node = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    if not isinstance(node, dict):
+        raise ValueError("Line is not a JSON object")
+    return node
+
+
+def _fast_inject_rows(path: str) -> Iterator[ImportRow]:
+    with os.scandir(path) as entries:
+        files = sorted(
+            entry.path
+            for entry in entries
+            if entry.is_file() and entry.name.lower().endswith(FAST_INJECT_SUFFIXES)
+        )
+    for file_path in files:
+        yield os.path.basename(file_path), partial(_decode_fast_inject, file_path)
+
+
+def _decode_fast_inject(file_path: str) -> Dict[str, Any]:
+    """Map a Fast Inject style file to node data."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("File is not a JSON object")
+    content = data.get("content", {})
+    return {
+        "name": data.get("name"),
+        "description": data.get("description"),
+        "labels": content.get("labels", []),
+        "tags": content.get("tags", []),
+        "relationships": content.get("relationships", []),
+        "additional_properties": content.get("properties", {}),
+    }
+
+
+def _parse_list(value: Any) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        return parse_comma_separated(value)
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    raise ValueError(f"Expected a list, got {type(value).__name__}")
+
+
+def _parse_properties(value: Any) -> Dict[str, Any]:
+    """Parse properties given as a dict or as ``key: value; ...`` text."""
+    if not value:
+        return {}
+    if isinstance(value, dict):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(f"Expected properties, got {type(value).__name__}")
+    properties = {}
+    for item in value.split(";"):
+        if not item.strip():
+            continue
+        key, separator, property_value = item.partition(":")
+        if not separator or not key.strip():
+            raise ValueError(f"Invalid property {item.strip()!r}")
+        properties[key.strip()] = property_value.strip()
+    return properties
+
+
+def _parse_relationship(value: Any) -> Tuple[str, str, str, Dict[str, Any]]:
+    """Parse a relationship given as a list or dict."""
+    if isinstance(value, dict):
+        value = (
+            value.get("type") or value.get("relationship"),
+            value.get("target"),
+            value.get("direction", ">"),
+            value.get("properties") or {},
+        )
+    if not isinstance(value, (list, tuple)) or len(value) not in (3, 4):
+        raise ValueError(f"Invalid relationship {value!r}")
+    rel_type, target, direction, *properties = value
+    properties = properties[0] if properties else {}
+    if not rel_type or not target or direction not in DIRECTIONS:
+        raise ValueError(f"Invalid relationship {value!r}")
+    if not isinstance(properties, dict):
+        raise ValueError(f"Invalid properties of relationship to {target}")
+    return str(rel_type), str(target).strip(), DIRECTIONS[direction], properties
+
+
+def _parse_relationships(value: Any) -> List[Tuple[str, str, str, Dict[str, Any]]]:
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [_parse_relationship(rel) for rel in value]
+    if not isinstance(value, str):
+        raise ValueError(f"Expected relationships, got {type(value).__name__}")
+
+    relationships = []
+    position = 0
+    text = value.strip()
+    for match in RELATIONSHIP_PATTERN.finditer(text):
+        if text[position : match.start()].strip(" ;"):
+            break
+        relationships.append(
+            _parse_relationship(
+                (
+                    match["type"],
+                    match["target"],
+                    match["direction"],
+                    json.loads(match["properties"]),
+                )
+            )
+        )
+        position = match.end()
+    if text[position:].strip(" ;"):
+        raise ValueError(f"Invalid relationships {text[position:].strip()!r}")
+    return relationships
+
+
+def normalize_node(raw: Dict[str, Any], max_name_length: int) -> Dict[str, Any]:
+    """
+    Validate a parsed row and convert it to the node data of a save.
+
+    Labels, property keys and relationship types are converted with the
+    NamingConventionConverter exactly as when a node is saved from the UI.
+
+    Args:
+        raw: Node data with lists given as lists or comma-separated text,
+            relationships as lists, dicts or exported text and properties as
+            a dict or ``key: value; ...`` text.
+        max_name_length: Maximum length of a node name.
+
+    Returns:
+        Dict[str, Any]: The node data.
+
+    Raises:
+        ValueError: If the row is invalid.
+    """
+    name = str(raw.get("name") or "").strip()
+    validation = validate_node_name(name, max_name_length)
+    if not validation.is_valid:
+        raise ValueError(validation.error_message)
+
+    # System properties are never imported and empty values are left unset
+    properties = {
+        key: value
+        for key, value in {
+            **_parse_properties(raw.get("additional_properties")),
+            **_parse_properties(raw.get("properties")),
+        }.items()
+        if not str(key).startswith("_") and value not in ("", None)
+    }
+    node_data = ncc.convert_node_data(
+        {
+            "name": name,
+            "description": str(raw.get("description") or ""),
+            "tags": _parse_list(raw.get("tags")),
+            "labels": _parse_list(raw.get("labels")),
+            "relationships": _parse_relationships(raw.get("relationships")),
+            "additional_properties": properties,
+        }
+    )
+    node_data["labels"] = [label for label in node_data["labels"] if label]
+    node_data["additional_properties"] = {
+        key: value
+        for key, value in node_data["additional_properties"].items()
+        if key and not key.startswith("_") and key not in ("name", "description", "tags")
+    }
+    for rel_type, target, _, _ in node_data["relationships"]:
+        if not rel_type or rel_type.startswith("_"):
+            raise ValueError(f"Invalid relationship type {rel_type!r} to {target}")
+    return node_data
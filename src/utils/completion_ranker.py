@@ -0,0 +1,180 @@
+"""
+This module provides the CompletionRanker class, which orders autocompletion
+candidates by match quality, recency, edit frequency and node degree.
+"""
+
+import heapq
+import math
+import time
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional
+
+from utils.usage_log import UsageLog
+
+# Score weights; match quality dominates so usage only reorders comparable matches
+QUALITY_WEIGHT = 1.0
+RECENCY_WEIGHT = 0.6
+FREQUENCY_WEIGHT = 0.3
+DEGREE_WEIGHT = 0.2
+
+FUZZY_QUALITY = 0.2  # Match quality of names only matched with typos
+
+RECENCY_HALF_LIFE_DAYS = 7.0
+FREQUENCY_SATURATION = 50  # Edits at which the frequency score stops growing
+DEGREE_SATURATION = 100  # Relationships at which the degree score stops growing
+
+
+@lru_cache(maxsize=1024)
+def _degree_score(degree: int) -> float:
+    return min(1.0, math.log1p(degree) / math.log1p(DEGREE_SATURATION))
+
+
+class CompletionRanker:
+    """
+    Ranks completion candidates and selects the best ones with a bounded heap.
+
+    Args:
+        usage_log: Source of visit times and edit counts.
+        degree_lookup: Returns the relationship count of a node name.
+    """
+
+    def __init__(
+        self,
+        usage_log: UsageLog,
+        degree_lookup: Optional[Callable[[str], int]] = None,
+    ) -> None:
+        """
+        Initialize the ranker.
+
+        Args:
+            usage_log: Source of visit times and edit counts.
+            degree_lookup: Returns the relationship count of a node name.
+        """
+        self.usage_log = usage_log
+        self.degree_lookup = degree_lookup or (lambda name: 0)
+
+    @staticmethod
+    def match_quality(query: str, name: str) -> float:
+        """
+        Score how well a name matches the typed text.
+
+        Exact matches beat prefixes, prefixes beat word starts, and word starts
+        beat plain infix matches. Shorter names score slightly higher.
+
+        Args:
+            query: The case-folded typed text.
+            name: The candidate name.
+
+        Returns:
+            float: A score between 0 and 1.1, 0 if the name does not match.
+        """
+        folded = name.casefold()
+        if not query:
+            return 0.5
+        if folded == query:
+            return 1.1
+
+        position = folded.find(query)
+        if position < 0:
+            return 0.0
+        if position == 0:
+            base = 0.8
+        elif not folded[position - 1].isalnum():
+            base = 0.6
+        else:
+            base = 0.4
+        return base + 0.1 * len(query) / len(folded)
+
+    def base_score(self, query: str, name: str, fuzzy: bool = False) -> float:
+        """
+        Compute the score of a candidate from match quality and degree alone.
+
+        This is the full score of names without recorded usage.
+
+        Args:
+            query: The case-folded typed text.
+            name: The candidate name.
+            fuzzy: Whether the name is known to match the text with typos.
+
+        Returns:
+            float: The score, 0 if the name does not match.
+        """
+        quality = self.match_quality(query, name)
+        if quality == 0.0:
+            if not fuzzy:
+                return 0.0
+            quality = FUZZY_QUALITY
+        return QUALITY_WEIGHT * quality + DEGREE_WEIGHT * _degree_score(
+            self.degree_lookup(name)
+        )
+
+    def score(self, query: str, name: str, now: float, fuzzy: bool = False) -> float:
+        """
+        Compute the combined ranking score of a candidate.
+
+        Args:
+            query: The case-folded typed text.
+            name: The candidate name.
+            now: The current epoch time.
+            fuzzy: Whether the name is known to match the text with typos.
+
+        Returns:
+            float: The candidate score, higher is better.
+        """
+        score = self.base_score(query, name, fuzzy)
+        if score == 0.0:
+            return 0.0
+
+        recency = 0.0
+        if visited := self.usage_log.last_visit(name):
+            age_days = max(0.0, now - visited) / 86400
+            recency = 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+
+        frequency = min(
+            1.0,
+            math.log1p(self.usage_log.edit_count(name))
+            / math.log1p(FREQUENCY_SATURATION),
+        )
+
+        return score + RECENCY_WEIGHT * recency + FREQUENCY_WEIGHT * frequency
+
+    def rank(
+        self,
+        text: str,
+        candidates: Iterable[str],
+        limit: int,
+        fuzzy: Iterable[str] = (),
+    ) -> List[str]:
+        """
+        Select the best candidates for the typed text.
+
+        Args:
+            text: The typed text.
+            candidates: Names to rank, in tie-break order; non-matches are dropped.
+            limit: Number of names to return.
+            fuzzy: Candidates that match the text with typos rather than exactly.
+
+        Returns:
+            List[str]: Up to ``limit`` names, best first.
+        """
+        query = text.casefold()
+        now = time.time()
+        fuzzy_names = set(fuzzy)
+        # Usage terms are only looked up for logged names, which keeps ranking
+        # a full match set of tens of thousands of names cheap
+        logged = set(self.usage_log.names())
+        scored = (
+            (score, name)
+            for name in dict.fromkeys(candidates)
+            if (
+                score := (
+                    self.score(query, name, now, name in fuzzy_names)
+                    if name in logged
+                    else self.base_score(query, name, name in fuzzy_names)
+                )
+            )
+            > 0.0
+        )
+        # nlargest is stable, so ties keep the candidates' input order
+        best = heapq.nlargest(limit, scored, key=lambda item: item[0])
+        return [name for _, name in best]
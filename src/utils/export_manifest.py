@@ -0,0 +1,221 @@
+"""
+This module provides the ExportManifest class, which records what an
+incremental export last wrote so later runs only redo what changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+MANIFEST_NAME = "export_manifest.json"
+MANIFEST_VERSION = 2
+PARTS_DIR = "nodes"
+COMBINED_NAME = "world"
+
+
+def export_version(modified: Any, relationships: List[Any]) -> str:
+    """
+    Compute the export version of a node.
+
+    Args:
+        modified: The node's ``_modified`` value.
+        relationships: The node's relationships as exported, in any order.
+
+    Returns:
+        str: A SHA-256 hex digest that changes whenever either changes.
+    """
+    encoded = sorted(
+        json.dumps(rel, sort_keys=True, default=str) for rel in relationships
+    )
+    return hashlib.sha256(
+        json.dumps([str(modified), encoded]).encode("utf-8")
+    ).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    """Compute the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExportManifest:
+    """
+    Manifest of an incremental export directory.
+
+    The directory holds one part per node under ``nodes/`` and the combined
+    export ``world.<format>`` assembled from the parts in name order. For
+    every node the manifest records its export version (see export_version),
+    its part file, the SHA-256 of the part and, for PDF, whether the part
+    carries the report title, which only the first part in name order does.
+
+    Args:
+        directory: The export directory.
+        format_type: The export format.
+        nodes: Manifest entries by node name.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        format_type: str,
+        nodes: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Initialize the manifest.
+
+        Args:
+            directory: The export directory.
+            format_type: The export format.
+            nodes: Manifest entries by node name.
+        """
+        self.directory = directory
+        self.format_type = format_type
+        self.nodes: Dict[str, Dict[str, Any]] = nodes or {}
+
+    @classmethod
+    def load(cls, directory: str, format_type: str) -> "ExportManifest":
+        """
+        Load the manifest of a directory.
+
+        Args:
+            directory: The export directory.
+            format_type: The export format.
+
+        Returns:
+            ExportManifest: The manifest, empty if there is none for the format.
+        """
+        try:
+            with open(os.path.join(directory, MANIFEST_NAME), "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(directory, format_type)
+        if (
+            data.get("version") != MANIFEST_VERSION
+            or data.get("format") != format_type
+        ):
+            return cls(directory, format_type)
+        return cls(directory, format_type, data.get("nodes", {}))
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "format": self.format_type,
+            "nodes": self.nodes,
+        }
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f, indent=1)
+        os.replace(temp_path, path)
+
+    @property
+    def combined_path(self) -> str:
+        """Path of the combined export."""
+        return os.path.join(self.directory, f"{COMBINED_NAME}.{self.format_type}")
+
+    def part_path(self, name: str) -> str:
+        """
+        Get the path of a node's part.
+
+        The file name is the node name made filesystem safe plus a short hash
+        of the exact name, so different names never share a part.
+
+        Args:
+            name: The node name.
+
+        Returns:
+            str: The part path.
+        """
+        entry = self.nodes.get(name)
+        if entry:
+            return os.path.join(self.directory, PARTS_DIR, entry["file"])
+        safe = re.sub(r"[^\w\-]+", "_", name).strip("_")[:60] or "node"
+        suffix = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+        file = f"{safe}-{suffix}.{self.format_type}"
+        return os.path.join(self.directory, PARTS_DIR, file)
+
+    def titled(self, name: str, first: Optional[str]) -> bool:
+        """
+        Check whether a node's part carries the report title.
+
+        Only the part of the first node in name order of a PDF export does,
+        so the combined PDF matches a full export of the same nodes.
+
+        Args:
+            name: The node name.
+            first: The first exported node name in name order.
+
+        Returns:
+            bool: True if the part carries the title.
+        """
+        return self.format_type == "pdf" and name == first
+
+    def plan(self, versions: Dict[str, str]) -> Tuple[List[str], List[str]]:
+        """
+        Compare the current nodes with the manifest.
+
+        Args:
+            versions: The export version of every node to export, by name.
+
+        Returns:
+            Tuple[List[str], List[str]]: The nodes to render again because they
+            are new, changed, lost their part or moved to or from the title
+            position, and the recorded nodes that are no longer exported.
+        """
+        first = min(versions, default=None)
+        changed = [
+            name
+            for name, version in versions.items()
+            if name not in self.nodes
+            or self.nodes[name]["version"] != version
+            or self.nodes[name].get("titled", False) != self.titled(name, first)
+            or not os.path.exists(self.part_path(name))
+        ]
+        removed = [name for name in self.nodes if name not in versions]
+        return changed, removed
+
+    def record(
+        self, name: str, version: Optional[str], digest: str, titled: bool = False
+    ) -> bool:
+        """
+        Record the part written for a node.
+
+        Args:
+            name: The node name.
+            version: The node's export version at export time.
+            digest: The SHA-256 of the part.
+            titled: Whether the part carries the report title.
+
+        Returns:
+            bool: True if the part content differs from the recorded one.
+        """
+        previous = self.nodes.get(name)
+        self.nodes[name] = {
+            "version": version,
+            "file": os.path.basename(self.part_path(name)),
+            "sha256": digest,
+            "titled": titled,
+        }
+        return not previous or previous["sha256"] != digest
+
+    def forget(self, name: str) -> None:
+        """
+        Remove a node and its part.
+
+        Args:
+            name: The node name.
+        """
+        path = self.part_path(name)
+        self.nodes.pop(name, None)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def part_paths(self) -> List[str]:
+        """Get the part paths of all recorded nodes in name order."""
+        return [self.part_path(name) for name in sorted(self.nodes)]
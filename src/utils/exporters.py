@@ -1,12 +1,45 @@
-import html
+import csv
+import hashlib
+import io
 import json
-from typing import Callable, Tuple
-from typing import Dict, Any, List
+import os
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from typing import Dict, Any
 
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+
+from utils.export_manifest import PARTS_DIR, ExportManifest, file_hash
+from utils.pdf_export import export_to_pdf_parallel, merge_pdfs, render_pdf_parts
+
+# Write buffer of the streaming writers
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _csv_row(values: List[Any]) -> str:
+    """Encode one CSV row with the csv module's quoting."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+class TextLayout(NamedTuple):
+    """How the encoded nodes of a text format are joined into a file."""
+
+    prefix: str  # Before the first node
+    separator: str  # Between nodes
+    suffix: str  # After the last node
+    empty: str  # Whole file without nodes
+
+
+CSV_HEADER = _csv_row(
+    ["Name", "Description", "Tags", "Labels", "Relationships", "Additional Properties"]
+)
+TEXT_LAYOUTS = {
+    "json": TextLayout("[\n", ",\n", "\n]", "[]"),
+    "jsonl": TextLayout("", "", "", ""),
+    "txt": TextLayout("", "", "", ""),
+    "csv": TextLayout(CSV_HEADER, "", "", CSV_HEADER),
+}
 
 
 class Exporter:
@@ -29,31 +62,35 @@ class Exporter:
         self.ui = ui
         self.config = config
         self._format_handlers = {
-            "json": self._handle_json,
-            "txt": self._handle_txt,
-            "csv": self._handle_csv,
+            "json": lambda *args: self._handle_text("json", *args),
+            "jsonl": lambda *args: self._handle_text("jsonl", *args),
+            "txt": lambda *args: self._handle_text("txt", *args),
+            "csv": lambda *args: self._handle_text("csv", *args),
             "pdf": self._handle_pdf,
         }
+        self._fragment_encoders = {
+            "json": self._encode_json,
+            "jsonl": self._encode_jsonl,
+            "txt": self._encode_txt,
+            "csv": self._encode_csv,
+        }
         self._file_types = {
             "json": "JSON Files (*.json)",
+            "jsonl": "JSON Lines Files (*.jsonl)",
             "txt": "Text Files (*.txt)",
             "csv": "CSV Files (*.csv)",
             "pdf": "PDF Files (*.pdf)",
         }
 
-    def export(
-        self,
-        format_type: str,
-        selected_nodes: List[str],
-        collect_node_data: Callable[[str], Dict[str, Any]],
-    ) -> None:
+    def get_file_name(self, format_type: str) -> str:
         """
-        Main export method that handles all export formats.
+        Get file name from save dialog.
 
         Args:
             format_type (str): The type of export format (e.g., 'json', 'txt', 'csv', 'pdf').
-            selected_nodes (List[str]): The list of selected node names.
-            collect_node_data (Callable[[str], Dict[str, Any]]): The function to collect node data.
+
+        Returns:
+            str: The selected file name, empty if the dialog was cancelled.
 
         Raises:
             ValueError: If the format type is unsupported.
@@ -61,54 +98,145 @@ class Exporter:
         if format_type not in self._format_handlers:
             raise ValueError(f"Unsupported format: {format_type}")
 
-        file_name = self._get_file_name(format_type)
-        if not file_name:
-            return
+        file_name, _ = QFileDialog.getSaveFileName(
+            self.ui,
+            f"Export as {format_type.upper()}",
+            "",
+            self._file_types[format_type],
+        )
+        return file_name
 
-        try:
-            nodes_data = self._collect_nodes_data(selected_nodes, collect_node_data)
-            if not nodes_data:
-                return
+    def write_nodes(
+        self, format_type: str, file_name: str, nodes: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Write node data to a file in the given format.
+
+        Does not touch the UI, so it can run in an export worker. The output
+        is written to a temporary file that only replaces the target once
+        complete, so a failed or cancelled export leaves no partial file.
+
+        Args:
+            format_type (str): The type of export format (e.g., 'json', 'txt', 'csv', 'pdf').
+            file_name (str): The name of the file to save.
+            nodes (Iterable[Dict[str, Any]]): The node data to export.
+
+        Raises:
+            ValueError: If the format type is unsupported.
+        """
+        if format_type not in self._format_handlers:
+            raise ValueError(f"Unsupported format: {format_type}")
 
-            self._format_handlers[format_type](file_name, nodes_data)
-            self._show_success_message(format_type)
-        except Exception as e:
-            self._handle_error(f"Error exporting as {format_type.upper()}: {str(e)}")
+        temp_name = f"{file_name}.part"
+        try:
+            self._format_handlers[format_type](temp_name, nodes)
+            os.replace(temp_name, file_name)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
 
-    def _get_file_name(self, format_type: str) -> str:
+    def get_directory(self, format_type: str) -> str:
         """
-        Get file name from save dialog.
+        Get the directory of an incremental export from a dialog.
 
         Args:
             format_type (str): The type of export format (e.g., 'json', 'txt', 'csv', 'pdf').
 
         Returns:
-            str: The selected file name.
+            str: The selected directory, empty if the dialog was cancelled.
+
+        Raises:
+            ValueError: If the format type is unsupported.
         """
-        file_name, _ = QFileDialog.getSaveFileName(
-            self.ui,
-            f"Export as {format_type.upper()}",
-            "",
-            self._file_types[format_type],
+        if format_type not in self._format_handlers:
+            raise ValueError(f"Unsupported format: {format_type}")
+
+        return QFileDialog.getExistingDirectory(
+            self.ui, f"Incremental {format_type.upper()} Export Directory"
         )
-        return file_name
 
-    def _collect_nodes_data(
+    def write_incremental(
         self,
-        selected_nodes: List[str],
-        collect_node_data: Callable[[str], Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
+        manifest: ExportManifest,
+        nodes_data: Iterable[Dict[str, Any]],
+        versions: Dict[str, str],
+        removed: List[str],
+    ) -> None:
         """
-        Collect data for all selected nodes.
+        Update an incremental export with changed and removed nodes.
+
+        Each given node is rendered to its own part, the parts of removed
+        nodes are deleted and the combined export is reassembled from the
+        parts, unless no part content changed. The manifest is saved last,
+        so an interrupted run is redone by the next one. Does not touch the
+        UI, so it can run in an export worker.
 
         Args:
-            selected_nodes (List[str]): The list of selected node names.
-            collect_node_data (Callable[[str], Dict[str, Any]]): The function to collect node data.
+            manifest (ExportManifest): The manifest of the export directory.
+            nodes_data (Iterable[Dict[str, Any]]): The changed nodes.
+            versions (Dict[str, str]): The export version of every exported
+                node, by name.
+            removed (List[str]): Recorded nodes that are no longer exported.
+        """
+        format_type = manifest.format_type
+        os.makedirs(os.path.join(manifest.directory, PARTS_DIR), exist_ok=True)
+
+        content_changed = bool(removed)
+        for name in removed:
+            manifest.forget(name)
+
+        if format_type == "pdf":
+            first = min(versions, default=None)
+            rendered: List[str] = []
+
+            def parts() -> Iterable[Tuple[str, Dict[str, Any], bool]]:
+                for node_data in nodes_data:
+                    name = node_data["name"]
+                    rendered.append(name)
+                    yield manifest.part_path(name), node_data, manifest.titled(
+                        name, first
+                    )
 
-        Returns:
-            List[Dict[str, Any]]: The list of collected node data.
-        """
-        return [data for node in selected_nodes if (data := collect_node_data(node))]
+            render_pdf_parts(
+                parts(),
+                self.config.PDF_EXPORT_CHUNK_SIZE,
+                self.config.PDF_EXPORT_WORKERS or None,
+            )
+            for name in rendered:
+                digest = file_hash(manifest.part_path(name))
+                content_changed |= manifest.record(
+                    name, versions.get(name), digest, manifest.titled(name, first)
+                )
+        else:
+            for node_data in nodes_data:
+                name = node_data["name"]
+                fragment = self.encode_node(format_type, node_data)
+                digest = hashlib.sha256(fragment.encode("utf-8")).hexdigest()
+                path = manifest.part_path(name)
+                with open(f"{path}.tmp", "w", encoding="utf-8", newline="") as file:
+                    file.write(fragment)
+                os.replace(f"{path}.tmp", path)
+                content_changed |= manifest.record(name, versions.get(name), digest)
+
+        combined = manifest.combined_path
+        if content_changed or not os.path.exists(combined):
+            temp_name = f"{combined}.part"
+            if format_type == "pdf":
+                merge_pdfs(manifest.part_paths(), temp_name)
+            else:
+                self.write_fragments(
+                    format_type, temp_name, self._read_parts(manifest.part_paths())
+                )
+            os.replace(temp_name, combined)
+        manifest.save()
+
+    @staticmethod
+    def _read_parts(paths: List[str]) -> Iterable[str]:
+        """Yield the content of text parts one at a time."""
+        for path in paths:
+            with open(path, "r", encoding="utf-8", newline="") as file:
+                yield file.read()
 
     def _format_relationship(self, rel: Tuple[str, str, str, Dict[str, Any]]) -> str:
         """
@@ -120,7 +248,7 @@ class Exporter:
         Returns:
             str: The formatted relationship string.
         """
-        return f"Type: {rel[0]}, Target: {rel[1]}, Direction: {rel[2]}, Properties: {json.dumps(rel[3])}"
+        return f"Type: {rel[0]}, Target: {rel[1]}, Direction: {rel[2]}, Properties: {json.dumps(rel[3], default=str)}"
 
     def _format_properties(self, properties: Dict[str, Any]) -> str:
         """
@@ -134,85 +262,136 @@ class Exporter:
         """
         return "; ".join(f"{key}: {value}" for key, value in properties.items())
 
-    def _handle_json(self, file_name: str, nodes_data: List[Dict[str, Any]]) -> None:
+    @staticmethod
+    def _open_output(file_name: str, **kwargs: Any) -> Any:
+        """Open an export file for buffered UTF-8 writing."""
+        return open(
+            file_name, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE, **kwargs
+        )
+
+    def write_fragments(
+        self, format_type: str, file_name: str, fragments: Iterable[str]
+    ) -> None:
         """
-        Handle JSON export.
+        Write encoded node fragments of a text format as one file.
 
         Args:
+            format_type (str): A text export format.
             file_name (str): The name of the file to save.
-            nodes_data (List[Dict[str, Any]]): The list of node data to export.
+            fragments (Iterable[str]): Nodes encoded with encode_node.
         """
-        with open(file_name, "w") as file:
-            json.dump(nodes_data, file, indent=4)
+        layout = TEXT_LAYOUTS[format_type]
+        newline = "" if format_type == "csv" else None
+        with self._open_output(file_name, newline=newline) as file:
+            written = False
+            for fragment in fragments:
+                file.write(layout.separator if written else layout.prefix)
+                file.write(fragment)
+                written = True
+            file.write(layout.suffix if written else layout.empty)
 
-    def _handle_txt(self, file_name: str, nodes_data: List[Dict[str, Any]]) -> None:
+    def encode_node(self, format_type: str, node_data: Dict[str, Any]) -> str:
         """
-        Handle TXT export.
+        Encode one node as the fragment it takes up in a text export.
 
         Args:
-            file_name (str): The name of the file to save.
-            nodes_data (List[Dict[str, Any]]): The list of node data to export.
+            format_type (str): A text export format.
+            node_data (Dict[str, Any]): The node data to encode.
+
+        Returns:
+            str: The encoded node.
         """
-        with open(file_name, "w") as file:
-            for node_data in nodes_data:
-                self._write_txt_node(file, node_data)
-                file.write("\n")
+        return self._fragment_encoders[format_type](node_data)
 
-    def _write_txt_node(self, file: Any, node_data: Dict[str, Any]) -> None:
+    def _handle_text(
+        self, format_type: str, file_name: str, nodes_data: Iterable[Dict[str, Any]]
+    ) -> None:
         """
-        Write a single node's data in TXT format.
+        Handle a text format export, encoding one node at a time.
+
+        Memory use does not grow with the number of nodes.
 
         Args:
-            file: The file object to write to.
-            node_data (Dict[str, Any]): The node data to write.
+            format_type (str): A text export format.
+            file_name (str): The name of the file to save.
+            nodes_data (Iterable[Dict[str, Any]]): The node data to export.
         """
-        file.write(f"Name: {node_data['name']}\n")
-        file.write(f"Description: {node_data['description']}\n")
-        file.write(f"Tags: {', '.join(node_data['tags'])}\n")
-        file.write(f"Labels: {', '.join(node_data['labels'])}\n")
-        file.write("Relationships:\n")
-        for rel in node_data["relationships"]:
-            file.write(f"  - {self._format_relationship(rel)}\n")
-        file.write("Additional Properties:\n")
-        for key, value in node_data["additional_properties"].items():
-            file.write(f"  - {key}: {value}\n")
-
-    def _handle_csv(self, file_name: str, nodes_data: List[Dict[str, Any]]) -> None:
+        self.write_fragments(
+            format_type,
+            file_name,
+            (self.encode_node(format_type, node_data) for node_data in nodes_data),
+        )
+
+    def _encode_json(self, node_data: Dict[str, Any]) -> str:
+        """Encode a node as an array element laid out like json.dump with indent=4."""
+        encoded = json.dumps(node_data, indent=4, default=str)
+        return "    " + encoded.replace("\n", "\n    ")
+
+    def _encode_jsonl(self, node_data: Dict[str, Any]) -> str:
+        """Encode a node as one JSON Lines line."""
+        return json.dumps(node_data, default=str) + "\n"
+
+    def _encode_txt(self, node_data: Dict[str, Any]) -> str:
         """
-        Handle CSV export.
+        Encode a node in TXT format.
 
         Args:
-            file_name (str): The name of the file to save.
-            nodes_data (List[Dict[str, Any]]): The list of node data to export.
-        """
-        with open(file_name, "w") as file:
-            file.write(
-                "Name,Description,Tags,Labels,Relationships,Additional Properties\n"
-            )
-            for node_data in nodes_data:
-                relationships = "; ".join(
-                    self._format_relationship(rel) for rel in node_data["relationships"]
-                )
-                properties = self._format_properties(node_data["additional_properties"])
+            node_data (Dict[str, Any]): The node data to write.
 
-                file.write(
-                    f"{node_data['name']},{node_data['description']},"
-                    f"{', '.join(node_data['tags'])},{', '.join(node_data['labels'])},"
-                    f"{relationships},{properties}\n"
-                )
+        Returns:
+            str: The node block followed by a blank line.
+        """
+        lines = [
+            f"Name: {node_data['name']}",
+            f"Description: {node_data['description']}",
+            f"Tags: {', '.join(node_data['tags'])}",
+            f"Labels: {', '.join(node_data['labels'])}",
+            "Relationships:",
+        ]
+        lines.extend(
+            f"  - {self._format_relationship(rel)}"
+            for rel in node_data["relationships"]
+        )
+        lines.append("Additional Properties:")
+        lines.extend(
+            f"  - {key}: {value}"
+            for key, value in node_data["additional_properties"].items()
+        )
+        return "\n".join(lines) + "\n\n"
 
-    def _handle_pdf(self, file_name: str, nodes_data: List[Dict[str, Any]]) -> None:
+    def _encode_csv(self, node_data: Dict[str, Any]) -> str:
+        """Encode a node as one CSV row."""
+        relationships = "; ".join(
+            self._format_relationship(rel) for rel in node_data["relationships"]
+        )
+        properties = self._format_properties(node_data["additional_properties"])
+        return _csv_row(
+            [
+                node_data["name"],
+                node_data["description"],
+                ", ".join(node_data["tags"]),
+                ", ".join(node_data["labels"]),
+                relationships,
+                properties,
+            ]
+        )
+
+    def _handle_pdf(self, file_name: str, nodes_data: Iterable[Dict[str, Any]]) -> None:
         """
-        Handle PDF export using PDFExporter.
+        Handle PDF export, rendering chunks of nodes in parallel processes.
 
         Args:
             file_name (str): The name of the file to save.
-            nodes_data (List[Dict[str, Any]]): The list of node data to export.
+            nodes_data (Iterable[Dict[str, Any]]): The node data to export.
         """
-        pdf_exporter = PDFExporter()
-        pdf_exporter.export_to_pdf(file_name, nodes_data)
+        export_to_pdf_parallel(
+            file_name,
+            nodes_data,
+            self.config.PDF_EXPORT_CHUNK_SIZE,
+            self.config.PDF_EXPORT_WORKERS or None,
+        )
 
-    def _show_success_message(self, format_type: str) -> None:
+    def show_success_message(self, format_type: str) -> None:
         """
         Show success message dialog.
 
@@ -225,7 +404,7 @@ class Exporter:
             f"Selected nodes data exported as {format_type.upper()} successfully",
         )
 
-    def _handle_error(self, error_message: str) -> None:
+    def handle_error(self, error_message: str) -> None:
         """
         Handle and display error message.
 
@@ -233,221 +412,3 @@ class Exporter:
             error_message (str): The error message to display.
         """
         QMessageBox.critical(self.ui, "Error", error_message)
-
-
-class PDFExporter:
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles for better formatting"""
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomNormal",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                leading=14,
-                leftIndent=0,
-                rightIndent=0,
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomHeading1",
-                parent=self.styles["Heading1"],
-                fontSize=14,
-                leading=18,
-                spaceAfter=10,
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomHeading2",
-                parent=self.styles["Heading2"],
-                fontSize=12,
-                leading=16,
-                spaceBefore=10,
-                spaceAfter=6,
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="IndentedText",
-                parent=self.styles["Normal"],
-                leftIndent=20,
-                fontSize=10,
-                leading=14,
-            )
-        )
-
-    def _escape_text(self, text: Any) -> str:
-        """
-        Safely convert any input to string and escape HTML entities.
-
-        Args:
-            text: Any input that needs to be converted to safe string
-
-        Returns:
-            str: HTML-escaped string safe for PDF
-        """
-        return html.escape(str(text))
-
-    def _format_relationship(self, rel: tuple) -> str:
-        """
-        Format relationship data safely for PDF.
-
-        Args:
-            rel: Tuple containing (type, target, direction, properties)
-
-        Returns:
-            str: Formatted relationship string
-        """
-        try:
-            rel_type, target, direction, properties = rel
-            props_str = ", ".join(f"{k}: {v}" for k, v in properties.items())
-            return self._escape_text(
-                f"Type: {rel_type}, Target: {target}, "
-                f"Direction: {direction}, Properties: {{{props_str}}}"
-            )
-        except Exception as e:
-            return f"Error formatting relationship: {str(e)}"
-
-    def _add_section(
-        self,
-        elements: List,
-        title: str,
-        content: Any,
-        style: str = "CustomNormal",
-        indented: bool = False,
-    ) -> None:
-        """
-        Add a section to the PDF with proper formatting.
-
-        Args:
-            elements: List of PDF elements
-            title: Section title
-            content: Content to add
-            style: Style to apply to content
-            indented: Whether to indent the content
-        """
-        elements.append(Paragraph(title, self.styles["CustomHeading2"]))
-
-        if isinstance(content, list):
-            for item in content:
-                elements.append(
-                    Paragraph(
-                        f"• {self._escape_text(item)}",
-                        self.styles["IndentedText" if indented else style],
-                    )
-                )
-        else:
-            elements.append(
-                Paragraph(
-                    self._escape_text(content),
-                    self.styles["IndentedText" if indented else style],
-                )
-            )
-        elements.append(Spacer(1, 6))
-
-    def export_to_pdf(self, file_name: str, nodes_data: List[Dict[str, Any]]) -> None:
-        """
-        Export nodes data to a PDF file.
-
-        Args:
-            file_name: Name of the PDF file to create
-            nodes_data: List of node data dictionaries to export
-
-        Raises:
-            ValueError: If file_name is empty or nodes_data is empty
-            IOError: If there are issues writing to the file
-        """
-        if not file_name or not nodes_data:
-            raise ValueError("File name and nodes data are required")
-
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            file_name,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=72,
-        )
-
-        elements = []
-
-        # Add title
-        elements.append(Paragraph("Node Export Report", self.styles["Title"]))
-        elements.append(Spacer(1, 30))
-
-        # Process each node
-        for i, node_data in enumerate(nodes_data):
-            if i > 0:
-                elements.append(PageBreak())
-
-            try:
-                # Node name as header
-                elements.append(
-                    Paragraph(
-                        f"Node: {self._escape_text(node_data.get('name', 'Unnamed'))}",
-                        self.styles["CustomHeading1"],
-                    )
-                )
-                elements.append(Spacer(1, 12))
-
-                # Description
-                self._add_section(
-                    elements,
-                    "Description:",
-                    node_data.get("description", "No description available"),
-                )
-
-                # Tags
-                self._add_section(
-                    elements, "Tags:", ", ".join(node_data.get("tags", []))
-                )
-
-                # Labels
-                self._add_section(
-                    elements, "Labels:", ", ".join(node_data.get("labels", []))
-                )
-
-                # Relationships
-                elements.append(
-                    Paragraph("Relationships:", self.styles["CustomHeading2"])
-                )
-                for rel in node_data.get("relationships", []):
-                    elements.append(
-                        Paragraph(
-                            f"• {self._format_relationship(rel)}",
-                            self.styles["IndentedText"],
-                        )
-                    )
-                elements.append(Spacer(1, 12))
-
-                # Additional Properties
-                elements.append(
-                    Paragraph("Additional Properties:", self.styles["CustomHeading2"])
-                )
-                for key, value in node_data.get("additional_properties", {}).items():
-                    elements.append(
-                        Paragraph(
-                            f"• {self._escape_text(key)}: {self._escape_text(value)}",
-                            self.styles["IndentedText"],
-                        )
-                    )
-                elements.append(Spacer(1, 12))
-
-            except Exception as e:
-                elements.append(
-                    Paragraph(
-                        f"Error processing node: {str(e)}", self.styles["CustomNormal"]
-                    )
-                )
-
-        try:
-            # Build the PDF
-            doc.build(elements)
-        except Exception as e:
-            raise IOError(f"Failed to create PDF: {str(e)}")
@@ -1,4 +1,4 @@
-from typing import Dict, Tuple, List, Union
+from typing import Any, Dict, Tuple, List, Union
 
 from shapely.geometry import Point, Polygon, LineString, MultiPoint
 from shapely.wkt import loads, dumps
@@ -55,9 +55,21 @@ class GeometryHandler:
             return False
 
     @staticmethod
-    def create_geometry_properties(geometry_wkt: str) -> Dict[str, str]:
-        """Create properties dictionary with WKT geometry."""
-        return {"geometry": geometry_wkt}
+    def create_geometry_properties(geometry_wkt: str) -> Dict[str, Any]:
+        """Create properties dictionary with WKT geometry.
+
+        The anchor coordinates (the centroid) and geometry type are stored as
+        native properties alongside the WKT so pins can be queried without
+        parsing it.
+        """
+        geometry = loads(geometry_wkt)
+        anchor = geometry.centroid
+        return {
+            "geometry": geometry_wkt,
+            "shape": GeometryHandler.get_geometry_type(geometry_wkt),
+            "x": float(anchor.x),
+            "y": float(anchor.y),
+        }
 
     @staticmethod
     def get_geometry_type(wkt: str) -> str:
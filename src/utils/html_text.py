@@ -0,0 +1,144 @@
+"""
+This module derives compact and plain-text forms of the rich-text HTML that the
+description editor produces.
+"""
+
+import re
+from html import unescape
+from html.parser import HTMLParser
+from typing import List
+
+BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "tr", "table", "blockquote", "pre",
+    "h1", "h2", "h3", "h4", "h5", "h6", "hr",
+}  # fmt: skip
+SKIPPED_TAGS = {"head", "style", "script", "title"}
+
+_BODY_PATTERN = re.compile(r"<body[^>]*>(.*)</body>", re.IGNORECASE | re.DOTALL)
+_STYLE_PATTERN = re.compile(r"<style[^>]*>(.*?)</style>", re.IGNORECASE | re.DOTALL)
+_FRAGMENT_MARKERS = re.compile(r"<!--(Start|End)Fragment-->")
+_SPACES = re.compile(r"[ \t\r\f\v\u00a0]+")
+_ANCHOR_PATTERN = re.compile(
+    r"<a\b([^>]*)>(.*?)</a>", re.IGNORECASE | re.DOTALL
+)
+_HREF_PATTERN = re.compile(r'href\s*=\s*"([^"]*)"', re.IGNORECASE)
+_URL_SCHEME = re.compile(r"^[a-z][a-z0-9+.-]*:", re.IGNORECASE)
+# Background the old editor gave node references, kept by Qt as a span
+_REFERENCE_SPAN_PATTERN = re.compile(
+    r'<span style="[^"]*background-color:\s*#e0e0e0;?[^"]*">(.*?)</span>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the visible text of an HTML document with block breaks."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def html_to_plain_text(html: str) -> str:
+    """
+    Convert description HTML to normalized plain text.
+
+    Runs of spaces collapse to one, each block becomes one line and blank lines
+    are dropped. Plain text input is normalized the same way.
+
+    Args:
+        html: The HTML or plain text.
+
+    Returns:
+        str: The normalized plain text.
+    """
+    if not html:
+        return ""
+
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+
+    text = "".join(extractor.parts)
+    lines = (_SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def unwrap_node_references(html: str) -> str:
+    """
+    Remove the node reference links older editors stored in descriptions.
+
+    The old editor wrapped every node name in a styled link pointing at the
+    name, and Qt saved those links with the text. Node references are now
+    highlighted without touching the document, so such links are replaced by
+    their text. A link counts as a node reference when it is marked with the
+    node-reference class, or when its target has no URL scheme and equals its
+    text; other links are kept.
+
+    Args:
+        html: The stored description HTML.
+
+    Returns:
+        str: The HTML without node reference links.
+    """
+    if not html or "<a" not in html.lower():
+        return html
+
+    def unwrap(match: re.Match) -> str:
+        attributes, content = match.group(1), match.group(2)
+        href = _HREF_PATTERN.search(attributes)
+        target = unescape(href.group(1)) if href else ""
+        legacy_class = "node-reference" in attributes
+        names_node = (
+            bool(target)
+            and not _URL_SCHEME.match(target)
+            and target == html_to_plain_text(content)
+        )
+        if not (legacy_class or names_node):
+            return match.group(0)
+        return _REFERENCE_SPAN_PATTERN.sub(r"\1", content)
+
+    return _ANCHOR_PATTERN.sub(unwrap, html)
+
+
+def compact_html(html: str) -> str:
+    """
+    Strip the document boilerplate Qt writes around rich text.
+
+    Qt's toHtml() wraps every description in a DOCTYPE, meta tags and a styled
+    body. Only the stylesheet rules (which keep whitespace significant) and the
+    body content are kept; the result renders the same with setHtml().
+
+    Args:
+        html: The HTML produced by QTextEdit.toHtml().
+
+    Returns:
+        str: The compact HTML, or the input unchanged if it has no body.
+    """
+    if not html:
+        return ""
+
+    body = _BODY_PATTERN.search(html)
+    if not body:
+        return html
+
+    content = _FRAGMENT_MARKERS.sub("", body.group(1)).strip()
+    style = _STYLE_PATTERN.search(html)
+    head = f"<head><style>{style.group(1).strip()}</style></head>" if style else ""
+    return f"<html>{head}<body>{content}</body></html>"
@@ -0,0 +1,119 @@
+"""
+This module provides scaled image decoding and the DecodedImageCache class, an
+LRU cache of decoded images bounded by their size in bytes.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QImage, QImageReader
+
+
+def decode_scaled(path: str, max_size: QSize) -> QImage:
+    """
+    Decode an image at no more than the resolution it is shown at.
+
+    The reader is told the target size before decoding, so formats such as
+    JPEG decode directly at reduced resolution instead of decoding the full
+    image and scaling it down. Only QImage is used, so it is safe to call
+    from a worker thread.
+
+    Args:
+        path: Path of the image file.
+        max_size: Bounding size; the aspect ratio is kept.
+
+    Returns:
+        QImage: The decoded image.
+
+    Raises:
+        ValueError: If the image cannot be decoded.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    original = reader.size()
+    if original.isValid() and (
+        original.width() > max_size.width() or original.height() > max_size.height()
+    ):
+        reader.setScaledSize(
+            original.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio)
+        )
+
+    image = reader.read()
+    if image.isNull():
+        raise ValueError(f"Cannot decode {path}: {reader.errorString()}")
+    return image
+
+
+class DecodedImageCache:
+    """
+    LRU cache of decoded images with a byte budget.
+
+    Not thread-safe; it is meant to be used from the GUI thread while the
+    decoding happens in workers.
+
+    Args:
+        max_bytes: Total size of the cached images before the least recently
+            used ones are evicted.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget of the cache.
+        """
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self._images: "OrderedDict[Hashable, QImage]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[QImage]:
+        """
+        Get a cached image and mark it as recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Optional[QImage]: The image, or None if it is not cached.
+        """
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+        return image
+
+    def put(self, key: Hashable, image: QImage) -> None:
+        """
+        Cache an image, evicting the least recently used ones over budget.
+
+        Images larger than the whole budget are not cached.
+
+        Args:
+            key: The cache key.
+            image: The decoded image.
+        """
+        size = image.sizeInBytes()
+        if size > self.max_bytes:
+            return
+
+        previous = self._images.pop(key, None)
+        if previous is not None:
+            self.bytes_used -= previous.sizeInBytes()
+        self._images[key] = image
+        self.bytes_used += size
+
+        while self.bytes_used > self.max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self.bytes_used -= evicted.sizeInBytes()
+
+    def clear(self) -> None:
+        """Drop all cached images."""
+        self._images.clear()
+        self.bytes_used = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._images
+
+    def __len__(self) -> int:
+        return len(self._images)
@@ -0,0 +1,448 @@
+"""
+This module provides parsing of Markdown vaults, folders of notes with front
+matter and [[wiki-links]], and the VaultSyncState class recording what a vault
+import last wrote so later imports only process changed notes.
+"""
+
+import hashlib
+import html
+import json
+import multiprocessing
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+import appdirs
+
+NOTE_SUFFIX = ".md"
+STATE_VERSION = 1
+
+# [[Target]], [[Target|Alias]], [[Target#Heading]] and embeds ![[Target]]
+WIKI_LINK_PATTERN = re.compile(
+    r"(?P<embed>!?)\[\[(?P<target>[^\]|#^]*)(?:[#^][^\]|]*)?(?:\|(?P<alias>[^\]]*))?\]\]"
+)
+INLINE_TAG_PATTERN = re.compile(r"(?<![\w#&/])#(?P<tag>[A-Za-z_][\w/-]*)")
+CODE_PATTERN = re.compile(r"```.*?```|`[^`\n]*`", re.DOTALL)
+
+NAME_KEYS = ("name", "title")
+LABEL_KEYS = ("labels", "label")
+TAG_KEYS = ("tags", "tag")
+
+
+def scan_vault(root: str) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """
+    Walk a vault for notes, skipping hidden folders such as ``.obsidian``.
+
+    Args:
+        root: The vault directory.
+
+    Yields:
+        Tuple: The path relative to the vault with forward slashes, the
+        absolute path and the stat result of each note.
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file() and entry.name.lower().endswith(NOTE_SUFFIX):
+                    relative = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                    yield relative, entry.path, entry.stat()
+
+
+def note_key(target: str) -> str:
+    """
+    Get the key a wiki-link target resolves by.
+
+    Links resolve case-insensitively by note path without the extension;
+    a bare name matches the note with that file name in any folder.
+
+    Args:
+        target: A link target or a note path relative to the vault.
+
+    Returns:
+        str: The lowercase target without extension.
+    """
+    target = target.strip().replace("\\", "/")
+    if target.lower().endswith(NOTE_SUFFIX):
+        target = target[: -len(NOTE_SUFFIX)]
+    return target.lower()
+
+
+def _parse_scalar(value: str) -> Any:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    if value.startswith("[") and value.endswith("]"):
+        return [
+            _parse_scalar(item)
+            for item in _split_inline_list(value[1:-1])
+            if item.strip()
+        ]
+    if re.fullmatch(r"-?\d+", value):
+        return int(value)
+    if re.fullmatch(r"-?\d+\.\d+", value):
+        return float(value)
+    if value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    return value
+
+
+def _split_inline_list(text: str) -> List[str]:
+    """Split an inline list at commas outside quotes and wiki-links."""
+    items, current, quote, depth = [], [], None, 0
+    for char in text:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "\"'":
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            items.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    items.append("".join(current))
+    return items
+
+
+def parse_front_matter(text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Split a note into its front matter and body.
+
+    Supports the front matter notes commonly use: ``key: value`` scalars,
+    inline ``[a, b]`` lists and block lists of ``- item`` lines. Nested
+    mappings are skipped.
+
+    Args:
+        text: The note text.
+
+    Returns:
+        Tuple[Dict[str, Any], str]: The front matter and the body.
+    """
+    lines = text.split("\n")
+    if not lines or lines[0].strip() != "---":
+        return {}, text
+    for end, line in enumerate(lines[1:], start=1):
+        if line.strip() in ("---", "..."):
+            break
+    else:
+        return {}, text
+
+    front_matter: Dict[str, Any] = {}
+    key: Optional[str] = None
+    for line in lines[1:end]:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("- ") or stripped == "-":
+            if key is not None:
+                item = _parse_scalar(stripped[1:])
+                if not isinstance(front_matter.get(key), list):
+                    front_matter[key] = []
+                if item != "":
+                    front_matter[key].append(item)
+            continue
+        if line[:1].isspace():
+            # Nested mappings are not supported
+            continue
+        name, separator, value = stripped.partition(":")
+        if not separator:
+            continue
+        key = name.strip()
+        front_matter[key] = _parse_scalar(value) if value.strip() else None
+    return front_matter, "\n".join(lines[end + 1 :])
+
+
+def _link_text(match: "re.Match") -> str:
+    if match["embed"] and not _is_note_target(match["target"].strip()):
+        # Embedded images and other attachments
+        return ""
+    return match["alias"] or match["target"].strip()
+
+
+def markdown_to_html(body: str) -> str:
+    """
+    Convert a note body into description HTML.
+
+    Paragraphs and line breaks are kept, wiki-links become their text and
+    embedded attachments are dropped; other Markdown is kept as written.
+
+    Args:
+        body: The note body.
+
+    Returns:
+        str: The description HTML.
+    """
+    body = WIKI_LINK_PATTERN.sub(_link_text, body).strip()
+    paragraphs = [
+        html.escape(paragraph.strip()).replace("\n", "<br />")
+        for paragraph in re.split(r"\n\s*\n", body)
+        if paragraph.strip()
+    ]
+    return "".join(f"<p>{paragraph}</p>" for paragraph in paragraphs)
+
+
+def _links(value: Any) -> Optional[List[str]]:
+    """Get the link targets of a front matter value made only of links."""
+    values = value if isinstance(value, list) else [value]
+    targets = []
+    for item in values:
+        match = isinstance(item, str) and WIKI_LINK_PATTERN.fullmatch(item.strip())
+        if not match:
+            return None
+        targets.append(match["target"].strip())
+    return targets or None
+
+
+def _is_note_target(target: str) -> bool:
+    """Check that a link points to a note rather than an attachment."""
+    extension = os.path.splitext(target)[1].lower()
+    if extension == NOTE_SUFFIX or not re.fullmatch(r"\.[a-z0-9]{1,5}", extension):
+        # Names such as "Mr. Smith" have no file extension
+        return bool(target)
+    return False
+
+
+def parse_note(path: str) -> Dict[str, Any]:
+    """
+    Parse a note file.
+
+    Front matter ``name`` or ``title`` sets the node name, which defaults
+    to the file name. ``labels`` and ``tags`` set the labels and tags, and
+    inline ``#tags`` are added to the tags. A front matter value made only
+    of wiki-links becomes relationships typed by its key; other values
+    become properties. Wiki-links in the body become untyped links.
+
+    A module-level function returning errors as values, so it can run in
+    a worker process.
+
+    Args:
+        path: Absolute path of the note.
+
+    Returns:
+        Dict[str, Any]: The note's ``sha256``, ``name``, ``labels``,
+        ``tags``, ``properties``, ``links`` as (type or None, target) pairs
+        and ``description``, or ``sha256`` and ``error`` if the note cannot
+        be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+        text = content.decode("utf-8-sig").replace("\r\n", "\n")
+    except (OSError, UnicodeDecodeError) as e:
+        return {"sha256": None, "error": str(e)}
+
+    front_matter, body = parse_front_matter(text)
+    name = os.path.splitext(os.path.basename(path))[0]
+    labels: List[str] = []
+    tags: List[str] = []
+    properties: Dict[str, Any] = {}
+    links: List[Tuple[Optional[str], str]] = []
+
+    for key, value in front_matter.items():
+        if value is None or value == "" or value == []:
+            continue
+        lowered = key.lower()
+        if lowered in NAME_KEYS:
+            name = str(value).strip() or name
+        elif lowered in LABEL_KEYS:
+            labels.extend(str(v) for v in (value if isinstance(value, list) else [value]))
+        elif lowered in TAG_KEYS:
+            values = value if isinstance(value, list) else str(value).split(",")
+            tags.extend(str(v).strip().lstrip("#") for v in values)
+        elif (targets := _links(value)) is not None:
+            links.extend((key, target) for target in targets if _is_note_target(target))
+        else:
+            properties[key] = value
+
+    searchable = CODE_PATTERN.sub("", body)
+    tags.extend(match["tag"] for match in INLINE_TAG_PATTERN.finditer(searchable))
+    links.extend(
+        (None, match["target"].strip())
+        for match in WIKI_LINK_PATTERN.finditer(searchable)
+        if _is_note_target(match["target"].strip())
+    )
+
+    return {
+        "sha256": digest,
+        "name": name,
+        "labels": labels,
+        "tags": list(dict.fromkeys(tag for tag in tags if tag)),
+        "properties": properties,
+        "links": list(dict.fromkeys(links)),
+        "description": markdown_to_html(body),
+    }
+
+
+def _parse_notes(paths: List[str]) -> List[Dict[str, Any]]:
+    return [parse_note(path) for path in paths]
+
+
+def parse_notes(
+    paths: List[str], chunk_size: int, max_workers: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse notes in a process pool, yielding the results in order.
+
+    Chunks of notes are parsed per task and at most two tasks per process
+    are in flight. A vault of a single chunk is parsed in this process,
+    which is faster than starting the pool. Closing the iterator early
+    cancels the tasks that have not started.
+
+    Args:
+        paths: Absolute paths of the notes.
+        chunk_size: Notes per task.
+        max_workers: Number of worker processes, by default one per CPU.
+
+    Yields:
+        Dict[str, Any]: The result of parse_note for each path.
+    """
+    chunk_size = max(1, chunk_size)
+    if len(paths) <= chunk_size:
+        yield from _parse_notes(paths)
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    chunks = (paths[i : i + chunk_size] for i in range(0, len(paths), chunk_size))
+    # Spawned processes don't inherit the GUI's threads and locks
+    executor = ProcessPoolExecutor(
+        max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        pending: Deque[Future] = deque(
+            executor.submit(_parse_notes, chunk)
+            for chunk in islice(chunks, max_workers * 2)
+        )
+        while pending:
+            results = pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(executor.submit(_parse_notes, chunk))
+            yield from results
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def sync_state_path(vault_path: str, database_uri: str) -> str:
+    """
+    Get the sync state file of a vault imported into a database.
+
+    The state is kept in the user cache per vault and database, so the
+    vault itself is never written to.
+
+    Args:
+        vault_path: The vault directory.
+        database_uri: The URI of the database.
+
+    Returns:
+        str: Path of the state file.
+    """
+    key = f"{database_uri}\n{os.path.abspath(vault_path)}".encode("utf-8")
+    return os.path.join(
+        appdirs.user_cache_dir("NeoWorldBuilder"),
+        "vault_sync",
+        f"{hashlib.sha1(key).hexdigest()}.json",
+    )
+
+
+class VaultSyncState:
+    """
+    What the last import of a vault wrote, by note path.
+
+    For every note it records the size, modification time and SHA-256 of
+    the file and the name and relationships written for it. A note whose
+    size and modification time are unchanged is skipped without reading
+    it; a note whose content hash is unchanged is skipped without writing.
+
+    Args:
+        path: Path of the state file.
+        notes: State entries by note path relative to the vault.
+    """
+
+    def __init__(
+        self, path: str, notes: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Initialize the state.
+
+        Args:
+            path: Path of the state file.
+            notes: State entries by note path relative to the vault.
+        """
+        self.path = path
+        self.notes: Dict[str, Dict[str, Any]] = notes or {}
+
+    @classmethod
+    def load(cls, path: str) -> "VaultSyncState":
+        """
+        Load a state file.
+
+        Args:
+            path: Path of the state file.
+
+        Returns:
+            VaultSyncState: The state, empty if there is no valid file.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path)
+        if data.get("version") != STATE_VERSION:
+            return cls(path)
+        return cls(path, data.get("notes", {}))
+
+    def save(self) -> None:
+        """Write the state atomically."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": STATE_VERSION, "notes": self.notes}, f)
+        os.replace(temp_path, self.path)
+
+    def is_unchanged(self, relative: str, stat: os.stat_result) -> bool:
+        """Check whether a note has the size and modification time recorded."""
+        entry = self.notes.get(relative)
+        return bool(
+            entry
+            and entry["mtime"] == stat.st_mtime_ns
+            and entry["bytes"] == stat.st_size
+        )
+
+    def record(
+        self,
+        relative: str,
+        stat: os.stat_result,
+        digest: str,
+        name: str,
+        links: List[Tuple[str, str]],
+    ) -> None:
+        """
+        Record a note as imported.
+
+        Args:
+            relative: The note path relative to the vault.
+            stat: The stat result of the note file.
+            digest: The SHA-256 of the note file.
+            name: The node name written for the note.
+            links: The relationship types and target names written for it.
+        """
+        self.notes[relative] = {
+            "mtime": stat.st_mtime_ns,
+            "bytes": stat.st_size,
+            "sha256": digest,
+            "name": name,
+            "links": [list(link) for link in links],
+        }
@@ -0,0 +1,176 @@
+"""
+This module provides the NameCacheStore class, which persists the node name cache
+and the label/tag/property catalogs to a compact local file for warm startup.
+
+File layout (all integers little-endian):
+
+    magic "NWBC" | version u16 | section count u16
+    stamp length u32 | stamp (UTF-8)
+    per section:
+        key length u16 | key (UTF-8)
+        entry count u32 | blob length u32
+        offsets u32[entry count + 1]   byte offsets into the blob
+        blob                           sorted UTF-8 strings, back to back
+
+Each section is a sorted string table, so a reader can binary-search the
+offsets of a memory-mapped file without decoding the whole blob.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"NWBC"
+VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_SECTION = struct.Struct("<II")
+
+
+def database_key(uri: str, username: str) -> str:
+    """
+    Derive a stable file-name-safe key for a database and user.
+
+    Args:
+        uri: The database URI.
+        username: The database user.
+
+    Returns:
+        str: A short hexadecimal key.
+    """
+    return hashlib.sha256(f"{uri}\n{username}".encode("utf-8")).hexdigest()[:24]
+
+
+class NameCacheStore:
+    """
+    Reads and writes the persisted name cache for one database and user.
+
+    Args:
+        cache_dir: Directory holding cache files.
+        uri: The database URI the cache belongs to.
+        username: The database user the cache belongs to.
+    """
+
+    def __init__(self, cache_dir: str, uri: str, username: str) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            cache_dir: Directory holding cache files.
+            uri: The database URI the cache belongs to.
+            username: The database user the cache belongs to.
+        """
+        self.path = Path(cache_dir) / f"names_{database_key(uri, username)}.nwbc"
+
+    def load(self) -> Optional[Tuple[str, Dict[str, List[str]]]]:
+        """
+        Load the persisted stamp and sections.
+
+        Returns:
+            Optional[Tuple[str, Dict[str, List[str]]]]: The stamp and a mapping of
+            section key to sorted strings, or None if no valid cache exists.
+        """
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return None
+
+        try:
+            with open(self.path, "rb") as file, mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as data:
+                return self._parse(data)
+        except (OSError, ValueError, struct.error, UnicodeDecodeError) as e:
+            logger.warning("name_cache_store_unreadable", path=str(self.path), error=str(e))
+            return None
+
+    def save(self, stamp: str, sections: Dict[str, Iterable[str]]) -> None:
+        """
+        Atomically write the stamp and sections to disk.
+
+        Args:
+            stamp: The server-side version stamp the data corresponds to.
+            sections: Mapping of section key to strings. Strings are sorted on write.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+
+        with open(temp_path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, len(sections)))
+            encoded_stamp = stamp.encode("utf-8")
+            file.write(_U32.pack(len(encoded_stamp)))
+            file.write(encoded_stamp)
+
+            for key, values in sections.items():
+                encoded_key = key.encode("utf-8")
+                encoded_values = [value.encode("utf-8") for value in sorted(values)]
+
+                offsets = array("I", [0])
+                position = 0
+                for value in encoded_values:
+                    position += len(value)
+                    offsets.append(position)
+                if sys.byteorder != "little":
+                    offsets.byteswap()
+
+                file.write(_U16.pack(len(encoded_key)))
+                file.write(encoded_key)
+                file.write(_SECTION.pack(len(encoded_values), position))
+                file.write(offsets.tobytes())
+                file.write(b"".join(encoded_values))
+
+        os.replace(temp_path, self.path)
+        logger.debug("name_cache_store_saved", path=str(self.path))
+
+    def clear(self) -> None:
+        """Delete the persisted cache file."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _parse(data: mmap.mmap) -> Tuple[str, Dict[str, List[str]]]:
+        """Parse a mapped cache file into its stamp and sections."""
+        magic, version, section_count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Unsupported name cache file")
+        position = _HEADER.size
+
+        (stamp_length,) = _U32.unpack_from(data, position)
+        position += _U32.size
+        stamp = data[position : position + stamp_length].decode("utf-8")
+        position += stamp_length
+
+        sections: Dict[str, List[str]] = {}
+        for _ in range(section_count):
+            (key_length,) = _U16.unpack_from(data, position)
+            position += _U16.size
+            key = data[position : position + key_length].decode("utf-8")
+            position += key_length
+
+            count, blob_length = _SECTION.unpack_from(data, position)
+            position += _SECTION.size
+
+            offsets = array("I")
+            offsets.frombytes(data[position : position + (count + 1) * 4])
+            if sys.byteorder != "little":
+                offsets.byteswap()
+            position += (count + 1) * 4
+
+            blob = data[position : position + blob_length]
+            position += blob_length
+
+            sections[key] = [
+                blob[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(count)
+            ]
+
+        return stamp, sections
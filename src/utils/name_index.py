@@ -0,0 +1,220 @@
+"""
+This module provides the NamePrefixIndex class, a case-folded sorted-array index
+over node names used for fast prefix lookups during autocompletion.
+"""
+
+from bisect import bisect_left
+from typing import Iterable, List
+
+
+class NamePrefixIndex:
+    """
+    Sorted array of case-folded node names supporting prefix queries with bisect.
+
+    Keys and names are kept in two parallel lists ordered by (folded key, name),
+    so a prefix lookup is a binary search followed by a bounded forward walk.
+    Only the requested number of matches is materialised.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            names: Optional initial node names.
+        """
+        self._keys: List[str] = []
+        self._names: List[str] = []
+        self.rebuild(names)
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """
+        Normalize text for case-insensitive comparison.
+
+        Args:
+            text: The text to fold.
+
+        Returns:
+            str: The case-folded text.
+        """
+        return text.casefold()
+
+    def rebuild(self, names: Iterable[str]) -> None:
+        """
+        Replace the index contents with the given names.
+
+        Args:
+            names: The node names to index.
+        """
+        entries = sorted((self.fold(name), name) for name in set(names) if name)
+        self._keys = [key for key, _ in entries]
+        self._names = [name for _, name in entries]
+
+    def clear(self) -> None:
+        """Remove all names from the index."""
+        self._keys = []
+        self._names = []
+
+    def add(self, name: str) -> bool:
+        """
+        Insert a single name, keeping the arrays sorted.
+
+        Args:
+            name: The node name to add.
+
+        Returns:
+            bool: True if the name was added, False if it was already present.
+        """
+        if not name:
+            return False
+        key = self.fold(name)
+        pos = self._locate(key, name)
+        if pos < len(self._names) and self._names[pos] == name:
+            return False
+        self._keys.insert(pos, key)
+        self._names.insert(pos, name)
+        return True
+
+    def remove(self, name: str) -> bool:
+        """
+        Remove a single name.
+
+        Args:
+            name: The node name to remove.
+
+        Returns:
+            bool: True if the name was removed, False if it was not present.
+        """
+        if not name:
+            return False
+        pos = self._locate(self.fold(name), name)
+        if pos < len(self._names) and self._names[pos] == name:
+            del self._keys[pos]
+            del self._names[pos]
+            return True
+        return False
+
+    def prefix_matches(self, prefix: str, limit: int = 0) -> List[str]:
+        """
+        Get names starting with the given prefix, compared case-insensitively.
+
+        Args:
+            prefix: The prefix to search for.
+            limit: Maximum number of results. 0 means no limit.
+
+        Returns:
+            List[str]: Matching names in case-folded alphabetical order.
+        """
+        key = self.fold(prefix)
+        start = bisect_left(self._keys, key)
+        end = len(self._keys)
+        if limit > 0:
+            end = min(end, start + limit)
+
+        matches = []
+        for pos in range(start, end):
+            if not self._keys[pos].startswith(key):
+                break
+            matches.append(self._names[pos])
+        return matches
+
+    def fuzzy_prefix_matches(self, prefix: str, limit: int = 0) -> List[str]:
+        """
+        Get names starting with the prefix with at most one character
+        substituted, inserted or deleted, compared case-insensitively.
+
+        Substituted and inserted characters are taken from the keys by
+        skipping from one distinct character to the next, so a lookup costs a
+        few bisects per prefix position regardless of the index size.
+
+        Args:
+            prefix: The prefix to search for.
+            limit: Maximum number of results. 0 means no limit.
+
+        Returns:
+            List[str]: Exact prefix matches first, then matches with one edit.
+        """
+        key = self.fold(prefix)
+        if not key:
+            return []
+
+        variants = {key[:i] + key[i + 1 :] for i in range(len(key))}  # Deletions
+        for i in range(len(key)):
+            head = key[:i]
+            for char in self._next_characters(head):
+                variants.add(head + char + key[i + 1 :])  # Substitution
+                variants.add(head + char + key[i:])  # Insertion
+        variants.discard(key)
+
+        matches = dict.fromkeys(self.prefix_matches(key, limit))
+        for variant in sorted(variants):
+            if limit > 0 and len(matches) >= limit:
+                break
+            matches.update(
+                dict.fromkeys(self.prefix_matches(variant, limit - len(matches)))
+            )
+        return list(matches)[:limit] if limit > 0 else list(matches)
+
+    def count_prefix(self, prefix: str) -> int:
+        """
+        Count names starting with the given prefix.
+
+        Args:
+            prefix: The prefix to count.
+
+        Returns:
+            int: Number of matching names.
+        """
+        key = self.fold(prefix)
+        if not key:
+            return len(self._keys)
+        start = bisect_left(self._keys, key)
+        # Every key with this prefix sorts before the prefix followed by the max code point
+        end = bisect_left(self._keys, key + "\U0010ffff", start)
+        return end - start
+
+    def names(self) -> List[str]:
+        """
+        Get all indexed names.
+
+        Returns:
+            List[str]: A copy of the indexed names in index order.
+        """
+        return list(self._names)
+
+    def _next_characters(self, head: str) -> List[str]:
+        """Get the distinct characters following head in the keys."""
+        characters = []
+        size = len(head)
+        pos = bisect_left(self._keys, head)
+        while pos < len(self._keys) and self._keys[pos].startswith(head):
+            if len(self._keys[pos]) == size:
+                pos += 1
+                continue
+            char = self._keys[pos][size]
+            characters.append(char)
+            if char == "\U0010ffff":
+                break
+            pos = bisect_left(self._keys, head + chr(ord(char) + 1), pos)
+        return characters
+
+    def _locate(self, key: str, name: str) -> int:
+        """Find the insertion position of (key, name) in the parallel arrays."""
+        pos = bisect_left(self._keys, key)
+        while (
+            pos < len(self._keys)
+            and self._keys[pos] == key
+            and self._names[pos] < name
+        ):
+            pos += 1
+        return pos
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str) or not name:
+            return False
+        pos = self._locate(self.fold(name), name)
+        return pos < len(self._names) and self._names[pos] == name
+
+    def __len__(self) -> int:
+        return len(self._names)
@@ -0,0 +1,147 @@
+"""
+This module provides the NameMatcher class, a multi-pattern matcher that finds
+whole-word occurrences of node names in text.
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+# A run of word characters, or a single other non-space character
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+WORD_CHAR = re.compile(r"\w")
+
+Match = Tuple[int, int, str]
+
+
+def is_boundary(text: str, position: int) -> bool:
+    """
+    Check for a regex-style word boundary (``\\b``) at a position.
+
+    Args:
+        text: The text.
+        position: Index between two characters, 0 to len(text).
+
+    Returns:
+        bool: True if exactly one side of the position is a word character.
+    """
+    before = position > 0 and WORD_CHAR.match(text, position - 1) is not None
+    after = WORD_CHAR.match(text, position) is not None
+    return before != after
+
+
+class NameMatcher:
+    """
+    Finds non-overlapping whole-word occurrences of many names in one pass.
+
+    Names are bucketed by their first token. Scanning walks the tokens of the
+    text once and only compares names whose first token equals the current
+    token, trying longer names first. Matching is case-sensitive and follows
+    the leftmost-longest semantics of a length-sorted regex alternation.
+
+    Args:
+        names: Initial names to match.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """
+        Initialize the matcher.
+
+        Args:
+            names: Initial names to match.
+        """
+        self._buckets: Dict[str, List[str]] = {}
+        self._count = 0
+        self.rebuild(names)
+
+    @staticmethod
+    def first_token(name: str) -> str:
+        """Get the token a name starts with, empty if it starts with whitespace."""
+        match = TOKEN_PATTERN.match(name)
+        return match.group() if match else ""
+
+    def rebuild(self, names: Iterable[str]) -> None:
+        """
+        Replace the matched names.
+
+        Args:
+            names: The names to match.
+        """
+        buckets: Dict[str, List[str]] = {}
+        for name in set(names):
+            if token := self.first_token(name):
+                buckets.setdefault(token, []).append(name)
+        for bucket in buckets.values():
+            bucket.sort(key=len, reverse=True)
+        self._buckets = buckets
+        self._count = sum(len(bucket) for bucket in buckets.values())
+
+    def add(self, name: str) -> bool:
+        """
+        Add a name.
+
+        Args:
+            name: The name to add.
+
+        Returns:
+            bool: True if the name was added, False if present or unmatchable.
+        """
+        token = self.first_token(name)
+        if not token:
+            return False
+        bucket = self._buckets.setdefault(token, [])
+        if name in bucket:
+            return False
+        bucket.append(name)
+        bucket.sort(key=len, reverse=True)
+        self._count += 1
+        return True
+
+    def remove(self, name: str) -> bool:
+        """
+        Remove a name.
+
+        Args:
+            name: The name to remove.
+
+        Returns:
+            bool: True if the name was removed, False if it was not present.
+        """
+        token = self.first_token(name)
+        bucket = self._buckets.get(token)
+        if not bucket or name not in bucket:
+            return False
+        bucket.remove(name)
+        if not bucket:
+            del self._buckets[token]
+        self._count -= 1
+        return True
+
+    def find_all(self, text: str) -> List[Match]:
+        """
+        Find whole-word occurrences of the names in a text.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            List[Match]: (start, end, name) tuples in text order, non-overlapping.
+        """
+        matches: List[Match] = []
+        last_end = 0
+        for token in TOKEN_PATTERN.finditer(text):
+            start = token.start()
+            if start < last_end:
+                continue
+            bucket = self._buckets.get(token.group())
+            if not bucket or not is_boundary(text, start):
+                continue
+            for name in bucket:
+                end = start + len(name)
+                if text.startswith(name, start) and is_boundary(text, end):
+                    matches.append((start, end, name))
+                    last_end = end
+                    break
+        return matches
+
+    def __len__(self) -> int:
+        return self._count
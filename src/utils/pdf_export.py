@@ -0,0 +1,169 @@
+"""
+This module exports node data to PDF, splitting large exports into chunks that
+are rendered in parallel processes and concatenated.
+
+Worker processes only import utils.pdf_render and receive node data converted
+to plain Python values, so they start without loading the GUI or the driver.
+"""
+
+import multiprocessing
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pypdf import PdfWriter
+
+from utils.pdf_render import PDFExporter, render_chunk, render_parts
+
+
+def plain_value(value: Any) -> Any:
+    """
+    Convert a value to plain Python types for a worker process.
+
+    Values of driver types, such as temporal values, become their string
+    form, which is how the renderer prints them.
+
+    Args:
+        value: A node data value.
+
+    Returns:
+        Any: The value built from dicts, lists, strings, numbers and None.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): plain_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain_value(item) for item in value]
+    return str(value)
+
+
+def _run_in_pool(
+    tasks: Iterator[Tuple[Callable[..., int], tuple]], max_workers: Optional[int]
+) -> int:
+    """
+    Run render tasks in a process pool, pulling them lazily from an iterator.
+
+    At most two tasks per process are in flight, so the inputs of the tasks
+    are never all in memory. An exception raised by the iterator, such as a
+    cancellation, cancels the tasks that have not started and propagates
+    once the running ones stop.
+
+    Args:
+        tasks: Pairs of a module-level function and its arguments.
+        max_workers: Number of worker processes, by default one per CPU.
+
+    Returns:
+        int: The sum of the task results.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    total = 0
+    # Spawned processes don't inherit the GUI's threads and locks
+    executor = ProcessPoolExecutor(
+        max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        pending: Deque[Future] = deque()
+        for func, args in tasks:
+            pending.append(executor.submit(func, *args))
+            while len(pending) >= max_workers * 2:
+                total += pending.popleft().result()
+        while pending:
+            total += pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return total
+
+
+def export_to_pdf_parallel(
+    file_name: str,
+    nodes_data: Iterable[Dict[str, Any]],
+    chunk_size: int,
+    max_workers: Optional[int] = None,
+) -> int:
+    """
+    Export nodes data to a PDF file, rendering chunks of nodes in parallel.
+
+    Nodes are consumed from the iterable one chunk at a time and each chunk
+    is rendered to a partial PDF in a process pool; then the partial PDFs
+    are concatenated in order. An export that fits in one chunk is rendered
+    directly without a pool.
+
+    Args:
+        file_name: Name of the PDF file to create.
+        nodes_data: The node data to export.
+        chunk_size: Number of nodes per partial PDF.
+        max_workers: Number of worker processes, by default one per CPU.
+
+    Returns:
+        int: The number of exported nodes.
+
+    Raises:
+        ValueError: If there are no nodes to export.
+        IOError: If a chunk cannot be rendered.
+    """
+    nodes = iter(nodes_data)
+    first_chunk = list(islice(nodes, chunk_size))
+    if len(first_chunk) < chunk_size:
+        PDFExporter().export_to_pdf(file_name, first_chunk)
+        return len(first_chunk)
+
+    with tempfile.TemporaryDirectory(
+        dir=os.path.dirname(os.path.abspath(file_name))
+    ) as temp_dir:
+        parts: List[str] = []
+
+        def tasks() -> Iterator[Tuple[Callable[..., int], tuple]]:
+            chunk = first_chunk
+            while chunk:
+                part = os.path.join(temp_dir, f"{len(parts):06d}.pdf")
+                parts.append(part)
+                yield render_chunk, (part, plain_value(chunk), len(parts) == 1)
+                chunk = list(islice(nodes, chunk_size))
+
+        exported = _run_in_pool(tasks(), max_workers)
+        merge_pdfs(parts, file_name)
+    return exported
+
+
+def render_pdf_parts(
+    parts: Iterable[Tuple[str, Dict[str, Any], bool]],
+    chunk_size: int,
+    max_workers: Optional[int] = None,
+) -> int:
+    """
+    Render nodes to one PDF each, chunks of nodes in parallel.
+
+    Args:
+        parts: PDF file name, node data and whether the part carries the
+            title, per node.
+        chunk_size: Number of nodes per worker task.
+        max_workers: Number of worker processes, by default one per CPU.
+
+    Returns:
+        int: The number of rendered nodes.
+    """
+    parts = iter(parts)
+    tasks = (
+        (render_parts, (plain_value(chunk),))
+        for chunk in iter(lambda: list(islice(parts, chunk_size)), [])
+    )
+    return _run_in_pool(tasks, max_workers)
+
+
+def merge_pdfs(part_names: Iterable[str], file_name: str) -> None:
+    """
+    Concatenate PDF files in order.
+
+    Args:
+        part_names: Names of the PDFs to concatenate.
+        file_name: Name of the PDF file to create.
+    """
+    writer = PdfWriter()
+    for part in part_names:
+        writer.append(part)
+    with open(file_name, "wb") as file:
+        writer.write(file)
@@ -0,0 +1,284 @@
+"""
+This module renders node data to PDF with ReportLab.
+
+It is the entry point of the processes rendering PDF exports in parallel, so
+it imports nothing beyond ReportLab and the standard library and its render
+functions take plain dicts, lists and strings.
+"""
+
+import html
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+
+
+@lru_cache(maxsize=None)
+def get_pdf_styles() -> StyleSheet1:
+    """
+    Get the paragraph styles of the PDF export.
+
+    The stylesheet is built once per process and shared by every chunk the
+    process renders.
+
+    Returns:
+        StyleSheet1: The sample stylesheet with the custom export styles.
+    """
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            name="CustomNormal",
+            parent=styles["Normal"],
+            fontSize=10,
+            leading=14,
+            leftIndent=0,
+            rightIndent=0,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="CustomHeading1",
+            parent=styles["Heading1"],
+            fontSize=14,
+            leading=18,
+            spaceAfter=10,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="CustomHeading2",
+            parent=styles["Heading2"],
+            fontSize=12,
+            leading=16,
+            spaceBefore=10,
+            spaceAfter=6,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="IndentedText",
+            parent=styles["Normal"],
+            leftIndent=20,
+            fontSize=10,
+            leading=14,
+        )
+    )
+    return styles
+
+
+class PDFExporter:
+    def __init__(self):
+        self.styles = get_pdf_styles()
+
+    def _escape_text(self, text: Any) -> str:
+        """
+        Safely convert any input to string and escape HTML entities.
+
+        Args:
+            text: Any input that needs to be converted to safe string
+
+        Returns:
+            str: HTML-escaped string safe for PDF
+        """
+        return html.escape(str(text))
+
+    def _format_relationship(self, rel: tuple) -> str:
+        """
+        Format relationship data safely for PDF.
+
+        Args:
+            rel: Tuple containing (type, target, direction, properties)
+
+        Returns:
+            str: Formatted relationship string
+        """
+        try:
+            rel_type, target, direction, properties = rel
+            props_str = ", ".join(f"{k}: {v}" for k, v in properties.items())
+            return self._escape_text(
+                f"Type: {rel_type}, Target: {target}, "
+                f"Direction: {direction}, Properties: {{{props_str}}}"
+            )
+        except Exception as e:
+            return f"Error formatting relationship: {str(e)}"
+
+    def _add_section(
+        self,
+        elements: List,
+        title: str,
+        content: Any,
+        style: str = "CustomNormal",
+        indented: bool = False,
+    ) -> None:
+        """
+        Add a section to the PDF with proper formatting.
+
+        Args:
+            elements: List of PDF elements
+            title: Section title
+            content: Content to add
+            style: Style to apply to content
+            indented: Whether to indent the content
+        """
+        elements.append(Paragraph(title, self.styles["CustomHeading2"]))
+
+        if isinstance(content, list):
+            for item in content:
+                elements.append(
+                    Paragraph(
+                        f"• {self._escape_text(item)}",
+                        self.styles["IndentedText" if indented else style],
+                    )
+                )
+        else:
+            elements.append(
+                Paragraph(
+                    self._escape_text(content),
+                    self.styles["IndentedText" if indented else style],
+                )
+            )
+        elements.append(Spacer(1, 6))
+
+    def export_to_pdf(
+        self,
+        file_name: str,
+        nodes_data: List[Dict[str, Any]],
+        include_title: bool = True,
+    ) -> None:
+        """
+        Export nodes data to a PDF file.
+
+        Args:
+            file_name: Name of the PDF file to create
+            nodes_data: List of node data dictionaries to export
+            include_title: Whether to start with the report title
+
+        Raises:
+            ValueError: If file_name is empty or nodes_data is empty
+            IOError: If there are issues writing to the file
+        """
+        if not file_name or not nodes_data:
+            raise ValueError("File name and nodes data are required")
+
+        # Create PDF document
+        doc = SimpleDocTemplate(
+            file_name,
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72,
+        )
+
+        elements = []
+
+        # Add title
+        if include_title:
+            elements.append(Paragraph("Node Export Report", self.styles["Title"]))
+            elements.append(Spacer(1, 30))
+
+        # Process each node
+        for i, node_data in enumerate(nodes_data):
+            if i > 0:
+                elements.append(PageBreak())
+
+            try:
+                # Node name as header
+                elements.append(
+                    Paragraph(
+                        f"Node: {self._escape_text(node_data.get('name', 'Unnamed'))}",
+                        self.styles["CustomHeading1"],
+                    )
+                )
+                elements.append(Spacer(1, 12))
+
+                # Description
+                self._add_section(
+                    elements,
+                    "Description:",
+                    node_data.get("description", "No description available"),
+                )
+
+                # Tags
+                self._add_section(
+                    elements, "Tags:", ", ".join(node_data.get("tags", []))
+                )
+
+                # Labels
+                self._add_section(
+                    elements, "Labels:", ", ".join(node_data.get("labels", []))
+                )
+
+                # Relationships
+                elements.append(
+                    Paragraph("Relationships:", self.styles["CustomHeading2"])
+                )
+                for rel in node_data.get("relationships", []):
+                    elements.append(
+                        Paragraph(
+                            f"• {self._format_relationship(rel)}",
+                            self.styles["IndentedText"],
+                        )
+                    )
+                elements.append(Spacer(1, 12))
+
+                # Additional Properties
+                elements.append(
+                    Paragraph("Additional Properties:", self.styles["CustomHeading2"])
+                )
+                for key, value in node_data.get("additional_properties", {}).items():
+                    elements.append(
+                        Paragraph(
+                            f"• {self._escape_text(key)}: {self._escape_text(value)}",
+                            self.styles["IndentedText"],
+                        )
+                    )
+                elements.append(Spacer(1, 12))
+
+            except Exception as e:
+                elements.append(
+                    Paragraph(
+                        f"Error processing node: {str(e)}", self.styles["CustomNormal"]
+                    )
+                )
+
+        try:
+            # Build the PDF
+            doc.build(elements)
+        except Exception as e:
+            raise IOError(f"Failed to create PDF: {str(e)}")
+
+
+def render_chunk(file_name: str, nodes_data: List[Dict[str, Any]], first: bool) -> int:
+    """
+    Render one chunk of nodes to its own PDF in a worker process.
+
+    Args:
+        file_name: Name of the partial PDF.
+        nodes_data: Node data of the chunk.
+        first: Whether this is the first chunk, which carries the title.
+
+    Returns:
+        int: The number of rendered nodes.
+    """
+    PDFExporter().export_to_pdf(file_name, nodes_data, include_title=first)
+    return len(nodes_data)
+
+
+def render_parts(parts: List[Tuple[str, Dict[str, Any], bool]]) -> int:
+    """
+    Render each node of a chunk to its own PDF in a worker process.
+
+    Args:
+        parts: PDF file name, node data and whether the part carries the
+            title, per node.
+
+    Returns:
+        int: The number of rendered nodes.
+    """
+    exporter = PDFExporter()
+    for file_name, node_data, include_title in parts:
+        exporter.export_to_pdf(file_name, [node_data], include_title=include_title)
+    return len(parts)
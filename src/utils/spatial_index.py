@@ -0,0 +1,179 @@
+"""
+This module provides the PinSpatialIndex class, an STRtree-backed index over the
+pin geometries of one map.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry.base import BaseGeometry
+
+
+class PinSpatialIndex:
+    """
+    Spatial index over the pin geometries of a map, keyed by target node name.
+
+    Geometries live in a numpy array parallel to the names so they can be
+    created and queried with Shapely's vectorized functions. Shapely trees are
+    immutable, so placing or moving a pin only updates the array and the
+    STRtree is bulk-loaded again on the next query.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._names: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._geometries = np.empty(0, dtype=object)
+        self._tree: Optional[STRtree] = None
+
+    @staticmethod
+    def parse_wkt(wkts: Sequence[str]) -> np.ndarray:
+        """
+        Parse WKT strings in one vectorized call.
+
+        Args:
+            wkts: The WKT strings.
+
+        Returns:
+            np.ndarray: The geometries, None where a string is invalid.
+        """
+        return shapely.from_wkt(np.asarray(wkts, dtype=object), on_invalid="ignore")
+
+    @staticmethod
+    def anchor_points(geometries: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the pin anchor of each geometry, its centroid.
+
+        Args:
+            geometries: Array of geometries.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The x and y coordinates.
+        """
+        centroids = shapely.centroid(geometries)
+        return shapely.get_x(centroids), shapely.get_y(centroids)
+
+    def rebuild(self, names: Sequence[str], geometries: np.ndarray) -> None:
+        """
+        Replace all indexed pins.
+
+        Args:
+            names: Target node names.
+            geometries: Geometries parallel to the names.
+        """
+        self._names = list(names)
+        self._positions = {name: i for i, name in enumerate(self._names)}
+        self._geometries = np.asarray(geometries, dtype=object)
+        self._tree = None
+
+    def set(self, name: str, geometry: BaseGeometry) -> None:
+        """
+        Add a pin or move an existing one.
+
+        Args:
+            name: Target node name.
+            geometry: The new geometry.
+        """
+        position = self._positions.get(name)
+        if position is None:
+            self._positions[name] = len(self._names)
+            self._names.append(name)
+            self._geometries = np.append(self._geometries, np.empty(1, dtype=object))
+            position = len(self._names) - 1
+        self._geometries[position] = geometry
+        self._tree = None
+
+    def remove(self, name: str) -> bool:
+        """
+        Remove a pin.
+
+        Args:
+            name: Target node name.
+
+        Returns:
+            bool: True if the pin was indexed.
+        """
+        position = self._positions.pop(name, None)
+        if position is None:
+            return False
+
+        # Move the last pin into the freed slot
+        last = len(self._names) - 1
+        if position != last:
+            moved = self._names[last]
+            self._names[position] = moved
+            self._geometries[position] = self._geometries[last]
+            self._positions[moved] = position
+        self._names.pop()
+        self._geometries = self._geometries[:last]
+        self._tree = None
+        return True
+
+    def _get_tree(self) -> STRtree:
+        if self._tree is None:
+            self._tree = STRtree(self._geometries)
+        return self._tree
+
+    def _names_at(self, indices: np.ndarray) -> List[str]:
+        return [self._names[i] for i in indices.tolist()]
+
+    def query_box(self, xmin: float, ymin: float, xmax: float, ymax: float) -> List[str]:
+        """
+        Find the pins intersecting a rectangle, such as the visible viewport.
+
+        Args:
+            xmin: Left edge in image coordinates.
+            ymin: Top edge in image coordinates.
+            xmax: Right edge in image coordinates.
+            ymax: Bottom edge in image coordinates.
+
+        Returns:
+            List[str]: Names of the pins in the rectangle.
+        """
+        if not self._names:
+            return []
+        box = shapely.box(xmin, ymin, xmax, ymax)
+        return self._names_at(self._get_tree().query(box, predicate="intersects"))
+
+    def nearest(
+        self, x: float, y: float, max_distance: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Find the pin closest to a point.
+
+        Args:
+            x: X in image coordinates.
+            y: Y in image coordinates.
+            max_distance: Optional search radius in image coordinates.
+
+        Returns:
+            Optional[str]: Name of the nearest pin, or None if none is in range.
+        """
+        if not self._names:
+            return None
+        indices = self._get_tree().query_nearest(
+            shapely.points(x, y), max_distance=max_distance
+        )
+        return self._names[indices[0]] if len(indices) else None
+
+    def within(self, region: BaseGeometry) -> List[str]:
+        """
+        Find the pins lying inside a region, such as a polygon.
+
+        Args:
+            region: The region geometry in image coordinates.
+
+        Returns:
+            List[str]: Names of the pins contained in the region.
+        """
+        if not self._names:
+            return []
+        return self._names_at(self._get_tree().query(region, predicate="contains"))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    def __len__(self) -> int:
+        return len(self._names)
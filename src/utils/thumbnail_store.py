@@ -0,0 +1,180 @@
+"""
+This module provides the ThumbnailStore class, a content-addressed on-disk store
+of downscaled copies of node images.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QImage
+
+from utils.image_cache import decode_scaled
+from utils.tile_pyramid import content_hash
+
+INDEX_NAME = "index.json"
+JPEG_QUALITY = 85
+
+
+class ThumbnailStore:
+    """
+    Thumbnails of source images, stored once per SHA-256 of the source content.
+
+    Each source gets one file per configured size, named
+    ``<hash[:2]>/<hash>_<size>.<ext>``, so identical images referenced from
+    several paths share their thumbnails. An index maps source paths to their
+    hash together with the size and modification time they had when hashed,
+    so lookups only need a stat of the source instead of hashing it again.
+
+    generate() only writes content-addressed files and may run in a worker
+    thread; the index is read and updated from the GUI thread.
+
+    Args:
+        root: Directory of the store.
+        sizes: Edge lengths of the generated thumbnails in pixels.
+    """
+
+    def __init__(self, root: str, sizes: Iterable[int]) -> None:
+        """
+        Initialize the store and read its index.
+
+        Args:
+            root: Directory of the store.
+            sizes: Edge lengths of the generated thumbnails in pixels.
+        """
+        self.root = root
+        self.sizes = sorted(sizes)
+        self._index: Dict[str, Dict[str, Any]] = self._read_index()
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.root, INDEX_NAME), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_index(self) -> None:
+        """Write the index atomically."""
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, INDEX_NAME)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(temp_path, path)
+
+    def _thumbnail_path(self, digest: str, size: int, tile_format: str) -> str:
+        return os.path.join(self.root, digest[:2], f"{digest}_{size}.{tile_format}")
+
+    def _current_entry(self, source_path: str) -> Optional[Dict[str, Any]]:
+        """Get the index entry of a source if the file is unchanged since."""
+        entry = self._index.get(source_path)
+        if not entry:
+            return None
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        if entry["mtime"] != stat.st_mtime_ns or entry["bytes"] != stat.st_size:
+            return None
+        return entry
+
+    def lookup(self, source_path: str, min_edge: int) -> Optional[str]:
+        """
+        Find the smallest thumbnail of a source that covers an edge length.
+
+        Args:
+            source_path: Path of the source image.
+            min_edge: Required edge length in pixels.
+
+        Returns:
+            Optional[str]: Path of the thumbnail, or None if there is none.
+        """
+        entry = self._current_entry(source_path)
+        if not entry:
+            return None
+        for size in self.sizes:
+            if size >= min_edge:
+                path = self._thumbnail_path(entry["sha256"], size, entry["format"])
+                return path if os.path.exists(path) else None
+        return None
+
+    def missing(self, source_paths: Iterable[str]) -> List[str]:
+        """
+        Get the existing sources whose thumbnails are absent or outdated.
+
+        Args:
+            source_paths: Paths of source images; duplicates are ignored.
+
+        Returns:
+            List[str]: Paths to generate thumbnails for.
+        """
+        return [
+            path
+            for path in dict.fromkeys(source_paths)
+            if path and os.path.isfile(path) and not self._current_entry(path)
+        ]
+
+    def generate(self, source_path: str) -> Dict[str, Any]:
+        """
+        Write all thumbnails of a source unless its content is already stored.
+
+        The source is decoded once at the largest size and each smaller size
+        is derived from it.
+
+        Args:
+            source_path: Path of the source image.
+
+        Returns:
+            Dict[str, Any]: The index entry to record for the source.
+
+        Raises:
+            OSError: If the source cannot be read or a thumbnail written.
+            ValueError: If the source cannot be decoded.
+        """
+        stat = os.stat(source_path)
+        digest = content_hash(source_path)
+        entry = {"mtime": stat.st_mtime_ns, "bytes": stat.st_size, "sha256": digest}
+
+        for tile_format in ("jpg", "png"):
+            if all(
+                os.path.exists(self._thumbnail_path(digest, size, tile_format))
+                for size in self.sizes
+            ):
+                return {**entry, "format": tile_format}
+
+        largest = self.sizes[-1]
+        image = decode_scaled(source_path, QSize(largest, largest))
+        tile_format = "png" if image.hasAlphaChannel() else "jpg"
+        os.makedirs(os.path.join(self.root, digest[:2]), exist_ok=True)
+
+        for size in reversed(self.sizes):
+            if image.width() > size or image.height() > size:
+                image = image.scaled(
+                    size,
+                    size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+            self._write(image, self._thumbnail_path(digest, size, tile_format))
+        return {**entry, "format": tile_format}
+
+    @staticmethod
+    def _write(image: QImage, path: str) -> None:
+        """Save an image atomically, so readers never see a partial file."""
+        temp_path = f"{path}.tmp"
+        tile_format = os.path.splitext(path)[1][1:]
+        quality = JPEG_QUALITY if tile_format == "jpg" else -1
+        if not image.save(temp_path, tile_format.upper(), quality):
+            raise OSError(f"Cannot write thumbnail {path}")
+        os.replace(temp_path, path)
+
+    def record(self, source_path: str, entry: Dict[str, Any]) -> None:
+        """
+        Record the thumbnails generated for a source.
+
+        Args:
+            source_path: Path of the source image.
+            entry: The entry returned by generate().
+        """
+        self._index[source_path] = entry
@@ -0,0 +1,573 @@
+"""
+This module provides the TilePyramid class, a multi-resolution tiled copy of a
+map image that is cached on disk and rendered one visible tile at a time.
+"""
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import threading
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from PyQt6.QtCore import QRectF, QSize, Qt
+from PyQt6.QtGui import QImage, QImageReader, QPainter, QPixmap, QPixmapCache
+
+MANIFEST_NAME = "pyramid.json"
+MANIFEST_VERSION = 1
+JPEG_QUALITY = 90
+BYTES_PER_PIXEL = 4  # Decoded images are 32-bit
+# Content hashes of source images by path, with the stat they were taken at
+HASH_INDEX_NAME = "hashes.json"
+
+_hash_index_lock = threading.Lock()
+
+
+def content_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's content.
+
+    Args:
+        path: Path of the file.
+        chunk_size: Bytes read per chunk.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_hash_index(cache_root: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(os.path.join(cache_root, HASH_INDEX_NAME), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def cached_content_hash(path: str, cache_root: str) -> str:
+    """
+    Get the content hash of a file, hashing it only if it changed.
+
+    Hashes are kept in an index in the cache root keyed by path and reused
+    while the file's modification time and size are unchanged.
+
+    Args:
+        path: Path of the file.
+        cache_root: Directory holding the index.
+
+    Returns:
+        str: The SHA-256 hex digest.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    with _hash_index_lock:
+        entry = _read_hash_index(cache_root).get(path)
+    if (
+        entry
+        and entry["mtime"] == stat.st_mtime_ns
+        and entry["bytes"] == stat.st_size
+    ):
+        return entry["sha256"]
+
+    digest = content_hash(path)
+    with _hash_index_lock:
+        index = _read_hash_index(cache_root)
+        index[path] = {
+            "mtime": stat.st_mtime_ns,
+            "bytes": stat.st_size,
+            "sha256": digest,
+        }
+        os.makedirs(cache_root, exist_ok=True)
+        index_path = os.path.join(cache_root, HASH_INDEX_NAME)
+        temp_path = f"{index_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(temp_path, index_path)
+    return digest
+
+
+def _directory_size(directory: str) -> int:
+    total = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def evict_pyramids(
+    cache_root: str, max_bytes: int, keep: Collection[str] = ()
+) -> int:
+    """
+    Delete the least recently used pyramids until the cache fits a size.
+
+    A pyramid's last use is the modification time of its manifest, which
+    TilePyramid.touch() updates; unfinished builds have no manifest and count
+    as used when their directory last changed.
+
+    Args:
+        cache_root: Directory holding one pyramid per content hash.
+        max_bytes: Size the cache may take on disk.
+        keep: Content hashes of pyramids that must not be deleted.
+
+    Returns:
+        int: The number of pyramids deleted.
+    """
+    try:
+        names = os.listdir(cache_root)
+    except OSError:
+        return 0
+
+    total = 0
+    candidates: List[Tuple[float, int, str]] = []
+    for name in names:
+        directory = os.path.join(cache_root, name)
+        if not os.path.isdir(directory):
+            continue
+        size = _directory_size(directory)
+        total += size
+        if name in keep:
+            continue
+        try:
+            last_used = os.stat(os.path.join(directory, MANIFEST_NAME)).st_mtime
+        except OSError:
+            last_used = os.stat(directory).st_mtime
+        candidates.append((last_used, size, directory))
+
+    removed = 0
+    for _, size, directory in sorted(candidates):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(directory, ignore_errors=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+class TilePyramid:
+    """
+    A tiled image pyramid stored as one directory per image content hash.
+
+    Level 0 is the full-resolution image and every further level halves the
+    previous one, down to a level that fits in a single tile. Tiles are stored
+    as files named ``<level>/<col>_<row>.<ext>``. Decoding happens off the GUI
+    thread in render(); painting only uses tiles already in the shared
+    QPixmapCache and stands in coarser levels for the rest.
+
+    Args:
+        directory: Directory holding the manifest and tiles.
+        width: Width of the source image in pixels.
+        height: Height of the source image in pixels.
+        tile_size: Edge length of a tile in pixels.
+        levels: Number of levels.
+        tile_format: Image format of the tile files, "png" or "jpg".
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        width: int,
+        height: int,
+        tile_size: int,
+        levels: int,
+        tile_format: str,
+    ) -> None:
+        self.directory = directory
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.levels = levels
+        self.tile_format = tile_format
+        self._key = os.path.basename(directory)
+
+    @classmethod
+    def for_image(
+        cls,
+        image_path: str,
+        cache_root: str,
+        tile_size: int,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        max_cache_bytes: int = 0,
+        max_pixels: int = 0,
+    ) -> Optional["TilePyramid"]:
+        """
+        Open the cached pyramid of an image, building it on first use.
+
+        The image is only hashed again when its modification time or size
+        changed since it was last opened. After a build, the least recently
+        used pyramids are evicted until the cache fits max_cache_bytes.
+
+        Args:
+            image_path: Path of the source image.
+            cache_root: Directory holding one pyramid per content hash.
+            tile_size: Edge length of a tile in pixels.
+            is_cancelled: Optional callback polled while building.
+            max_cache_bytes: Disk size of the cache, 0 for no limit.
+            max_pixels: Largest image to build a pyramid for, 0 for no limit.
+
+        Returns:
+            Optional[TilePyramid]: The pyramid, or None if building was cancelled.
+
+        Raises:
+            ValueError: If the image cannot be decoded.
+        """
+        digest = cached_content_hash(image_path, cache_root)
+        directory = os.path.join(cache_root, digest)
+        pyramid = cls.load(directory)
+        if pyramid and pyramid.tile_size == tile_size:
+            pyramid.touch()
+            return pyramid
+
+        pyramid = cls.build(image_path, directory, tile_size, is_cancelled, max_pixels)
+        if pyramid and max_cache_bytes:
+            evict_pyramids(cache_root, max_cache_bytes, keep={digest})
+        return pyramid
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["TilePyramid"]:
+        """
+        Load a pyramid from its manifest.
+
+        Args:
+            directory: Directory of the pyramid.
+
+        Returns:
+            Optional[TilePyramid]: The pyramid, or None if it is missing or incomplete.
+        """
+        try:
+            with open(os.path.join(directory, MANIFEST_NAME), "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != MANIFEST_VERSION:
+            return None
+        return cls(
+            directory,
+            manifest["width"],
+            manifest["height"],
+            manifest["tile_size"],
+            manifest["levels"],
+            manifest["tile_format"],
+        )
+
+    @classmethod
+    def build(
+        cls,
+        image_path: str,
+        directory: str,
+        tile_size: int,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        max_pixels: int = 0,
+    ) -> Optional["TilePyramid"]:
+        """
+        Decode an image once and write all levels of its pyramid.
+
+        Each level is derived from the previous one, so at most two levels are
+        held in memory. The full image is decoded at once, so the build peaks
+        at about 5 bytes per source pixel (1.25 GiB for 16k x 16k); max_pixels
+        refuses larger images before decoding. The manifest is written last;
+        an interrupted build leaves no manifest and is redone on the next load.
+
+        Args:
+            image_path: Path of the source image.
+            directory: Directory to write the pyramid to.
+            tile_size: Edge length of a tile in pixels.
+            is_cancelled: Optional callback polled between tiles.
+            max_pixels: Largest image to decode, 0 for no limit.
+
+        Returns:
+            Optional[TilePyramid]: The pyramid, or None if building was cancelled.
+
+        Raises:
+            ValueError: If the image is too large or cannot be decoded.
+        """
+        reader = QImageReader(image_path)
+        reader.setAutoTransform(True)
+
+        # The header gives the size without decoding the image
+        size = reader.size()
+        pixels = size.width() * size.height() if size.isValid() else 0
+        if max_pixels and pixels > max_pixels:
+            raise ValueError(
+                f"Cannot open {image_path}: {size.width()}x{size.height()} "
+                f"exceeds the limit of {max_pixels} pixels"
+            )
+        # Qt refuses decodes above its own allocation limit, 256 MB by default
+        needed_mb = math.ceil(pixels * BYTES_PER_PIXEL / (1 << 20))
+        if 0 < QImageReader.allocationLimit() < needed_mb:
+            QImageReader.setAllocationLimit(needed_mb)
+
+        image = reader.read()
+        if image.isNull():
+            raise ValueError(f"Cannot decode {image_path}: {reader.errorString()}")
+
+        tile_format = "png" if image.hasAlphaChannel() else "jpg"
+        width, height = image.width(), image.height()
+
+        level = 0
+        while True:
+            level_dir = os.path.join(directory, str(level))
+            os.makedirs(level_dir, exist_ok=True)
+            for row in range(math.ceil(image.height() / tile_size)):
+                for col in range(math.ceil(image.width() / tile_size)):
+                    if is_cancelled and is_cancelled():
+                        return None
+                    tile = image.copy(
+                        col * tile_size, row * tile_size, tile_size, tile_size
+                    )
+                    tile.save(
+                        os.path.join(level_dir, f"{col}_{row}.{tile_format}"),
+                        None,
+                        JPEG_QUALITY if tile_format == "jpg" else -1,
+                    )
+
+            if image.width() <= tile_size and image.height() <= tile_size:
+                break
+            image = image.scaled(
+                math.ceil(image.width() / 2),
+                math.ceil(image.height() / 2),
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            level += 1
+
+        pyramid = cls(directory, width, height, tile_size, level + 1, tile_format)
+        pyramid._write_manifest()
+        return pyramid
+
+    def touch(self) -> bool:
+        """
+        Mark the pyramid as just used, so eviction keeps it longest.
+
+        Returns:
+            bool: False if the pyramid was evicted from the cache.
+        """
+        try:
+            os.utime(os.path.join(self.directory, MANIFEST_NAME))
+            return True
+        except OSError:
+            return False
+
+    def _write_manifest(self) -> None:
+        """Write the manifest atomically, marking the pyramid complete."""
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "width": self.width,
+            "height": self.height,
+            "tile_size": self.tile_size,
+            "levels": self.levels,
+            "tile_format": self.tile_format,
+        }
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(temp_path, path)
+
+    def level_for_scale(self, scale: float) -> int:
+        """
+        Get the coarsest level that still has at least one pixel per screen pixel.
+
+        Args:
+            scale: Display scale relative to the full-resolution image.
+
+        Returns:
+            int: The level index.
+        """
+        if scale >= 1.0:
+            return 0
+        return min(int(math.log2(1.0 / scale)), self.levels - 1)
+
+    def tile_key(self, level: int, col: int, row: int) -> str:
+        """Get the QPixmapCache key of a tile."""
+        return f"{self._key}/{level}/{col}_{row}"
+
+    def tile_path(self, level: int, col: int, row: int) -> str:
+        """Get the file path of a tile."""
+        return os.path.join(
+            self.directory, str(level), f"{col}_{row}.{self.tile_format}"
+        )
+
+    def cached_tile(self, level: int, col: int, row: int) -> Optional[QPixmap]:
+        """
+        Get a tile if it is already decoded. Must be called from the GUI thread.
+
+        Args:
+            level: The level index.
+            col: Tile column.
+            row: Tile row.
+
+        Returns:
+            Optional[QPixmap]: The tile, or None if it is not cached.
+        """
+        return QPixmapCache.find(self.tile_key(level, col, row))
+
+    def tile(self, level: int, col: int, row: int) -> Optional[QPixmap]:
+        """
+        Get a decoded tile, reading it from disk on first use.
+
+        Must be called from the GUI thread.
+
+        Args:
+            level: The level index.
+            col: Tile column.
+            row: Tile row.
+
+        Returns:
+            Optional[QPixmap]: The tile, or None if its file is missing.
+        """
+        pixmap = self.cached_tile(level, col, row)
+        if pixmap is None:
+            pixmap = QPixmap(self.tile_path(level, col, row))
+            if pixmap.isNull():
+                return None
+            QPixmapCache.insert(self.tile_key(level, col, row), pixmap)
+        return pixmap
+
+    def _tile_span(self, level: int) -> int:
+        """Get the edge of a tile of a level in full-resolution pixels."""
+        return self.tile_size << level
+
+    def _tiles_in(self, level: int, exposed: QRectF) -> Iterator[Tuple[int, int]]:
+        """Yield the (col, row) of the tiles of a level intersecting a region."""
+        factor = 1 << level
+        span = self._tile_span(level)
+        cols = math.ceil(math.ceil(self.width / factor) / self.tile_size)
+        rows = math.ceil(math.ceil(self.height / factor) / self.tile_size)
+
+        first_col = max(0, int(exposed.left() // span))
+        last_col = min(cols - 1, int(exposed.right() // span))
+        first_row = max(0, int(exposed.top() // span))
+        last_row = min(rows - 1, int(exposed.bottom() // span))
+
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                yield col, row
+
+    def _tile_target(self, level: int, col: int, row: int, tile_size: QSize) -> QRectF:
+        """Get the full-resolution rectangle covered by a decoded tile."""
+        factor = 1 << level
+        span = self._tile_span(level)
+        return QRectF(
+            col * span,
+            row * span,
+            tile_size.width() * factor,
+            tile_size.height() * factor,
+        )
+
+    def paint(self, painter: QPainter, exposed: QRectF, scale: float) -> None:
+        """
+        Paint the tiles intersecting a region from the decoded tile cache.
+
+        The painter must map image coordinates to the device, so only the
+        level matching the scale is drawn and only the exposed tiles. Tiles
+        that are not decoded yet are covered by the nearest coarser cached
+        level, down to the single top tile.
+
+        Args:
+            painter: Painter in full-resolution image coordinates.
+            exposed: Region to paint, in image coordinates.
+            scale: Display scale relative to the full-resolution image.
+        """
+        level = self.level_for_scale(scale)
+        top = self.levels - 1
+        for col, row in self._tiles_in(level, exposed):
+            if level == top:
+                pixmap = self.tile(level, col, row)
+            else:
+                pixmap = self.cached_tile(level, col, row)
+            if pixmap is None:
+                self._paint_fallback(painter, level, col, row)
+                continue
+            target = self._tile_target(level, col, row, pixmap.size())
+            painter.drawPixmap(target, pixmap, QRectF(pixmap.rect()))
+
+    def _paint_fallback(self, painter: QPainter, level: int, col: int, row: int) -> None:
+        """Cover a missing tile with the matching part of a coarser tile."""
+        span = self._tile_span(level)
+        target = QRectF(col * span, row * span, span, span).intersected(
+            QRectF(0, 0, self.width, self.height)
+        )
+        top = self.levels - 1
+        for coarser in range(level + 1, self.levels):
+            shift = coarser - level
+            ancestor_col, ancestor_row = col >> shift, row >> shift
+            if coarser == top:
+                pixmap = self.tile(coarser, ancestor_col, ancestor_row)
+            else:
+                pixmap = self.cached_tile(coarser, ancestor_col, ancestor_row)
+            if pixmap is None:
+                continue
+
+            factor = 1 << coarser
+            ancestor_span = self._tile_span(coarser)
+            source = QRectF(
+                (target.x() - ancestor_col * ancestor_span) / factor,
+                (target.y() - ancestor_row * ancestor_span) / factor,
+                target.width() / factor,
+                target.height() / factor,
+            )
+            painter.drawPixmap(target, pixmap, source)
+            return
+
+    def render(
+        self,
+        exposed: QRectF,
+        size: QSize,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Optional[Tuple[QImage, List[Tuple[str, QImage]]]]:
+        """
+        Render a region with smooth filtering, decoding its tiles from disk.
+
+        Only uses QImage, so it is safe to call from a worker thread.
+
+        Args:
+            exposed: Region to render, in image coordinates.
+            size: Size of the resulting image in device pixels.
+            is_cancelled: Optional callback polled between tiles.
+
+        Returns:
+            Optional[Tuple[QImage, List[Tuple[str, QImage]]]]: The rendered
+            image and the decoded tiles by cache key, or None if cancelled.
+        """
+        scale = size.width() / exposed.width() if exposed.width() else 1.0
+        level = self.level_for_scale(scale)
+
+        image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.scale(scale, size.height() / exposed.height())
+        painter.translate(-exposed.x(), -exposed.y())
+
+        decoded: List[Tuple[str, QImage]] = []
+        try:
+            for col, row in self._tiles_in(level, exposed):
+                if is_cancelled and is_cancelled():
+                    return None
+                tile = QImage(self.tile_path(level, col, row))
+                if tile.isNull():
+                    continue
+                target = self._tile_target(level, col, row, tile.size())
+                painter.drawImage(target, tile, QRectF(tile.rect()))
+                decoded.append((self.tile_key(level, col, row), tile))
+        finally:
+            painter.end()
+        return image, decoded
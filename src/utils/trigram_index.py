@@ -0,0 +1,292 @@
+"""
+This module provides the TrigramIndex class, an n-gram index over node names
+for substring and typo-tolerant lookups.
+"""
+
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Pattern, Set
+
+N = 3
+MAX_FUZZY_CANDIDATES = 500
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Get the distinct trigrams of a case-folded string.
+
+    Args:
+        text: The case-folded text.
+
+    Returns:
+        Set[str]: Its trigrams, empty for strings shorter than three characters.
+    """
+    return {text[i : i + N] for i in range(len(text) - N + 1)}
+
+
+def supports_fuzzy(text: str, max_distance: int) -> bool:
+    """
+    Check whether a text is long enough for trigram fuzzy matching.
+
+    Each edit destroys up to N trigrams of the query, so a query needs more
+    than ``N * max_distance`` distinct trigrams for a match to share any.
+
+    Args:
+        text: The typed text.
+        max_distance: Maximum number of edits.
+
+    Returns:
+        bool: True if fuzzy_matches can find candidates for the text.
+    """
+    return len(trigrams(text.casefold())) > N * max_distance
+
+
+def substring_distance(query: str, text: str, max_distance: int) -> Optional[int]:
+    """
+    Get the smallest edit distance between a query and any substring of a text.
+
+    Uses Sellers' variant of the Levenshtein recurrence, where a match may start
+    anywhere in the text, and stops early on an exact match.
+
+    Args:
+        query: The pattern to look for.
+        text: The text to search in.
+        max_distance: Largest distance of interest.
+
+    Returns:
+        Optional[int]: The distance, or None if it exceeds ``max_distance``.
+    """
+    # column[i] is the best distance for query[:i] ending at the current text position
+    column = list(range(len(query) + 1))
+    best = column[-1]
+    for char in text:
+        previous_diagonal = 0  # Row 0 stays 0, so a match may start anywhere
+        for i, query_char in enumerate(query, 1):
+            substitution = previous_diagonal + (query_char != char)
+            previous_diagonal = column[i]
+            column[i] = min(substitution, column[i] + 1, column[i - 1] + 1)
+        if column[-1] < best:
+            best = column[-1]
+            if best == 0:
+                return 0
+    return best if best <= max_distance else None
+
+
+def single_edit_pattern(query: str) -> Pattern[str]:
+    """
+    Compile a pattern matching the query with at most one edit.
+
+    Args:
+        query: The case-folded query.
+
+    Returns:
+        Pattern[str]: Alternation of every single substitution, insertion and
+        deletion of the query.
+    """
+    variants = {re.escape(query)}
+    for i in range(len(query)):
+        head, tail = re.escape(query[:i]), re.escape(query[i + 1 :])
+        variants.add(f"{head}.{tail}")  # Substitution
+        variants.add(f"{head}{tail}")  # Deletion
+        variants.add(f"{head}.{re.escape(query[i:])}")  # Insertion
+    return re.compile("|".join(sorted(variants, key=len, reverse=True)), re.DOTALL)
+
+
+class TrigramIndex:
+    """
+    Case-insensitive substring and fuzzy lookup over a set of names.
+
+    Each name gets an integer id; every trigram of its case-folded form maps to
+    a posting list of ids. Substring queries verify the ids of the rarest query
+    trigram, fuzzy queries rank ids by shared trigrams before checking edit
+    distance. Removed names are tombstoned and compacted once they dominate.
+
+    Args:
+        names: Initial names to index.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            names: Initial names to index.
+        """
+        self._names: List[Optional[str]] = []
+        self._folded: List[Optional[str]] = []
+        self._ids: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._removed = 0
+        self.rebuild(names)
+
+    def rebuild(self, names: Iterable[str]) -> None:
+        """
+        Replace the indexed names.
+
+        Args:
+            names: The names to index.
+        """
+        self._names = list(dict.fromkeys(names))
+        self._folded = [name.casefold() for name in self._names]
+        self._ids = {name: name_id for name_id, name in enumerate(self._names)}
+        self._removed = 0
+
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for name_id, folded in enumerate(self._folded):
+            for gram in trigrams(folded):
+                postings[gram].append(name_id)
+        self._postings = dict(postings)
+
+    def add(self, name: str) -> bool:
+        """
+        Add a name to the index.
+
+        Args:
+            name: The name to add.
+
+        Returns:
+            bool: True if the name was added, False if it was already indexed.
+        """
+        if name in self._ids:
+            return False
+
+        name_id = len(self._names)
+        folded = name.casefold()
+        self._ids[name] = name_id
+        self._names.append(name)
+        self._folded.append(folded)
+        for gram in trigrams(folded):
+            self._postings.setdefault(gram, []).append(name_id)
+        return True
+
+    def remove(self, name: str) -> bool:
+        """
+        Remove a name from the index.
+
+        Args:
+            name: The name to remove.
+
+        Returns:
+            bool: True if the name was removed, False if it was not indexed.
+        """
+        name_id = self._ids.pop(name, None)
+        if name_id is None:
+            return False
+
+        self._names[name_id] = None
+        self._folded[name_id] = None
+        self._removed += 1
+        if self._removed > len(self._ids):
+            self.rebuild(list(self._ids))
+        return True
+
+    def substring_matches(self, text: str, limit: int = 0) -> List[str]:
+        """
+        Get names containing the text, compared case-insensitively.
+
+        Args:
+            text: The text to look for.
+            limit: Maximum number of names to return, 0 for no limit.
+
+        Returns:
+            List[str]: Matching names in index order.
+        """
+        query = text.casefold()
+        if not query:
+            return []
+
+        query_grams = trigrams(query)
+        if query_grams:
+            # The rarest trigram bounds the candidates; verify each one
+            candidates: Iterable[int] = min(
+                (self._postings.get(gram, []) for gram in query_grams), key=len
+            )
+        else:
+            # Too short for trigrams; matches are plentiful, so scanning stops early
+            candidates = range(len(self._folded))
+
+        matches = []
+        for name_id in candidates:
+            folded = self._folded[name_id]
+            if folded is not None and query in folded:
+                matches.append(self._names[name_id])
+                if len(matches) == limit:
+                    break
+        return matches
+
+    def fuzzy_matches(
+        self, text: str, max_distance: int = 1, limit: int = 0
+    ) -> List[str]:
+        """
+        Get names containing the text with at most ``max_distance`` edits.
+
+        Candidates are drawn from the rarest query trigrams that any match must
+        share, capped at MAX_FUZZY_CANDIDATES, filtered by length and verified
+        in order of shared trigrams until ``limit`` matches are found.
+        Single-edit queries are verified with one compiled pattern, larger
+        bounds with the edit distance recurrence. Queries too short for
+        trigram candidates (see supports_fuzzy) get no matches.
+
+        Args:
+            text: The text to look for.
+            max_distance: Maximum number of inserted, deleted or substituted characters.
+            limit: Maximum number of names to return, 0 for no limit.
+
+        Returns:
+            List[str]: Matching names, closest first.
+        """
+        if not supports_fuzzy(text, max_distance):
+            return []
+        query = text.casefold()
+        query_grams = trigrams(query)
+
+        # Each edit destroys at most N query trigrams, so a match shares at least
+        # `required` of them and therefore one of the rarest len - required + 1
+        required = len(query_grams) - N * max_distance
+
+        postings = sorted(
+            (self._postings.get(gram, []) for gram in query_grams), key=len
+        )
+        shared: Counter = Counter()
+        budget = MAX_FUZZY_CANDIDATES
+        for posting in postings[: len(query_grams) - required + 1]:
+            if budget <= 0:
+                break
+            # Very common trigrams are truncated, trading recall for latency
+            shared.update(posting[:budget])
+            budget -= len(posting)
+
+        if max_distance == 1:
+            pattern = single_edit_pattern(query)
+
+            def distance_to(folded: str) -> Optional[int]:
+                if query in folded:
+                    return 0
+                return 1 if pattern.search(folded) else None
+
+        else:
+
+            def distance_to(folded: str) -> Optional[int]:
+                return substring_distance(query, folded, max_distance)
+
+        # A match holds the query with at most max_distance characters deleted
+        min_length = len(query) - max_distance
+        matches = []
+        for name_id, _ in shared.most_common():
+            folded = self._folded[name_id]
+            if folded is None or len(folded) < min_length:
+                continue
+            distance = distance_to(folded)
+            if distance is not None:
+                matches.append((distance, name_id))
+                if len(matches) == limit:
+                    break
+
+        matches.sort()
+        return [self._names[name_id] for _, name_id in matches]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
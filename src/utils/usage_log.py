@@ -0,0 +1,112 @@
+"""
+This module provides the UsageLog class, a small persisted record of node visits
+and edits used to rank autocompletion candidates.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+
+class UsageLog:
+    """
+    Tracks when nodes were last visited and how often they were edited.
+
+    The log keeps at most ``max_entries`` names, dropping the least recently
+    visited ones, and is written to disk after every change.
+
+    Args:
+        path: The JSON file backing the log.
+        max_entries: Maximum number of names to remember.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 500) -> None:
+        """
+        Initialize the log and load existing entries.
+
+        Args:
+            path: The JSON file backing the log.
+            max_entries: Maximum number of names to remember.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, float]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load entries from disk, starting empty if the file is missing or invalid."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                self._entries = json.load(file).get("entries", {})
+        except FileNotFoundError:
+            self._entries = {}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("usage_log_unreadable", path=str(self.path), error=str(e))
+            self._entries = {}
+
+    def save(self) -> None:
+        """Atomically write entries to disk."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"version": 1, "entries": self._entries}, file)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning("usage_log_save_failed", path=str(self.path), error=str(e))
+
+    def record_visit(self, name: str) -> None:
+        """
+        Record that a node was opened.
+
+        Args:
+            name: The node name.
+        """
+        entry = self._entries.setdefault(name, {"visited": 0.0, "edits": 0})
+        entry["visited"] = time.time()
+        self._trim()
+        self.save()
+
+    def record_edit(self, name: str) -> None:
+        """
+        Record that a node was saved.
+
+        Args:
+            name: The node name.
+        """
+        entry = self._entries.setdefault(name, {"visited": 0.0, "edits": 0})
+        entry["visited"] = time.time()
+        entry["edits"] = entry.get("edits", 0) + 1
+        self._trim()
+        self.save()
+
+    def last_visit(self, name: str) -> Optional[float]:
+        """Get the epoch time of the last visit to a node, if known."""
+        entry = self._entries.get(name)
+        return entry.get("visited") if entry else None
+
+    def edit_count(self, name: str) -> int:
+        """Get the number of recorded edits of a node."""
+        entry = self._entries.get(name)
+        return int(entry.get("edits", 0)) if entry else 0
+
+    def names(self) -> List[str]:
+        """Get all names in the log."""
+        return list(self._entries)
+
+    def _trim(self) -> None:
+        """Drop the least recently visited entries beyond the size limit."""
+        if len(self._entries) <= self.max_entries:
+            return
+        keep = sorted(
+            self._entries.items(),
+            key=lambda item: item[1].get("visited", 0.0),
+            reverse=True,
+        )[: self.max_entries]
+        self._entries = dict(keep)
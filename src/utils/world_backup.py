@@ -0,0 +1,311 @@
+"""
+This module provides the BackupWriter and BackupReader classes, which write and
+read the compact backup format holding a whole world.
+"""
+
+import json
+import os
+import zipfile
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+BACKUP_FORMAT = "neoworldbuilder-backup"
+BACKUP_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+NODES_DIR = "nodes"
+RELATIONSHIPS_DIR = "relationships"
+
+
+def _encode_chunk(chunk: Dict[str, Any]) -> bytes:
+    # Values the application never writes itself, such as temporal or spatial
+    # values added by other tools, are stored as their string form
+    return json.dumps(
+        chunk, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+class _Dictionary:
+    """Codes of the distinct values of a chunk column."""
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def code(self, value: Any) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class BackupWriter:
+    """
+    Streaming writer of a world backup.
+
+    A backup is a ZIP archive of deflate-compressed JSON chunks, each holding
+    the columns of up to ``chunk_size`` nodes or relationships:
+
+    - ``nodes/NNNNNN.json``: ``id``, ``labels`` and ``properties`` columns.
+      Label sets are dictionary coded: ``labels`` holds an index into
+      ``label_sets``.
+    - ``relationships/NNNNNN.json``: ``start``, ``end``, ``type`` and
+      ``properties`` columns, with ``type`` an index into ``types``.
+    - ``manifest.json``: format, version, counts and chunk names.
+
+    Node ids are numbers local to the backup. Only one chunk is held in
+    memory. The archive is written to a ``.part`` file that replaces the
+    target when the writer is closed, so an interrupted backup never
+    overwrites a previous one.
+
+    Args:
+        file_name: Path of the backup file.
+        chunk_size: Rows per chunk.
+    """
+
+    def __init__(self, file_name: str, chunk_size: int) -> None:
+        """
+        Open the backup for writing.
+
+        Args:
+            file_name: Path of the backup file.
+            chunk_size: Rows per chunk.
+        """
+        self.file_name = file_name
+        self.chunk_size = chunk_size
+        self.node_count = 0
+        self.relationship_count = 0
+        self._temp_name = f"{file_name}.part"
+        self._archive = zipfile.ZipFile(
+            self._temp_name, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6
+        )
+        self._node_chunks: List[str] = []
+        self._relationship_chunks: List[str] = []
+        self._nodes = self._new_node_chunk()
+        self._relationships = self._new_relationship_chunk()
+
+    @staticmethod
+    def _new_node_chunk() -> Tuple[_Dictionary, Dict[str, List[Any]]]:
+        return _Dictionary(), {"id": [], "labels": [], "properties": []}
+
+    @staticmethod
+    def _new_relationship_chunk() -> Tuple[_Dictionary, Dict[str, List[Any]]]:
+        return _Dictionary(), {"start": [], "end": [], "type": [], "properties": []}
+
+    def add_node(
+        self, node_id: int, labels: List[str], properties: Dict[str, Any]
+    ) -> None:
+        """
+        Add a node.
+
+        Args:
+            node_id: Id of the node within the backup.
+            labels: The node labels.
+            properties: The node properties.
+        """
+        label_sets, columns = self._nodes
+        columns["id"].append(node_id)
+        columns["labels"].append(label_sets.code(tuple(sorted(labels))))
+        columns["properties"].append(properties)
+        self.node_count += 1
+        if len(columns["id"]) >= self.chunk_size:
+            self._flush_nodes()
+
+    def add_relationship(
+        self, start: int, end: int, rel_type: str, properties: Dict[str, Any]
+    ) -> None:
+        """
+        Add a relationship. All nodes must be added first.
+
+        Args:
+            start: Backup id of the start node.
+            end: Backup id of the end node.
+            rel_type: The relationship type.
+            properties: The relationship properties.
+        """
+        self._flush_nodes()
+        types, columns = self._relationships
+        columns["start"].append(start)
+        columns["end"].append(end)
+        columns["type"].append(types.code(rel_type))
+        columns["properties"].append(properties)
+        self.relationship_count += 1
+        if len(columns["start"]) >= self.chunk_size:
+            self._flush_relationships()
+
+    def _flush_nodes(self) -> None:
+        label_sets, columns = self._nodes
+        if not columns["id"]:
+            return
+        name = f"{NODES_DIR}/{len(self._node_chunks):06d}.json"
+        chunk = {"label_sets": [list(s) for s in label_sets.values], **columns}
+        self._archive.writestr(name, _encode_chunk(chunk))
+        self._node_chunks.append(name)
+        self._nodes = self._new_node_chunk()
+
+    def _flush_relationships(self) -> None:
+        types, columns = self._relationships
+        if not columns["start"]:
+            return
+        name = f"{RELATIONSHIPS_DIR}/{len(self._relationship_chunks):06d}.json"
+        chunk = {"types": types.values, **columns}
+        self._archive.writestr(name, _encode_chunk(chunk))
+        self._relationship_chunks.append(name)
+        self._relationships = self._new_relationship_chunk()
+
+    def close(self) -> None:
+        """Write the remaining chunks and the manifest and publish the backup."""
+        self._flush_nodes()
+        self._flush_relationships()
+        manifest = {
+            "format": BACKUP_FORMAT,
+            "version": BACKUP_VERSION,
+            "created": datetime.now().isoformat(),
+            "nodes": self.node_count,
+            "relationships": self.relationship_count,
+            "node_chunks": self._node_chunks,
+            "relationship_chunks": self._relationship_chunks,
+        }
+        self._archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=1))
+        self._archive.close()
+        os.replace(self._temp_name, self.file_name)
+
+    def abort(self) -> None:
+        """Discard the partial backup."""
+        self._archive.close()
+        if os.path.exists(self._temp_name):
+            os.remove(self._temp_name)
+
+
+class BackupReader:
+    """
+    Reader of a world backup written by BackupWriter.
+
+    Chunks are decompressed one at a time, so memory use does not grow with
+    the size of the world.
+
+    Args:
+        file_name: Path of the backup file.
+
+    Raises:
+        ValueError: If the file is not a backup of a supported version.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """
+        Open a backup and read its manifest.
+
+        Args:
+            file_name: Path of the backup file.
+
+        Raises:
+            ValueError: If the file is not a backup of a supported version.
+        """
+        try:
+            self._archive = zipfile.ZipFile(file_name, "r")
+            self.manifest: Dict[str, Any] = json.loads(
+                self._archive.read(MANIFEST_NAME)
+            )
+        except (zipfile.BadZipFile, KeyError, ValueError) as e:
+            raise ValueError(f"{file_name} is not a world backup: {e}") from e
+        if self.manifest.get("format") != BACKUP_FORMAT:
+            raise ValueError(f"{file_name} is not a world backup")
+        if self.manifest.get("version") != BACKUP_VERSION:
+            raise ValueError(
+                f"Unsupported backup version {self.manifest.get('version')}"
+            )
+
+    def _read_chunk(self, name: str) -> Dict[str, Any]:
+        return json.loads(self._archive.read(name))
+
+    def validate(self) -> None:
+        """
+        Check every chunk listed in the manifest.
+
+        The CRCs of all members are verified and each chunk is parsed and
+        checked against the manifest counts, so a corrupt or truncated backup
+        is rejected before anything is restored from it.
+
+        Raises:
+            ValueError: If a chunk is missing, corrupt or inconsistent.
+        """
+        try:
+            bad_member = self._archive.testzip()
+        except (zipfile.BadZipFile, OSError, EOFError) as e:
+            raise ValueError(f"Backup is corrupt: {e}") from e
+        if bad_member:
+            raise ValueError(f"Backup chunk {bad_member} is corrupt")
+
+        # Columns of each chunk kind and the coded column with its dictionary
+        layouts = {
+            "node_chunks": (("id", "labels", "properties"), "labels", "label_sets"),
+            "relationship_chunks": (
+                ("start", "end", "type", "properties"),
+                "type",
+                "types",
+            ),
+        }
+        counts = {}
+        for key, (names, coded, dictionary) in layouts.items():
+            counts[key] = 0
+            for name in self.manifest.get(key, []):
+                try:
+                    chunk = self._read_chunk(name)
+                    lengths = {len(chunk[column]) for column in names}
+                    size = len(chunk[dictionary])
+                    codes = chunk[coded]
+                except (KeyError, TypeError, ValueError, zipfile.BadZipFile) as e:
+                    raise ValueError(f"Backup chunk {name} is invalid: {e}") from e
+                if len(lengths) != 1 or any(
+                    not isinstance(code, int) or not 0 <= code < size
+                    for code in codes
+                ):
+                    raise ValueError(f"Backup chunk {name} is inconsistent")
+                counts[key] += lengths.pop()
+
+        if (
+            counts["node_chunks"] != self.manifest.get("nodes")
+            or counts["relationship_chunks"] != self.manifest.get("relationships")
+        ):
+            raise ValueError("Backup is truncated: counts do not match the manifest")
+
+    def nodes(self) -> Iterator[Tuple[int, Tuple[str, ...], Dict[str, Any]]]:
+        """
+        Iterate over the nodes.
+
+        Yields:
+            Tuple: The backup id, the sorted labels and the properties of a node.
+        """
+        for name in self.manifest["node_chunks"]:
+            chunk = self._read_chunk(name)
+            label_sets = [tuple(s) for s in chunk["label_sets"]]
+            for node_id, labels, properties in zip(
+                chunk["id"], chunk["labels"], chunk["properties"]
+            ):
+                yield node_id, label_sets[labels], properties
+
+    def relationships(self) -> Iterator[Tuple[int, int, str, Dict[str, Any]]]:
+        """
+        Iterate over the relationships.
+
+        Yields:
+            Tuple: The backup ids of the start and end nodes, the type and the
+            properties of a relationship.
+        """
+        for name in self.manifest["relationship_chunks"]:
+            chunk = self._read_chunk(name)
+            types = chunk["types"]
+            for start, end, rel_type, properties in zip(
+                chunk["start"], chunk["end"], chunk["type"], chunk["properties"]
+            ):
+                yield start, end, types[rel_type], properties
+
+    def close(self) -> None:
+        """Close the backup file."""
+        self._archive.close()
+
+    def __enter__(self) -> "BackupReader":
+        return self
+
+    def __exit__(self, *exc_info: Optional[Any]) -> None:
+        self.close()